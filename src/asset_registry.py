@@ -0,0 +1,123 @@
+"""
+Asset Registry for Retro Space Shooter
+Loads every image and sprite sheet once and hands out shared surfaces
+"""
+import pygame
+from constants import *
+
+# Single images used by spawned objects
+PRELOAD_IMAGES = [
+    "assets/images/fighter1.png",
+    "assets/images/fighter2.png",
+    "assets/images/CrabShip.png",
+    "assets/images/Gunship.png",
+    "assets/images/Pirate_Fighter.png",
+    "assets/images/Projectile01.png",
+    "assets/images/Projectile03.png",
+    "assets/images/HPContainer.png",
+    "assets/images/EnergyContainer.png",
+]
+
+# Sprite sheets laid out as a single row: (path, number of frames)
+PRELOAD_SHEETS = [
+    ("assets/images/Player01-Sheet.png", 5),
+    ("assets/images/Asteroids-Sheet.png", 12),
+    ("assets/images/Debris-Sheet.png", 6),
+    ("assets/images/Bombe-Sheet.png", 5),
+    ("assets/images/Explosion02-Sheet.png", 10),
+]
+
+class AssetRegistry:
+    def __init__(self):
+        """Initialize the asset registry"""
+        self.images = {}  # path -> converted surface
+        self.frames = {}  # (path, frame_count) -> list of frame surfaces
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+
+    def load_image(self, path):
+        """Decode an image from disk (the only place the registry touches the filesystem)"""
+        image = self.images.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert_alpha()
+            self.images[path] = image
+        return image
+
+    def get_image(self, path):
+        """Get a shared surface for an image, loading it on first use"""
+        image = self.images.get(path)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        return self.load_image(path)
+
+    def get_frames(self, path, frame_count):
+        """Get the frames of a single-row sprite sheet, slicing it on first use"""
+        key = (path, frame_count)
+        frames = self.frames.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        self.misses += 1
+        sheet = self.load_image(path)
+
+        # Cut the sheet into equal-width frames
+        sheet_width = sheet.get_width()
+        sheet_height = sheet.get_height()
+        frame_width = sheet_width // frame_count
+
+        frames = []
+        for i in range(frame_count):
+            frame_rect = pygame.Rect(i * frame_width, 0, frame_width, sheet_height)
+            frames.append(sheet.subsurface(frame_rect).copy())
+
+        self.frames[key] = frames
+        return frames
+
+    def get_frame(self, path, frame_count, index):
+        """Get a single frame from a single-row sprite sheet"""
+        return self.get_frames(path, frame_count)[index]
+
+    def preload(self):
+        """Load and slice every known asset (call once the display mode is set)"""
+        for path in PRELOAD_IMAGES:
+            self.load_image(path)
+
+        for path, frame_count in PRELOAD_SHEETS:
+            if (path, frame_count) not in self.frames:
+                self.get_frames(path, frame_count)
+
+        # Preloading is not gameplay traffic - start counting from zero
+        self.reset_stats()
+        print(f"🖼️ Asset registry preloaded {len(self.images)} images, {len(self.frames)} sheets")
+
+    def reset_stats(self):
+        """Reset hit/miss counters"""
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total > 0 else 0.0,
+            'images': len(self.images),
+            'sheets': len(self.frames)
+        }
+
+    def clear(self):
+        """Drop all cached surfaces (e.g. after the display is recreated)"""
+        self.images.clear()
+        self.frames.clear()
+        self.reset_stats()
+
+
+# Process-wide registry shared by all game objects
+assets = AssetRegistry()
@@ -98,7 +98,6 @@ def demo_bomb_system():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
         
         game.update()
         game.draw()
@@ -77,7 +77,6 @@ def demo_bomb_shooting():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                         print(f"🔫 Fired {direction} projectile at frame {frame}")
                 elif event.key == pygame.K_e and game.player.is_alive():
                     # Secondary weapon - shoot at bombs
@@ -87,7 +86,6 @@ def demo_bomb_shooting():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                         print(f"🔫 Fired {direction} secondary projectile at frame {frame}")
         
         game.update()
@@ -4,6 +4,8 @@ Boss Battle System - Final wave enhancement with laser and missile attacks
 """
 import pygame
 import random
+from asset_registry import assets
+from text_cache import text_cache
 from constants import *
 
 class BossLaser:
@@ -80,8 +82,7 @@ class PlayerMissile:
         
         # Load the actual missile sprite
         try:
-            missile_image = pygame.image.load("SpaceShooter/Enemies/Missile.png")
-            self.image = missile_image.convert_alpha()
+            self.image = assets.get_image("SpaceShooter/Enemies/Missile.png")
             # Scale if needed (keep original size for now)
             self.width = self.image.get_width()
             self.height = self.image.get_height()
@@ -278,12 +279,11 @@ class BossBattle:
         pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2)
         
         # Label
-        font = pygame.font.Font(None, 24)
-        label = font.render("BOSS", True, (255, 255, 255))
+        label = text_cache.render("BOSS", 24, (255, 255, 255))
         screen.blit(label, (bar_x, bar_y - 25))
         
         # Health text
-        health_text = font.render(f"{self.boss_health}/{self.max_boss_health}", True, (255, 255, 255))
+        health_text = text_cache.render(f"{self.boss_health}/{self.max_boss_health}", 24, (255, 255, 255))
         text_rect = health_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
         screen.blit(health_text, text_rect)
     
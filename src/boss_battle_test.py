@@ -6,6 +6,7 @@ import pygame
 import sys
 from game import Game
 from boss_battle import BossBattle
+from command_buffer import commands
 from constants import *
 
 def main():
@@ -108,7 +109,6 @@ def main():
                     game.player.facing_direction
                 )
                 game.projectiles.add(projectile)
-                game.all_sprites.add(projectile)
                 game.player.shooting_cooldown = 10  # Set cooldown
         
         # Update shooting cooldown
@@ -122,10 +122,7 @@ def main():
         for enemy in game.enemies:
             actions = enemy.update(game.player.rect)
             if actions:
-                for action in actions:
-                    if hasattr(action, 'rect'):  # It's a projectile
-                        game.enemy_projectiles.add(action)
-                        game.all_sprites.add(action)
+                game.spawn_enemy_actions(actions)
         
         # Update projectiles
         game.projectiles.update()
@@ -171,6 +168,9 @@ def main():
                         game.explosions.add(explosion)
                         game.all_sprites.add(explosion)
         
+        # Apply the kills and spawns deferred during the frame
+        commands.flush()
+        
         # Draw everything - EXACT same as main game
         game.screen.fill((0, 0, 0))
         game.background.draw(game.screen)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Collision Benchmark - Spatial hash broadphase and NumPy batched mode vs brute-force pair tests
+Runs without a window: sprites are plain rects scattered over the screen
+"""
+import random
+import time
+import pygame
+from collision_system import CollisionSystem, np
+from constants import *
+
+# Sprite sizes taken from the real assets
+PROJECTILE_SIZE = (6, 9)
+ENEMY_SIZES = [(32, 32), (48, 48), (64, 64), (47, 44)]
+ASTEROID_SIZE = (64, 64)
+DEBRIS_SIZE = (74, 64)
+BOMB_SIZE = (16, 16)
+
+ENTITY_COUNTS = [10, 100, 1000]
+REPEATS = 20
+
+def make_group(count, sizes):
+    """Create a group of bare sprites with random positions"""
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        sprite = pygame.sprite.Sprite()
+        width, height = random.choice(sizes)
+        x = random.randint(0, SCREEN_WIDTH - width)
+        y = random.randint(0, SCREEN_HEIGHT - height)
+        sprite.rect = pygame.Rect(x, y, width, height)
+        group.add(sprite)
+    return group
+
+def make_scene(entity_count):
+    """Split entities between player projectiles and the four target groups"""
+    projectile_count = entity_count // 2
+    target_count = entity_count - projectile_count
+
+    player = pygame.sprite.Sprite()
+    player.rect = pygame.Rect(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60, 32, 32)
+
+    return {
+        'player': player,
+        'projectiles': make_group(projectile_count, [PROJECTILE_SIZE]),
+        'enemy_projectiles': pygame.sprite.Group(),
+        'enemies': make_group(target_count - 3 * (target_count // 4), ENEMY_SIZES),
+        'asteroids': make_group(target_count // 4, [ASTEROID_SIZE]),
+        'debris': make_group(target_count // 4, [DEBRIS_SIZE]),
+        'bombs': make_group(target_count // 4, [BOMB_SIZE])
+    }
+
+def run_checks(collision_system, scene):
+    """Run the projectile checks that process_all_collisions performs"""
+    collision_system.pair_tests = 0
+    collision_system.begin_broadphase()
+    events = list(collision_system.check_projectile_bomb_collisions(scene['projectiles'], scene['bombs']))
+    events.extend(collision_system.check_projectile_collisions(
+        scene['projectiles'], scene['enemy_projectiles'], scene['enemies'],
+        scene['asteroids'], scene['debris'], scene['player']
+    ))
+    collision_system.end_broadphase()
+    return events
+
+def event_signature(events):
+    """Reduce collision events to comparable (kind, sprite ids) tuples"""
+    return [(event.kind, id(event.a), id(event.b)) for event in events]
+
+def benchmark(scene, mode):
+    """Time the projectile checks for one scene and one collision mode"""
+    collision_system = CollisionSystem()
+    collision_system.set_collision_mode(mode)
+
+    events = run_checks(collision_system, scene)
+    pair_tests = collision_system.pair_tests
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        run_checks(collision_system, scene)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / REPEATS
+
+    return pair_tests, elapsed_ms, event_signature(events)
+
+def main():
+    """Compare brute-force, spatial hash and batched collision checks"""
+    print("💥 COLLISION BROADPHASE BENCHMARK")
+    print(f"Cell size: {SPATIAL_HASH_CELL_SIZE}px | Screen: {SCREEN_WIDTH}x{SCREEN_HEIGHT} | {REPEATS} runs each")
+    print("")
+    print(f"{'Entities':>8} | {'Brute tests':>11} | {'Brute ms':>9} | {'Hash tests':>10} | {'Hash ms':>8} | {'Batch ms':>8} | Same hits")
+    print("-" * 80)
+
+    for entity_count in ENTITY_COUNTS:
+        random.seed(entity_count)
+        scene = make_scene(entity_count)
+        brute_tests, brute_ms, brute_events = benchmark(scene, "brute_force")
+        hash_tests, hash_ms, hash_events = benchmark(scene, "spatial_hash")
+        same = brute_events == hash_events
+
+        # Batched mode needs NumPy
+        if np is not None:
+            _, batch_ms, batch_events = benchmark(scene, "batched")
+            batch_text = f"{batch_ms:>8.3f}"
+            same = same and brute_events == batch_events
+        else:
+            batch_text = f"{'n/a':>8}"
+
+        same_text = "✅" if same else "❌"
+        print(f"{entity_count:>8} | {brute_tests:>11} | {brute_ms:>9.3f} | {hash_tests:>10} | {hash_ms:>8.3f} | {batch_text} | {same_text}")
+
+if __name__ == "__main__":
+    main()
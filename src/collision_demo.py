@@ -75,7 +75,6 @@ def demo_collision_system():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                 elif event.key == pygame.K_e:
                     # Secondary weapon
                     shot_data = game.player.shoot("secondary")
@@ -83,7 +82,6 @@ def demo_collision_system():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
         
         game.update()
         game.draw()
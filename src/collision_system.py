@@ -4,153 +4,296 @@ Handles all collision detection and physics responses with health system
 """
 import pygame
 import math
-from explosion import Explosion
+import itertools
+from explosion import explosion_pool
+from spatial_hash import SpatialHash
+from command_buffer import commands
+from projectile_engine import ProjectileEngine
 from constants import *
 
+# NumPy is optional - only the batched collision mode needs it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COLLISION_MODES = ["brute_force", "spatial_hash", "batched"]
+
+# Collision event kinds - the code is the index into this tuple
+COLLISION_KINDS = (
+    'player_enemy', 'player_asteroid', 'player_debris', 'player_bomb', 'player_powerup',
+    'projectile_bomb', 'projectile_enemy', 'projectile_asteroid', 'projectile_debris', 'enemy_projectile_player'
+)
+(PLAYER_ENEMY, PLAYER_ASTEROID, PLAYER_DEBRIS, PLAYER_BOMB, PLAYER_POWERUP,
+ PROJECTILE_BOMB, PROJECTILE_ENEMY, PROJECTILE_ASTEROID, PROJECTILE_DEBRIS, ENEMY_PROJECTILE_PLAYER) = range(len(COLLISION_KINDS))
+
+# Frame statistics (the old results-dict keys) and the event kinds each one totals
+RESULT_STATS = {
+    'player_collisions': (PLAYER_ENEMY, PLAYER_ASTEROID, PLAYER_DEBRIS, PLAYER_BOMB),
+    'projectile_hits': (PROJECTILE_ENEMY, PROJECTILE_ASTEROID, PROJECTILE_DEBRIS, ENEMY_PROJECTILE_PLAYER),
+    'enemies_destroyed': (PROJECTILE_ENEMY,),
+    'asteroids_destroyed': (PROJECTILE_ASTEROID,),
+    'debris_destroyed': (PROJECTILE_DEBRIS,),
+    'bomb_explosions': (PLAYER_BOMB,),
+    'powerups_collected': (PLAYER_POWERUP,),
+    'bombs_shot': (PROJECTILE_BOMB,)
+}
+
+class CollisionEvent:
+    """One overlapping pair - a is the player or projectile, b is what it touched"""
+    __slots__ = ('kind', 'a', 'b', 'point')
+
+    def __init__(self, kind, a, b):
+        self.kind = kind
+        self.a = a
+        self.b = b
+        self.point = None  # Contact point, worked out on first access
+
+    @property
+    def type(self):
+        """Kind name (e.g. 'projectile_enemy')"""
+        return COLLISION_KINDS[self.kind]
+
+    @property
+    def collision_point(self):
+        """Center of the overlap - most responses never ask, so it is only computed here"""
+        if self.point is None:
+            self.point = CollisionSystem.get_collision_point(self.a.rect, self.b.rect)
+        return self.point
+
+
+class CollisionResults:
+    """Collision totals for one frame - reused every frame, so read it before the next process call"""
+    __slots__ = ('counts', 'explosions', 'powerup_messages')
+
+    def __init__(self):
+        self.counts = [0] * len(COLLISION_KINDS)  # Handled events per kind
+        self.explosions = []        # Explosions to add to the game
+        self.powerup_messages = []  # Power-up collection messages
+
+    def reset(self):
+        """Zero the totals for a new frame"""
+        counts = self.counts
+        for kind in range(len(counts)):
+            counts[kind] = 0
+        self.explosions.clear()
+        self.powerup_messages.clear()
+
+    def record(self, kind, explosions=None):
+        """Count one handled event and keep its explosion(s) - a single one, a list, or None"""
+        self.counts[kind] += 1
+        if explosions:
+            if isinstance(explosions, list):
+                self.explosions.extend(explosions)
+            else:
+                self.explosions.append(explosions)
+
+    def __getitem__(self, stat):
+        kinds = RESULT_STATS.get(stat)
+        if kinds is None:
+            return getattr(self, stat)  # 'explosions' or 'powerup_messages'
+        counts = self.counts
+        return sum(counts[kind] for kind in kinds)
+
+    def items(self):
+        """(stat, value) pairs laid out like the old results dict"""
+        for stat in RESULT_STATS:
+            yield stat, self[stat]
+        yield 'explosions', self.explosions
+        yield 'powerup_messages', self.powerup_messages
+
+
 class CollisionSystem:
     def __init__(self):
         """Initialize the collision detection system"""
-        self.collision_events = []  # Store collision events for processing
+        self.results = CollisionResults()  # Refilled by each process_*_collisions call
+        
+        # Responses by event kind
+        self.environment_handlers = {
+            PLAYER_ENEMY: self.handle_player_enemy_collision,
+            PLAYER_ASTEROID: self.handle_player_asteroid_collision,
+            PLAYER_DEBRIS: self.handle_player_debris_collision
+        }
+        self.projectile_handlers = {
+            PROJECTILE_ENEMY: self.handle_projectile_enemy_collision,
+            PROJECTILE_ASTEROID: self.handle_projectile_asteroid_collision,
+            PROJECTILE_DEBRIS: self.handle_projectile_debris_collision,
+            ENEMY_PROJECTILE_PLAYER: self.handle_enemy_projectile_player_collision
+        }
+        
+        # Broadphase - projectiles only test sprites in neighbouring grid cells
+        self.use_spatial_hash = True
+        self.cell_size = SPATIAL_HASH_CELL_SIZE
+        self.frame_hashes = None  # id(group) -> SpatialHash, built lazily during a frame
+        
+        # Batched mode - whole groups are tested at once with NumPy broadcasting
+        self.use_batched = False
+        
+        # Statistics
+        self.pair_tests = 0  # Rect tests performed (reset by process_all_collisions)
+        self.stale_events = 0  # Events skipped because a participant was already despawned this frame
         
+    # The check_* methods are generators - each event is yielded as soon as it is found,
+    # so its response runs before the rest of the group is tested
     def check_player_environment_collisions(self, player, enemies, asteroids, debris):
         """Check player collisions with environment objects"""
-        collision_events = []
-        
-        # Check player vs enemies
-        for enemy in enemies:
-            if self.check_collision(player.rect, enemy.rect):
-                collision_events.append({
-                    'type': 'player_enemy',
-                    'player': player,
-                    'enemy': enemy,
-                    'collision_point': self.get_collision_point(player.rect, enemy.rect)
-                })
-        
-        # Check player vs asteroids
-        for asteroid in asteroids:
-            if self.check_collision(player.rect, asteroid.rect):
-                collision_events.append({
-                    'type': 'player_asteroid',
-                    'player': player,
-                    'asteroid': asteroid,
-                    'collision_point': self.get_collision_point(player.rect, asteroid.rect)
-                })
-        
-        # Check player vs debris
-        for debris_piece in debris:
-            if self.check_collision(player.rect, debris_piece.rect):
-                collision_events.append({
-                    'type': 'player_debris',
-                    'player': player,
-                    'debris': debris_piece,
-                    'collision_point': self.get_collision_point(player.rect, debris_piece.rect)
-                })
-        
-        return collision_events
+        # Test against where the player started - knockback from an earlier response
+        # must not change which contacts this frame reports
+        rect = player.rect.copy()
+        for kind, targets in ((PLAYER_ENEMY, enemies), (PLAYER_ASTEROID, asteroids), (PLAYER_DEBRIS, debris)):
+            for target in targets:
+                if self.check_collision(rect, target.rect):
+                    yield CollisionEvent(kind, player, target)
     
     def check_player_bomb_collisions(self, player, bombs):
         """Check for collisions between player and bombs"""
-        collision_events = []
-        
-        # Check player vs bombs
         for bomb in bombs:
             if self.check_collision(player.rect, bomb.rect):
-                collision_events.append({
-                    'type': 'player_bomb',
-                    'player': player,
-                    'bomb': bomb,
-                    'collision_point': self.get_collision_point(player.rect, bomb.rect)
-                })
-        
-        return collision_events
+                yield CollisionEvent(PLAYER_BOMB, player, bomb)
     
     def check_player_powerup_collisions(self, player, powerups):
         """Check for collisions between player and power-ups"""
-        collision_events = []
-        
-        # Check player vs power-ups
         for powerup in powerups:
             if self.check_collision(player.rect, powerup.rect):
-                collision_events.append({
-                    'type': 'player_powerup',
-                    'player': player,
-                    'powerup': powerup,
-                    'collision_point': self.get_collision_point(player.rect, powerup.rect)
-                })
-        
-        return collision_events
+                yield CollisionEvent(PLAYER_POWERUP, player, powerup)
     
     def check_projectile_bomb_collisions(self, projectiles, bombs):
         """Check for collisions between projectiles and bombs"""
-        collision_events = []
-        
-        # Check projectiles vs bombs
-        for projectile in projectiles:
-            for bomb in bombs:
-                if self.check_collision(projectile.rect, bomb.rect):
-                    collision_events.append({
-                        'type': 'projectile_bomb',
-                        'projectile': projectile,
-                        'bomb': bomb,
-                        'collision_point': self.get_collision_point(projectile.rect, bomb.rect)
-                    })
-        
-        return collision_events
+        for projectile, bomb in self.collide_groups(projectiles, bombs):
+            yield CollisionEvent(PROJECTILE_BOMB, projectile, bomb)
     
     def check_projectile_collisions(self, projectiles, enemy_projectiles, enemies, asteroids, debris, player):
         """Check projectile collisions with various targets"""
-        collision_events = []
-        
-        # Player projectiles vs enemies
-        for projectile in projectiles:
-            for enemy in enemies:
-                if self.check_collision(projectile.rect, enemy.rect):
-                    collision_events.append({
-                        'type': 'projectile_enemy',
-                        'projectile': projectile,
-                        'enemy': enemy,
-                        'collision_point': self.get_collision_point(projectile.rect, enemy.rect)
-                    })
-        
-        # Player projectiles vs asteroids
-        for projectile in projectiles:
-            for asteroid in asteroids:
-                if self.check_collision(projectile.rect, asteroid.rect):
-                    collision_events.append({
-                        'type': 'projectile_asteroid',
-                        'projectile': projectile,
-                        'asteroid': asteroid,
-                        'collision_point': self.get_collision_point(projectile.rect, asteroid.rect)
-                    })
-        
-        # Player projectiles vs debris
-        for projectile in projectiles:
-            for debris_piece in debris:
-                if self.check_collision(projectile.rect, debris_piece.rect):
-                    collision_events.append({
-                        'type': 'projectile_debris',
-                        'projectile': projectile,
-                        'debris': debris_piece,
-                        'collision_point': self.get_collision_point(projectile.rect, debris_piece.rect)
-                    })
+        # Player projectiles vs enemies, asteroids and debris
+        for kind, targets in ((PROJECTILE_ENEMY, enemies), (PROJECTILE_ASTEROID, asteroids), (PROJECTILE_DEBRIS, debris)):
+            for projectile, target in self.collide_groups(projectiles, targets):
+                yield CollisionEvent(kind, projectile, target)
         
         # Enemy projectiles vs player
-        for enemy_projectile in enemy_projectiles:
-            if self.check_collision(enemy_projectile.rect, player.rect):
-                collision_events.append({
-                    'type': 'enemy_projectile_player',
-                    'projectile': enemy_projectile,
-                    'player': player,
-                    'collision_point': self.get_collision_point(enemy_projectile.rect, player.rect)
-                })
-        
-        return collision_events
+        for enemy_projectile, player in self.collide_groups(enemy_projectiles, [player]):
+            yield CollisionEvent(ENEMY_PROJECTILE_PLAYER, enemy_projectile, player)
     
     def check_collision(self, rect1, rect2):
         """Basic rectangle collision detection"""
+        self.pair_tests += 1
         return rect1.colliderect(rect2)
     
-    def get_collision_point(self, rect1, rect2):
+    def collide_groups(self, sprites, targets):
+        """Yield (sprite, target) for every overlapping pair, in group order"""
+        if isinstance(sprites, ProjectileEngine) and sprites.batched:
+            return self.engine_collide(sprites, targets)
+        if self.use_batched and np is not None:
+            return self.batch_collide(sprites, targets)
+        return self.loop_collide(sprites, targets)
+    
+    def loop_collide(self, sprites, targets):
+        """Plain-loop collide_groups (through the spatial hash when one is active)"""
+        for sprite in sprites:
+            rect = sprite.rect  # Projectile handles build their rect on access
+            for target in self.get_candidates(rect, targets):
+                if self.check_collision(rect, target.rect):
+                    yield sprite, target
+    
+    def pack_rects(self, sprites):
+        """Pack the rects of a sprite group into an (N, 4) array of x, y, w, h"""
+        return np.fromiter(
+            itertools.chain.from_iterable(sprite.rect for sprite in sprites),
+            dtype=np.int32, count=len(sprites) * 4
+        ).reshape(-1, 4)
+    
+    def batch_overlaps(self, rects1, rects2):
+        """Get index pairs (i, j) where rects1[i] overlaps rects2[j], in row-major order"""
+        x1, y1, w1, h1 = (rects1[:, k, None] for k in range(4))
+        x2, y2, w2, h2 = (rects2[None, :, k] for k in range(4))
+        
+        # Same test as Rect.colliderect - empty rects never collide
+        overlap = ((x1 < x2 + w2) & (x2 < x1 + w1) &
+                   (y1 < y2 + h2) & (y2 < y1 + h1) &
+                   (w1 > 0) & (h1 > 0) & (w2 > 0) & (h2 > 0))
+        return np.nonzero(overlap)
+    
+    def batch_collide(self, sprites, targets):
+        """Batched collide_groups - one overlap matrix per pair of groups"""
+        if not sprites or not targets:
+            return iter(())
+        
+        sprite_list = list(sprites)
+        target_list = list(targets)
+        rects1 = self.pack_rects(sprite_list)
+        rects2 = self.pack_rects(target_list)
+        self.pair_tests += len(sprite_list) * len(target_list)
+        
+        index1, index2 = self.batch_overlaps(rects1, rects2)
+        return ((sprite_list[i], target_list[j]) for i, j in zip(index1.tolist(), index2.tolist()))
+    
+    def engine_collide(self, engine, targets):
+        """Batched collide_groups for a dense projectile engine - its rects are already array columns"""
+        if not engine or not targets:
+            return iter(())
+        
+        target_list = list(targets)
+        rects1 = engine.pack_rects()
+        rects2 = self.pack_rects(target_list)
+        self.pair_tests += len(engine) * len(target_list)
+        
+        index1, index2 = self.batch_overlaps(rects1, rects2)
+        handles = engine.sprites()
+        return ((handles[i], target_list[j]) for i, j in zip(index1.tolist(), index2.tolist()))
+    
+    def set_collision_mode(self, mode):
+        """Select brute_force, spatial_hash or batched collision testing at runtime"""
+        if mode == "batched" and np is None:
+            print("⚠️ NumPy not installed - batched collision mode unavailable")
+            return False
+        
+        self.use_batched = mode == "batched"
+        self.use_spatial_hash = mode == "spatial_hash"
+        return True
+    
+    def get_collision_mode(self):
+        """Get the name of the active collision mode"""
+        if self.use_batched and np is not None:
+            return "batched"
+        return "spatial_hash" if self.use_spatial_hash else "brute_force"
+    
+    def cycle_collision_mode(self):
+        """Switch to the next available collision mode"""
+        index = COLLISION_MODES.index(self.get_collision_mode())
+        for step in range(1, len(COLLISION_MODES) + 1):
+            mode = COLLISION_MODES[(index + step) % len(COLLISION_MODES)]
+            if mode != "batched" or np is not None:
+                self.set_collision_mode(mode)
+                return mode
+    
+    def begin_broadphase(self):
+        """Start a frame of broadphase queries (grids are rebuilt once per frame)"""
+        self.frame_hashes = {} if self.use_spatial_hash else None
+    
+    def end_broadphase(self):
+        """Drop this frame's grids so later queries never see stale positions"""
+        self.frame_hashes = None
+    
+    def get_spatial_hash(self, targets):
+        """Get this frame's grid for a sprite group, building it on first query"""
+        key = id(targets)
+        spatial_hash = self.frame_hashes.get(key)
+        if spatial_hash is None:
+            spatial_hash = SpatialHash(self.cell_size)
+            spatial_hash.rebuild(targets)
+            self.frame_hashes[key] = spatial_hash
+        return spatial_hash
+    
+    def get_candidates(self, rect, targets):
+        """Get the targets that could overlap rect (all targets without a broadphase)"""
+        if self.frame_hashes is None or len(targets) < SPATIAL_HASH_MIN_TARGETS:
+            return targets
+        
+        # Responses run between queries, but their kills wait in the command buffer and they
+        # never move projectile targets, so a grid built on first query matches the group all frame
+        return self.get_spatial_hash(targets).query(rect)
+    
+    @staticmethod
+    def get_collision_point(rect1, rect2):
         """Get the center point of collision between two rectangles"""
         # Find the overlapping area
         left = max(rect1.left, rect2.left)
@@ -165,25 +308,10 @@ class CollisionSystem:
     
     def handle_player_environment_collision(self, collision_event):
         """Handle collision between player and environment objects"""
-        collision_type = collision_event['type']
-        player = collision_event['player']
-        explosion = None
-        
-        if collision_type == 'player_enemy':
-            enemy = collision_event['enemy']
-            explosion = self.handle_player_enemy_collision(player, enemy, collision_event['collision_point'])
-            
-        elif collision_type == 'player_asteroid':
-            asteroid = collision_event['asteroid']
-            explosion = self.handle_player_asteroid_collision(player, asteroid, collision_event['collision_point'])
-            
-        elif collision_type == 'player_debris':
-            debris = collision_event['debris']
-            explosion = self.handle_player_debris_collision(player, debris, collision_event['collision_point'])
-        
-        return explosion
+        handler = self.environment_handlers[collision_event.kind]
+        return handler(collision_event.a, collision_event.b)
     
-    def handle_player_bomb_collision(self, player, bomb, collision_point):
+    def handle_player_bomb_collision(self, player, bomb):
         """Handle collision between player and bomb with massive damage and explosion"""
         # Calculate 40% of max health as damage
         max_health = player.health_system.max_health
@@ -193,16 +321,16 @@ class CollisionSystem:
         player_died = player.take_damage(bomb_damage, "bomb explosion")
         
         # Create explosion at bomb location (bombs always explode on contact)
-        bomb_explosion = Explosion(bomb.rect.centerx, bomb.rect.centery, "bomb")
+        bomb_explosion = explosion_pool.acquire(bomb.rect.centerx, bomb.rect.centery, "bomb")
         
         # Remove the bomb (it exploded)
-        bomb.kill()
+        commands.despawn(bomb)
         
         # print(f"💣 BOMB EXPLOSION! Player took {bomb_damage} damage ({bomb_damage/max_health*100:.0f}% of max health)")
         
         # If player died from bomb, create player explosion too
         if player_died:
-            player_explosion = Explosion(player.rect.centerx, player.rect.centery, "player")
+            player_explosion = explosion_pool.acquire(player.rect.centerx, player.rect.centery, "player")
             # print("💥 Player killed by bomb explosion!")
             return [bomb_explosion, player_explosion]  # Return both explosions
         
@@ -214,26 +342,24 @@ class CollisionSystem:
         message = player.collect_powerup(powerup.powerup_type)
         
         # Remove the power-up
-        powerup.kill()
+        commands.despawn(powerup)
         
         # print(f"🎁 Player collected {powerup.powerup_type} power-up: {message}")
         return message
     
     def handle_projectile_bomb_collision(self, projectile, bomb):
         """Handle collision between projectile and bomb - bomb explodes"""
-        from explosion import Explosion
-        
         # Create bomb explosion at bomb location
-        bomb_explosion = Explosion(bomb.rect.centerx, bomb.rect.centery, "bomb")
+        bomb_explosion = explosion_pool.acquire(bomb.rect.centerx, bomb.rect.centery, "bomb")
         
         # Remove both projectile and bomb
-        projectile.kill()
-        bomb.kill()
+        commands.despawn(projectile)
+        commands.despawn(bomb)
         
         # print(f"💥 Projectile hit bomb! Bomb destroyed by player shot at ({bomb.rect.centerx}, {bomb.rect.centery})")
         return bomb_explosion
     
-    def handle_player_enemy_collision(self, player, enemy, collision_point):
+    def handle_player_enemy_collision(self, player, enemy):
         """Handle collision between player and enemy ship"""
         # Player takes damage from collision
         player_died = player.take_damage(20, f"collision with {enemy.enemy_type}")
@@ -261,13 +387,13 @@ class CollisionSystem:
             
             # Return explosion if player died
             if player_died:
-                return Explosion(player.rect.centerx, player.rect.centery, "player")
+                return explosion_pool.acquire(player.rect.centerx, player.rect.centery, "player")
             
             return None  # No explosion if player survived
         
         return None
     
-    def handle_player_asteroid_collision(self, player, asteroid, collision_point):
+    def handle_player_asteroid_collision(self, player, asteroid):
         """Handle collision between player and asteroid with physics response"""
         # Player takes damage from collision
         player_died = player.take_damage(10, "asteroid collision")
@@ -304,13 +430,13 @@ class CollisionSystem:
             
             # Return explosion if player died
             if player_died:
-                return Explosion(player.rect.centerx, player.rect.centery, "player")
+                return explosion_pool.acquire(player.rect.centerx, player.rect.centery, "player")
             
             return None  # No explosion if player survived
         
         return None
     
-    def handle_player_debris_collision(self, player, debris, collision_point):
+    def handle_player_debris_collision(self, player, debris):
         """Handle collision between player and debris with lighter physics response"""
         # Player takes light damage from debris
         player_died = player.take_damage(5, "debris collision")
@@ -345,209 +471,167 @@ class CollisionSystem:
             
             # Return explosion if player died
             if player_died:
-                return Explosion(player.rect.centerx, player.rect.centery, "player")
+                return explosion_pool.acquire(player.rect.centerx, player.rect.centery, "player")
             
             return None  # No explosion if player survived
         
         return None
     
     def handle_projectile_collision(self, collision_event, player=None):
-        """Handle projectile collision events with energy effect support"""
-        collision_type = collision_event['type']
+        """Handle projectile collision events with energy effect support (player is this frame's player)"""
+        handler = self.projectile_handlers[collision_event.kind]
+        return handler(collision_event, player)
+    
+    def handle_projectile_enemy_collision(self, collision_event, player=None):
+        """Handle a player shot hitting an enemy (the player's energy effect can take out its neighbours too)"""
+        projectile, enemy = collision_event.a, collision_event.b
+        
+        # Check for energy effect before destroying enemy
+        energy_destroyed = []
+        if player and player.has_energy_effect():
+            # Apply energy area effect
+            all_enemies = enemy.groups()[0] if enemy.groups() else []
+            explosions_list = []
+            energy_destroyed = player.energy_effect.apply_area_effect(enemy, all_enemies, explosions_list)
+            
+            # Return all explosions from energy effect
+            if energy_destroyed:
+                commands.despawn(projectile)
+                return explosions_list
+        
+        # Normal enemy damage
+        if enemy.take_damage(1):
+            # Enemy destroyed - create explosion
+            explosion = explosion_pool.acquire(enemy.rect.centerx, enemy.rect.centery, "enemy")
+            commands.despawn(enemy)  # Enemy destroyed
+            # print(f"Enemy {enemy.enemy_type} destroyed!")
+            
+            # Remove projectile
+            commands.despawn(projectile)
+            return explosion  # Return explosion to be added to game
         
-        if collision_type == 'projectile_enemy':
-            projectile = collision_event['projectile']
-            enemy = collision_event['enemy']
-            
-            # Check for energy effect before destroying enemy
-            energy_destroyed = []
-            if player and player.has_energy_effect():
-                # Apply energy area effect
-                all_enemies = enemy.groups()[0] if enemy.groups() else []
-                explosions_list = []
-                energy_destroyed = player.energy_effect.apply_area_effect(enemy, all_enemies, explosions_list)
-                
-                # Return all explosions from energy effect
-                if energy_destroyed:
-                    projectile.kill()
-                    return explosions_list
-            
-            # Normal enemy damage
-            if enemy.take_damage(1):
-                # Enemy destroyed - create explosion
-                explosion = Explosion(enemy.rect.centerx, enemy.rect.centery, "enemy")
-                enemy.kill()  # Enemy destroyed
-                # print(f"Enemy {enemy.enemy_type} destroyed!")
-                
-                # Remove projectile
-                projectile.kill()
-                return explosion  # Return explosion to be added to game
-            
-            # Enemy survived - just remove projectile
-            projectile.kill()
-            return None
-            
-        elif collision_type == 'projectile_asteroid':
-            projectile = collision_event['projectile']
-            asteroid = collision_event['asteroid']
-            
-            # Damage asteroid
-            if asteroid.take_damage(1):
-                # Asteroid destroyed - create explosion
-                explosion = Explosion(asteroid.rect.centerx, asteroid.rect.centery, "asteroid")
-                asteroid.kill()  # Asteroid destroyed
-                # print(f"Asteroid destroyed!")
-                
-                # Remove projectile
-                projectile.kill()
-                return explosion  # Return explosion to be added to game
-            
-            # Asteroid survived - just remove projectile
-            projectile.kill()
-            return None
-            
-        elif collision_type == 'projectile_debris':
-            projectile = collision_event['projectile']
-            debris = collision_event['debris']
-            
-            # Debris is always destroyed by projectiles - create small explosion
-            explosion = Explosion(debris.rect.centerx, debris.rect.centery, "debris")
-            debris.kill()
-            projectile.kill()
-            # print("Debris destroyed!")
+        # Enemy survived - just remove projectile
+        commands.despawn(projectile)
+        return None
+    
+    def handle_projectile_asteroid_collision(self, collision_event, player=None):
+        """Handle a player shot hitting an asteroid"""
+        projectile, asteroid = collision_event.a, collision_event.b
+        
+        # Damage asteroid
+        if asteroid.take_damage(1):
+            # Asteroid destroyed - create explosion
+            explosion = explosion_pool.acquire(asteroid.rect.centerx, asteroid.rect.centery, "asteroid")
+            commands.despawn(asteroid)  # Asteroid destroyed
+            # print(f"Asteroid destroyed!")
+            
+            # Remove projectile
+            commands.despawn(projectile)
             return explosion  # Return explosion to be added to game
-            
-        elif collision_type == 'enemy_projectile_player':
-            projectile = collision_event['projectile']
-            player = collision_event['player']
-            
-            # Player takes damage from enemy projectile
-            player_died = player.take_damage(15, "enemy projectile")
-            projectile.kill()
-            
-            # print("Player hit by enemy projectile! Took 15 damage")
-            
-            # Return explosion if player died
-            if player_died:
-                return Explosion(player.rect.centerx, player.rect.centery, "player")
-            
-            return None  # No explosion if player survived
         
+        # Asteroid survived - just remove projectile
+        commands.despawn(projectile)
         return None
     
+    def handle_projectile_debris_collision(self, collision_event, player=None):
+        """Handle a player shot hitting debris"""
+        projectile, debris = collision_event.a, collision_event.b
+        
+        # Debris is always destroyed by projectiles - create small explosion
+        explosion = explosion_pool.acquire(debris.rect.centerx, debris.rect.centery, "debris")
+        commands.despawn(debris)
+        commands.despawn(projectile)
+        # print("Debris destroyed!")
+        return explosion  # Return explosion to be added to game
+    
+    def handle_enemy_projectile_player_collision(self, collision_event, player=None):
+        """Handle an enemy laser hitting the player"""
+        projectile = collision_event.a
+        player = collision_event.b  # The player the laser hit (callers may not pass one)
+        
+        # Player takes damage from enemy projectile
+        player_died = player.take_damage(15, "enemy projectile")
+        commands.despawn(projectile)
+        
+        # print("Player hit by enemy projectile! Took 15 damage")
+        
+        # Return explosion if player died
+        if player_died:
+            return explosion_pool.acquire(player.rect.centerx, player.rect.centery, "player")
+        
+        return None  # No explosion if player survived
+    
+    def is_stale(self, collision_event):
+        """Check if an event involves a sprite an earlier response already despawned this frame"""
+        if commands.is_despawning(collision_event.a) or commands.is_despawning(collision_event.b):
+            self.stale_events += 1
+            return True
+        return False
+    
     def process_safe_collisions(self, player, powerups=None):
         """Process only safe collisions (power-ups) - no damage to player"""
-        collision_results = {
-            'player_collisions': 0,
-            'projectile_hits': 0,
-            'enemies_destroyed': 0,
-            'explosions': [],
-            'powerup_messages': [],
-            'powerups_collected': 0,
-            'bombs_shot': 0
-        }
+        collision_results = self.results
+        collision_results.reset()
         
         # Only process power-up collections (safe)
         if powerups:
             for powerup in powerups:
-                if self.check_collision(player.rect, powerup.rect):
+                if self.check_collision(player.rect, powerup.rect) and not commands.is_despawning(powerup):
                     # Player collected power-up
                     result = player.collect_powerup(powerup.powerup_type)
                     if result:
-                        collision_results['powerup_messages'].append(result)
-                        collision_results['powerups_collected'] += 1
-                        powerup.kill()  # Remove power-up
+                        collision_results.powerup_messages.append(result)
+                        collision_results.record(PLAYER_POWERUP)
+                        commands.despawn(powerup)  # Remove power-up
         
         return collision_results
     
     def process_all_collisions(self, player, enemies, asteroids, debris, projectiles, enemy_projectiles, bombs=None, powerups=None):
         """Process all collision detection and responses"""
-        collision_results = {
-            'player_collisions': 0,
-            'projectile_hits': 0,
-            'enemies_destroyed': 0,
-            'asteroids_destroyed': 0,
-            'debris_destroyed': 0,
-            'bomb_explosions': 0,
-            'powerups_collected': 0,
-            'bombs_shot': 0,  # New stat for bombs destroyed by projectiles
-            'explosions': [],  # List of explosions to add to game
-            'powerup_messages': []  # List of power-up collection messages
-        }
+        collision_results = self.results
+        collision_results.reset()
+        
+        # Grids are built on first query so they see positions after earlier responses.
+        # Kills are deferred to the command buffer, so despawned sprites are still in their groups
+        # until the end of the frame - is_stale skips events that involve them.
+        self.pair_tests = 0
+        self.begin_broadphase()
         
         # Check player vs environment collisions
-        env_collisions = self.check_player_environment_collisions(player, enemies, asteroids, debris)
-        for collision in env_collisions:
-            explosion = self.handle_player_environment_collision(collision)
-            if explosion:
-                collision_results['explosions'].append(explosion)
-            
+        for collision in self.check_player_environment_collisions(player, enemies, asteroids, debris):
             # Always count as a collision regardless of explosion
-            collision_results['player_collisions'] += 1
+            collision_results.record(collision.kind, self.handle_player_environment_collision(collision))
         
         # Check player vs bomb collisions
         if bombs:
-            bomb_collisions = self.check_player_bomb_collisions(player, bombs)
-            for collision in bomb_collisions:
-                explosions = self.handle_player_bomb_collision(
-                    collision['player'], 
-                    collision['bomb'], 
-                    collision['collision_point']
-                )
-                
-                # Add all explosions (bomb explosion + possible player explosion)
-                if explosions:
-                    for explosion in explosions:
-                        collision_results['explosions'].append(explosion)
-                
-                collision_results['bomb_explosions'] += 1
-                collision_results['player_collisions'] += 1
+            for collision in self.check_player_bomb_collisions(player, bombs):
+                if self.is_stale(collision):
+                    continue
+                # Bomb explosion plus the player's if the blast was fatal
+                collision_results.record(PLAYER_BOMB, self.handle_player_bomb_collision(collision.a, collision.b))
         
         # Check player vs power-up collisions
         if powerups:
-            powerup_collisions = self.check_player_powerup_collisions(player, powerups)
-            for collision in powerup_collisions:
-                message = self.handle_player_powerup_collision(
-                    collision['player'], 
-                    collision['powerup']
-                )
-                
-                collision_results['powerups_collected'] += 1
-                collision_results['powerup_messages'].append(message)
+            for collision in self.check_player_powerup_collisions(player, powerups):
+                if self.is_stale(collision):
+                    continue
+                message = self.handle_player_powerup_collision(collision.a, collision.b)
+                collision_results.record(PLAYER_POWERUP)
+                collision_results.powerup_messages.append(message)
         
         # Check projectile vs bomb collisions
         if bombs:
-            projectile_bomb_collisions = self.check_projectile_bomb_collisions(projectiles, bombs)
-            for collision in projectile_bomb_collisions:
-                explosion = self.handle_projectile_bomb_collision(
-                    collision['projectile'], 
-                    collision['bomb']
-                )
-                
-                collision_results['bombs_shot'] += 1
-                collision_results['explosions'].append(explosion)
+            for collision in self.check_projectile_bomb_collisions(projectiles, bombs):
+                if self.is_stale(collision):
+                    continue  # Shot or bomb already used up by an earlier hit
+                collision_results.record(PROJECTILE_BOMB, self.handle_projectile_bomb_collision(collision.a, collision.b))
         
         # Check projectile collisions
-        proj_collisions = self.check_projectile_collisions(projectiles, enemy_projectiles, enemies, asteroids, debris, player)
-        for collision in proj_collisions:
-            explosion = self.handle_projectile_collision(collision, player)
-            if explosion:
-                if isinstance(explosion, list):
-                    # Multiple explosions from energy effect
-                    collision_results['explosions'].extend(explosion)
-                else:
-                    # Single explosion
-                    collision_results['explosions'].append(explosion)
-            
-            # Always count as a hit regardless of explosion
-            collision_results['projectile_hits'] += 1
-            
-            # Count specific destruction types
-            if collision['type'] == 'projectile_enemy':
-                collision_results['enemies_destroyed'] += 1
-            elif collision['type'] == 'projectile_asteroid':
-                collision_results['asteroids_destroyed'] += 1
-            elif collision['type'] == 'projectile_debris':
-                collision_results['debris_destroyed'] += 1
+        for collision in self.check_projectile_collisions(projectiles, enemy_projectiles, enemies, asteroids, debris, player):
+            if self.is_stale(collision):
+                continue  # Shot already spent, or target already destroyed (e.g. by an energy blast)
+            # Always count as a hit regardless of explosion (one explosion, or several from an energy effect)
+            collision_results.record(collision.kind, self.handle_projectile_collision(collision, player))
         
+        self.end_broadphase()
         return collision_results
@@ -0,0 +1,71 @@
+"""
+Command Buffer for Retro Space Shooter
+Records spawns and despawns requested during a frame and applies them in one batch at the end of the update,
+so systems never mutate groups they (or later systems) are still iterating or holding events for
+"""
+
+class CommandBuffer:
+    def __init__(self):
+        """Initialize an empty buffer"""
+        self.spawns = []    # (group, sprite) in request order
+        self.despawns = {}  # sprite -> None, in request order (a dict so repeat requests collapse)
+
+        # Statistics
+        self.flushes = 0
+        self.spawned = 0
+        self.despawned = 0
+        self.repeat_despawns = 0  # Despawns requested again for an already doomed sprite
+
+    def spawn(self, group, sprite):
+        """Add a sprite to a group at the next flush"""
+        self.spawns.append((group, sprite))
+
+    def despawn(self, sprite):
+        """Kill a sprite at the next flush - returns False if it was already going"""
+        if sprite in self.despawns:
+            self.repeat_despawns += 1
+            return False
+        self.despawns[sprite] = None
+        return True
+
+    def is_despawning(self, sprite):
+        """Check if a sprite is doomed this frame (events involving it are stale)"""
+        return sprite in self.despawns
+
+    def flush(self):
+        """Apply every pending despawn, then every pending spawn, in request order"""
+        despawns = self.despawns
+        spawns = self.spawns
+        if despawns:
+            self.despawns = {}
+            for sprite in despawns:
+                sprite.kill()
+            self.despawned += len(despawns)
+        if spawns:
+            self.spawns = []
+            for group, sprite in spawns:
+                group.add(sprite)
+            self.spawned += len(spawns)
+        self.flushes += 1
+
+    def clear(self):
+        """Drop pending commands without applying them (e.g. on restart)"""
+        # Never-spawned sprites were already taken from their pools - killing them sends them back
+        for group, sprite in self.spawns:
+            sprite.kill()
+        self.spawns = []
+        self.despawns = {}
+
+    def get_stats(self):
+        """Get buffer statistics"""
+        return {
+            'flushes': self.flushes,
+            'spawned': self.spawned,
+            'despawned': self.despawned,
+            'repeat_despawns': self.repeat_despawns,
+            'pending': len(self.spawns) + len(self.despawns)
+        }
+
+
+# Frame-wide command buffer, flushed by Game at the end of each update
+commands = CommandBuffer()
@@ -64,7 +64,7 @@ def test_complete_flow():
                     print(f"🌊 WAVE {wave_info['wave_number']} INTRO")
                     flow_events.append(f"Frame {frame_count}: Wave {wave_info['wave_number']} intro")
                 elif wave_info.get('wave_active', False):
-                    time_left = wave_info.get('time_remaining', 0)
+                    time_left = game.wave_manager.get_time_remaining()
                     enemies_count = len(game.enemies)
                     print(f"⚔️ WAVE {wave_info['wave_number']} ACTIVE - {time_left:.1f}s left, {enemies_count} enemies")
                     if frame_count % 300 == 0:  # Only log every 5 seconds
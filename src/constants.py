@@ -7,6 +7,12 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Fixed-timestep loop (per-frame speeds, lifetimes and timers are tuned for 60 sim steps a second)
+SIM_RATE = FPS                    # Simulation steps per second
+RENDER_FPS = 120                  # Render frame cap (e.g. 144, or 0 for uncapped)
+MAX_CATCH_UP_STEPS = 5            # Most sim steps run for one rendered frame before time is dropped
+MAX_INTERPOLATION_DISTANCE = 64   # Larger moves in one step are teleports (respawns, pooled reuse) and are not blended
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -42,6 +48,38 @@ COLLISION_SEPARATION_FORCE = 5        # Pixels to separate on enemy collision
 MAX_KNOCKBACK_FORCE = 10              # Maximum knockback force
 MAX_DEBRIS_KNOCKBACK = 7              # Maximum knockback for debris
 
+# Rotation cache settings (spinning asteroids, debris and bombs)
+ROTATION_ANGLE_STEP = 3               # Degrees between cached rotation frames
+ROTATION_CACHE_SIZE = 4096            # Maximum rotated frames kept in memory
+TEXT_CACHE_SIZE = 512                 # Maximum rendered text surfaces kept in memory
+
+# HUD refresh rates (widgets re-render at most this often, in Hz)
+HUD_FPS_REFRESH_HZ = 4
+HUD_WAVE_TIMER_REFRESH_HZ = 10
+HUD_STATS_REFRESH_HZ = 4
+HUD_PROFILER_REFRESH_HZ = 4
+
+# Frame profiler
+PROFILER_HISTORY = 240                # Frames kept for rolling averages, worst values and the graph
+
+# Spatial hash broadphase settings
+SPATIAL_HASH_CELL_SIZE = 64           # Grid cell size in pixels (largest sprites are ~64px)
+SPATIAL_HASH_MIN_TARGETS = 8          # Smaller groups are cheaper to test brute-force
+
+# Enemy perception pass
+PERCEPTION_BATCH_MIN_ENEMIES = 1024   # Packing arrays costs more than the math saves below this (plain loop measured faster at 512)
+AI_LOD_FAR_INTERVAL = 4               # Frames between thinks for off-screen or out-of-range enemies
+AI_LOD_MARGIN = 64                    # Pixels beyond detection radius before an enemy counts as far
+AI_RETARGET_INTERVAL = 30             # Frames a positioning enemy keeps its target before picking a new one
+
+# Projectile engines (player shots and enemy lasers)
+PROJECTILE_ENGINE_CAPACITY = 256      # Initial array size per engine (columns double when full)
+PROJECTILE_BATCH_MIN_SHOTS = 32       # Live shots before an engine moves its columns to NumPy arrays (measured crossover ~20-40)
+
+# Object pool sizing (pools are pre-sized at the start of each wave)
+POOL_BOMBS_PER_ENEMY = 2              # Live bombs per on-screen enemy (bomb waves only)
+POOL_EXTRA_EXPLOSIONS = 8             # Explosions on top of one per enemy (screen clear)
+
 # Asset paths
 ASSETS_DIR = "../assets"
 IMAGES_DIR = f"{ASSETS_DIR}/images"
@@ -63,7 +63,6 @@ def demo_continuous_waves():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                 elif event.key == pygame.K_e and game.player.is_alive():
                     # Secondary weapon
                     shot_data = game.player.shoot("secondary")
@@ -72,7 +71,6 @@ def demo_continuous_waves():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
         
         game.update()
         game.draw()
@@ -88,7 +86,7 @@ def demo_continuous_waves():
                 
                 print(f"\nFrame {frame_count}:")
                 print(f"  Wave: {wave_info['wave_number']}/10 - {wave_info['description']}")
-                print(f"  Time: {wave_info['time_remaining']:.1f}s remaining")
+                print(f"  Time: {game.wave_manager.get_time_remaining():.1f}s remaining")
                 print(f"  Enemies: {enemies_on_screen} on screen | {wave_info['enemies_spawned']} spawned | {wave_info['enemies_destroyed']} destroyed")
                 print(f"  Spawn Rate: {wave_info['spawn_rate']}")
                 print(f"  Status: {'Active' if wave_info['wave_active'] else 'Complete' if wave_info['wave_complete'] else 'Waiting'}")
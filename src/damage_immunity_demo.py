@@ -83,7 +83,6 @@ def demo_damage_immunity():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                 elif event.key == pygame.K_e and game.player.is_alive():
                     # Secondary weapon
                     shot_data = game.player.shoot("secondary")
@@ -92,7 +91,6 @@ def demo_damage_immunity():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
         
         game.update()
         game.draw()
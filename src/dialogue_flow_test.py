@@ -83,7 +83,7 @@ def test_dialogue_flow():
                     print(f"🌊 WAVE {wave_info['wave_number']} INTRO")
                     print("🔒 Player movement locked - Press SPACE to start")
                 elif wave_info.get('wave_active', False):
-                    time_left = wave_info.get('time_remaining', 0)
+                    time_left = game.wave_manager.get_time_remaining()
                     print(f"⚔️ WAVE {wave_info['wave_number']} ACTIVE - {time_left:.1f}s remaining")
                     print("🏃 Player can move and fight")
                 elif wave_info.get('wave_complete', False):
@@ -4,6 +4,7 @@ Dialogue System for Space Shooter
 Handles story dialogue with professional presentation
 """
 import pygame
+from text_cache import fonts, text_cache
 from constants import *
 
 class DialogueSystem:
@@ -19,9 +20,13 @@ class DialogueSystem:
         self.auto_advance_delay = 180  # 3 seconds at 60 FPS
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 28)
-        self.font_medium = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 20)
+        self.font_large = fonts.get(28)
+        self.font_medium = fonts.get(24)
+        self.font_small = fonts.get(20)
+        
+        # Composed dialogue box, rebuilt only when the shown line changes
+        self.box_surface = None
+        self.box_key = None
         
         # Dialogue box dimensions
         self.box_height = 120
@@ -182,6 +187,17 @@ class DialogueSystem:
         box_rect = pygame.Rect(self.box_margin, box_y, 
                               SCREEN_WIDTH - (self.box_margin * 2), self.box_height)
         
+        # Reuse the composed box while the same line is showing
+        box_key = (id(self.current_dialogue), self.current_line_index, self.dialogue_complete)
+        if box_key != self.box_key:
+            self.box_surface = self.build_box(box_rect)
+            self.box_key = box_key
+        
+        # Draw dialogue box to screen
+        screen.blit(self.box_surface, box_rect)
+    
+    def build_box(self, box_rect):
+        """Compose the dialogue box surface for the current line"""
         # Create dialogue box surface with transparency
         dialogue_surface = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
         dialogue_surface.fill(self.box_color)
@@ -198,39 +214,20 @@ class DialogueSystem:
             
             # Speaker name
             speaker_color = self.character_colors.get(speaker, self.speaker_color)
-            speaker_surface = self.font_medium.render(f"{speaker.upper()}:", True, speaker_color)
+            speaker_surface = text_cache.render(f"{speaker.upper()}:", 24, speaker_color)
             dialogue_surface.blit(speaker_surface, (self.text_margin, self.text_margin))
             
             # Dialogue text (word wrap)
             text_y = self.text_margin + 30
             max_width = box_rect.width - (self.text_margin * 2)
             
-            # Simple word wrapping
-            words = text.split(' ')
-            lines = []
-            current_line_text = ""
-            
-            for word in words:
-                test_line = current_line_text + word + " "
-                test_surface = self.font_small.render(test_line, True, self.text_color)
-                
-                if test_surface.get_width() <= max_width:
-                    current_line_text = test_line
-                else:
-                    if current_line_text:
-                        lines.append(current_line_text.strip())
-                        current_line_text = word + " "
-                    else:
-                        lines.append(word)
-                        current_line_text = ""
-            
-            if current_line_text:
-                lines.append(current_line_text.strip())
+            # Simple word wrapping (layout is cached per line and width)
+            lines = text_cache.wrap(text, max_width, 20)
             
             # Draw text lines
             for i, line in enumerate(lines):
                 if text_y + (i * 22) < box_rect.height - 30:  # Don't overflow box
-                    text_surface = self.font_small.render(line, True, self.text_color)
+                    text_surface = text_cache.render(line, 20, self.text_color)
                     dialogue_surface.blit(text_surface, (self.text_margin, text_y + (i * 22)))
         
         # Draw continue/close instruction
@@ -239,13 +236,12 @@ class DialogueSystem:
         else:
             instruction = "Press SPACE to continue • ESC to skip"
         
-        instruction_surface = self.font_small.render(instruction, True, self.continue_color)
+        instruction_surface = text_cache.render(instruction, 20, self.continue_color)
         instruction_rect = instruction_surface.get_rect()
         instruction_rect.bottomright = (box_rect.width - self.text_margin, box_rect.height - self.text_margin)
         dialogue_surface.blit(instruction_surface, instruction_rect)
         
-        # Draw dialogue box to screen
-        screen.blit(dialogue_surface, box_rect)
+        return dialogue_surface
     
     def is_active(self):
         """Check if dialogue is currently active"""
@@ -81,7 +81,7 @@ def test_dialogue_to_wave_transition():
                 if wave_info.get('wave_intro_active', False):
                     print(f"🌊 WAVE {wave_info['wave_number']} INTRO")
                 elif wave_info.get('wave_active', False):
-                    time_left = wave_info.get('time_remaining', 0)
+                    time_left = game.wave_manager.get_time_remaining()
                     print(f"⚔️ WAVE {wave_info['wave_number']} ACTIVE - {time_left:.1f}s remaining")
                 elif wave_info.get('wave_complete', False):
                     print(f"✅ WAVE {wave_info['wave_number']} COMPLETE")
@@ -28,7 +28,6 @@ def demo_directional_shooting():
     up_primary = Projectile(350, 300, "primary", "up")
     up_secondary = Projectile(400, 300, "secondary", "up")
     game.projectiles.add(up_primary, up_secondary)
-    game.all_sprites.add(up_primary, up_secondary)
     
     # Update and draw
     game.update()
@@ -52,7 +51,6 @@ def demo_directional_shooting():
     down_primary = Projectile(350, 300, "primary", "down")
     down_secondary = Projectile(400, 300, "secondary", "down")
     game.projectiles.add(down_primary, down_secondary)
-    game.all_sprites.add(down_primary, down_secondary)
     
     # Update and draw
     game.update()
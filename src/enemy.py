@@ -4,37 +4,68 @@ Enemy system with AI and Health for Retro Space Shooter
 import pygame
 import random
 import math
-from health_system import EnemyHealth
+import itertools
+from asset_registry import assets
+from rotation_cache import rotation_cache
+from enemy_archetype import enemy_archetypes
+from enemy_perception import get_ai_state
+from enemy_movement import steer_enemy
+from kinematics import Body
 from constants import *
 
+# Slots stagger reduced-rate thinking and retargeting across enemies
+think_slots = itertools.count()
+
+class ArchetypeStat:
+    """Read a per-type enemy stat from the enemy's shared archetype"""
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj.archetype, self.name)
+
+
 class Enemy(pygame.sprite.Sprite):
+    # Per-type stats live on the shared archetype (assigning one on an enemy overrides it for that enemy)
+    base_speed = ArchetypeStat()
+    movement_pattern = ArchetypeStat()
+    health = ArchetypeStat()
+    score_value = ArchetypeStat()
+    shot_cooldown = ArchetypeStat()
+    can_drop_bombs = ArchetypeStat()
+    bomb_drop_chance = ArchetypeStat()
+    detection_radius = ArchetypeStat()
+    attack_radius = ArchetypeStat()
+    original_image = ArchetypeStat()
+    
     def __init__(self, enemy_type, x, y, direction="down"):
         """Initialize an enemy with AI"""
         super().__init__()
         
         self.enemy_type = enemy_type
-        self.direction = direction  # "up", "down"
-        self.health = 1
-        self.score_value = 10
-        
-        # Load enemy sprite based on type
-        self.load_enemy_sprite()
+        self.direction = direction  # "up", "down", "left", "right"
         
-        # Rotate sprite based on direction
-        self.apply_direction_rotation()
+        # Stats and pre-rotated sprites are shared by every enemy of this type
+        self.archetype = enemy_archetypes.get(enemy_type)
+        self.image = self.archetype.get_image(direction)
+        self.motion = self.archetype.get_motion(direction)  # Precomputed step and weave vectors
         
-        # Set position
+        # Set position (the game's kinematics pass moves the rect by this frame's steering velocity)
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
+        self.body = Body(self.rect)
         
-        # Set movement properties based on enemy type
-        self.set_movement_properties()
-        
-        # AI properties - Different detection ranges for different ship types
-        self.set_ai_properties()
+        # AI state
         self.ai_state = "patrol"     # "patrol", "pursue", "attack", "position"
-        self.target_x = None
+        self.perceived = False       # ai_state already decided this frame by EnemyPerception
+        self.far = False             # Off-screen or well out of range (EnemyPerception thinks less often)
+        self.resting = False         # Far enemy sitting out this frame's behaviour (keeps its state and velocity)
+        self.think_slot = next(think_slots)
+        self.steered = False         # Patrol velocity already set this frame by EnemyMovement
+        self.target_x = None         # Position target, kept between retargets so positioning doesn't jitter
         self.target_y = None
         self.last_shot_time = 0
         
@@ -45,136 +76,27 @@ class Enemy(pygame.sprite.Sprite):
         # Positioning behavior
         self.preferred_distance = 100  # Preferred distance from player
         
-        # Initialize health system after setting movement properties
-        # (health value is set in set_movement_properties)
-        self.health_system = None  # Will be created after movement properties are set
-        
-    def set_ai_properties(self):
-        """Set AI detection ranges based on enemy type"""
-        if self.enemy_type == "fighter1":
-            # Fast, agile fighter - medium detection range
-            self.detection_radius = 200  # Was 150, now 200
-            self.attack_radius = 150     # Was 120, now 150
-            
-        elif self.enemy_type == "fighter2":
-            # Tactical fighter - good detection range
-            self.detection_radius = 220  # Was 150, now 220
-            self.attack_radius = 160     # Was 120, now 160
-            
-        elif self.enemy_type == "crabship":
-            # Defensive ship - shorter detection but wide attack
-            self.detection_radius = 180  # Was 150, now 180
-            self.attack_radius = 140     # Was 120, now 140
-            
-        elif self.enemy_type == "gunship":
-            # Artillery ship - longest detection and attack range
-            self.detection_radius = 280  # Was 150, now 280 (longest range)
-            self.attack_radius = 220     # Was 180, now 220 (longest attack)
-            
-        elif self.enemy_type == "pirate":
-            # Chaotic ship - very good detection for unpredictable attacks
-            self.detection_radius = 250  # Was 150, now 250
-            self.attack_radius = 180     # Was 120, now 180
-        
-    def load_enemy_sprite(self):
-        """Load the appropriate sprite for this enemy type"""
-        enemy_sprites = {
-            "fighter1": "assets/images/fighter1.png",
-            "fighter2": "assets/images/fighter2.png", 
-            "crabship": "assets/images/CrabShip.png",
-            "gunship": "assets/images/Gunship.png",
-            "pirate": "assets/images/Pirate_Fighter.png"
-        }
-        
-        sprite_path = enemy_sprites.get(self.enemy_type, enemy_sprites["fighter1"])
-        self.original_image = pygame.image.load(sprite_path).convert_alpha()
-        
-    def apply_direction_rotation(self):
-        """Rotate sprite to face movement direction"""
-        if self.direction == "down":
-            # Default orientation (facing down)
-            self.image = self.original_image
-        elif self.direction == "up":
-            # Rotate 180 degrees to face up
-            self.image = pygame.transform.rotate(self.original_image, 180)
-        elif self.direction == "left":
-            # Rotate 90 degrees to face left
-            self.image = pygame.transform.rotate(self.original_image, 90)
-        elif self.direction == "right":
-            # Rotate -90 degrees to face right
-            self.image = pygame.transform.rotate(self.original_image, -90)
-        else:
-            # Fallback for any other direction
-            self.image = self.original_image
-        
-    def set_movement_properties(self):
-        """Set movement properties based on enemy type"""
-        if self.enemy_type == "fighter1":
-            # Fast, agile fighter - aggressive AI (slowed down)
-            self.base_speed = 2  # Was 3, now 2
-            self.movement_pattern = "aggressive"
-            self.health = 1
-            self.score_value = 10
-            self.shot_cooldown = 45
-            self.can_drop_bombs = False
-            
-        elif self.enemy_type == "fighter2":
-            # Medium speed with weaving - tactical AI (slowed down)
-            self.base_speed = 1.5  # Was 2, now 1.5
-            self.movement_pattern = "tactical"
-            self.health = 1
-            self.score_value = 15
-            self.shot_cooldown = 60
-            self.can_drop_bombs = False
-            
-        elif self.enemy_type == "crabship":
-            # Slow but tough - defensive AI with bombs (slowed down)
-            self.base_speed = 0.8  # Was 1, now 0.8
-            self.movement_pattern = "defensive"
-            self.health = 2
-            self.score_value = 25
-            self.shot_cooldown = 90
-            self.can_drop_bombs = True
-            self.bomb_drop_chance = 0.02  # 2% chance per frame when in range
-            
-        elif self.enemy_type == "gunship":
-            # Heavy, slow, tough - artillery AI (slowed down)
-            self.base_speed = 0.7  # Was 1, now 0.7
-            self.movement_pattern = "artillery"
-            self.health = 3
-            self.score_value = 30
-            self.shot_cooldown = 40  # Fast shooting
-            self.can_drop_bombs = False
-            
-        elif self.enemy_type == "pirate":
-            # Fast and unpredictable - chaotic AI with bombs (slowed down)
-            self.base_speed = 1.2  # Was 2, now 1.2
-            self.movement_pattern = "chaotic"
-            self.health = 2
-            self.score_value = 20
-            self.shot_cooldown = 75
-            self.can_drop_bombs = True
-            self.bomb_drop_chance = 0.015  # 1.5% chance per frame
-        
-        # Set AI properties after movement properties
-        self.set_ai_properties()
-        
-        # Create health system with the health value set above
-        self.health_system = EnemyHealth(self, self.health)
+        # Enemies track damage in health (seeded from the archetype) - the old constructor reset
+        # the EnemyHealth it had just built to None, so no enemy ever had one
+        self.health_system = None
         
     def distance_to_player(self, player_rect):
         """Calculate distance to player"""
+        return math.sqrt(self.distance_sq_to_player(player_rect))
+    
+    def distance_sq_to_player(self, player_rect):
+        """Calculate squared distance to player (no sqrt, compare against squared radii)"""
         dx = player_rect.centerx - self.rect.centerx
         dy = player_rect.centery - self.rect.centery
-        return math.sqrt(dx*dx + dy*dy)
+        return dx*dx + dy*dy
     
     def can_see_player(self, player_rect):
         """Check if player is within detection radius"""
-        return self.distance_to_player(player_rect) <= self.detection_radius
+        return self.distance_sq_to_player(player_rect) <= self.detection_radius * self.detection_radius
     
     def can_attack_player(self, player_rect):
         """Check if player is within attack radius"""
-        return self.distance_to_player(player_rect) <= self.attack_radius
+        return self.distance_sq_to_player(player_rect) <= self.attack_radius * self.attack_radius
     
     def get_position_target(self, player_rect):
         """Calculate where enemy should position to attack player vertically"""
@@ -200,15 +122,23 @@ class Enemy(pygame.sprite.Sprite):
     def update_ai(self, player_rect):
         """Update AI behavior based on player position"""
         self.ai_timer += 1
-        distance = self.distance_to_player(player_rect)
         
-        # State machine for AI behavior
-        if not self.can_see_player(player_rect):
-            self.ai_state = "patrol"
-        elif self.can_attack_player(player_rect):
-            self.ai_state = "attack"
+        # Far enemies off their think slot skip the whole behaviour step - the kinematics
+        # pass keeps moving them by their last velocity
+        if self.resting:
+            self.resting = False
+            return []
+        
+        # State machine for AI behavior (the game's perception pass decides it for all enemies at once)
+        if self.perceived:
+            self.perceived = False
         else:
-            self.ai_state = "position"
+            self.ai_state = get_ai_state(self.distance_sq_to_player(player_rect),
+                                         self.detection_radius, self.attack_radius)
+        
+        # Pick a fresh position target next time the enemy starts positioning
+        if self.ai_state != "position":
+            self.target_x = None
         
         # Execute AI behavior based on state
         actions = []
@@ -218,6 +148,8 @@ class Enemy(pygame.sprite.Sprite):
         elif self.ai_state == "position":
             self.position_behavior(player_rect)
         elif self.ai_state == "attack":
+            # Hold position while attacking
+            self.body.stop()
             action = self.attack_behavior(player_rect)
             if action:
                 actions.append(action)
@@ -226,12 +158,20 @@ class Enemy(pygame.sprite.Sprite):
     
     def patrol_behavior(self):
         """Default patrol movement"""
+        # The game's movement pass steers patrolling enemies in one pass
+        if self.steered:
+            self.steered = False
+            return
+        
         # Continue with original movement pattern
         self.execute_movement_pattern()
     
     def position_behavior(self, player_rect):
         """Move to get in position to attack player"""
-        target_x, target_y = self.get_position_target(player_rect)
+        # Keep the target between retargets instead of re-rolling its randomness every frame
+        if self.target_x is None or (self.ai_timer + self.think_slot) % AI_RETARGET_INTERVAL == 0:
+            self.target_x, self.target_y = self.get_position_target(player_rect)
+        target_x, target_y = self.target_x, self.target_y
         
         # Move toward target position
         dx = target_x - self.rect.centerx
@@ -239,11 +179,10 @@ class Enemy(pygame.sprite.Sprite):
         distance = math.sqrt(dx*dx + dy*dy)
         
         if distance > 10:  # Don't micro-adjust
-            move_x = (dx / distance) * self.base_speed * 0.7  # Slower positioning
-            move_y = (dy / distance) * self.base_speed * 0.7
-            
-            self.rect.x += move_x
-            self.rect.y += move_y
+            self.body.vx = (dx / distance) * self.base_speed * 0.7  # Slower positioning
+            self.body.vy = (dy / distance) * self.base_speed * 0.7
+        else:
+            self.body.stop()
     
     def attack_behavior(self, player_rect):
         """Attack the player"""
@@ -260,8 +199,8 @@ class Enemy(pygame.sprite.Sprite):
         return None
     
     def create_projectile(self, player_rect):
-        """Create a projectile aimed at the player"""
-        from enemy_projectile import EnemyProjectile
+        """Create a laser shot aimed at the player (the game spawns it into its laser engine)"""
+        from enemy_projectile import LaserShot
         
         # Shoot from the front of the ship
         if self.direction == "down":
@@ -275,71 +214,20 @@ class Enemy(pygame.sprite.Sprite):
         target_x = player_rect.centerx
         target_y = player_rect.centery
         
-        projectile = EnemyProjectile(shoot_x, shoot_y, target_x, target_y, "laser")
         # print(f"{self.enemy_type} fired at player!")
-        return projectile
+        return LaserShot(shoot_x, shoot_y, target_x, target_y)
     
     def create_bomb(self):
         """Create a bomb at current position"""
-        from enemy_projectile import Bomb
+        from enemy_projectile import bomb_pool
         
-        bomb = Bomb(self.rect.centerx, self.rect.centery)
+        bomb = bomb_pool.acquire(self.rect.centerx, self.rect.centery)
         # print(f"{self.enemy_type} dropped a bomb!")
         return bomb
     
     def execute_movement_pattern(self):
         """Execute the enemy's movement pattern - handles all directions"""
-        # Base movement based on direction
-        if self.direction == "down":
-            base_x, base_y = 0, self.base_speed
-        elif self.direction == "up":
-            base_x, base_y = 0, -self.base_speed
-        elif self.direction == "left":
-            base_x, base_y = -self.base_speed, 0
-        elif self.direction == "right":
-            base_x, base_y = self.base_speed, 0
-        else:
-            base_x, base_y = 0, self.base_speed  # Default to down
-        
-        # Apply movement pattern modifications
-        if self.movement_pattern == "aggressive":
-            # Direct movement
-            self.rect.x += base_x
-            self.rect.y += base_y
-            
-        elif self.movement_pattern == "tactical":
-            # Slight weaving movement
-            if self.direction in ["up", "down"]:
-                self.rect.x += math.sin(self.move_timer * 0.05) * 1  # Side weaving
-                self.rect.y += base_y
-            else:  # left/right
-                self.rect.x += base_x
-                self.rect.y += math.sin(self.move_timer * 0.05) * 1  # Up/down weaving
-            
-        elif self.movement_pattern == "defensive":
-            # Slow, steady movement
-            self.rect.x += base_x * 0.8
-            self.rect.y += base_y * 0.8
-            
-        elif self.movement_pattern == "artillery":
-            # Very slow movement, focus on positioning
-            self.rect.x += base_x * 0.6
-            self.rect.y += base_y * 0.6
-            
-        elif self.movement_pattern == "chaotic":
-            # Unpredictable movement
-            if self.move_timer % 90 < 45:
-                if self.direction in ["up", "down"]:
-                    self.rect.x += 1
-                else:
-                    self.rect.y += 1
-            else:
-                if self.direction in ["up", "down"]:
-                    self.rect.x -= 1
-                else:
-                    self.rect.y -= 1
-            self.rect.x += base_x
-            self.rect.y += base_y
+        steer_enemy(self, self.move_timer)
     
     def update(self, player_rect=None):
         """Update enemy position and AI behavior"""
@@ -401,9 +289,10 @@ class Asteroid(pygame.sprite.Sprite):
         self.rect.x = x
         self.rect.y = y
         
-        # Set movement (much slower)
-        self.speed_y = random.uniform(0.2, 0.6)  # Slower downward drift
-        self.speed_x = random.uniform(-0.2, 0.2)  # Slower horizontal drift
+        # Set movement (much slower, integrated by the game's kinematics pass)
+        speed_y = random.uniform(0.2, 0.6)  # Slower downward drift
+        speed_x = random.uniform(-0.2, 0.2)  # Slower horizontal drift
+        self.body = Body(self.rect, speed_x, speed_y)
         
         # Health based on size
         self.health = {"small": 1, "medium": 2, "large": 3}[size]
@@ -411,12 +300,8 @@ class Asteroid(pygame.sprite.Sprite):
         
     def load_asteroid_sprite(self):
         """Load individual asteroid sprite from sheet"""
-        asteroid_sheet = pygame.image.load("assets/images/Asteroids-Sheet.png").convert_alpha()
-        
-        # The sheet contains 12 asteroids in a single row
-        sheet_width = asteroid_sheet.get_width()
-        sheet_height = asteroid_sheet.get_height()
-        asteroid_width = sheet_width // 12  # 12 asteroids in the sheet
+        # The sheet contains 12 asteroids in a single row (sliced once by the registry)
+        asteroid_frames = assets.get_frames("assets/images/Asteroids-Sheet.png", 12)
         
         # Choose asteroid based on size
         if self.size == "small":
@@ -429,20 +314,14 @@ class Asteroid(pygame.sprite.Sprite):
             # Use asteroids 0-3 (larger ones on the left)
             asteroid_index = random.randint(0, 3)
         
-        # Cut out the specific asteroid
-        x = asteroid_index * asteroid_width
-        asteroid_rect = pygame.Rect(x, 0, asteroid_width, sheet_height)
-        self.original_image = asteroid_sheet.subsurface(asteroid_rect).copy()
+        # Use the shared asteroid frame
+        self.original_image = asteroid_frames[asteroid_index]
         self.image = self.original_image
         
         # print(f"Loaded {self.size} asteroid (index {asteroid_index})")
         
     def update(self):
-        """Update asteroid position and rotation"""
-        # Move slowly
-        self.rect.y += self.speed_y
-        self.rect.x += self.speed_x
-        
+        """Update asteroid rotation (the kinematics pass moves it)"""
         # Slow rotation
         self.rotation += self.rotation_speed
         if self.rotation >= 360:
@@ -450,10 +329,10 @@ class Asteroid(pygame.sprite.Sprite):
         elif self.rotation < 0:
             self.rotation += 360
             
-        # Apply rotation to image
-        self.image = pygame.transform.rotate(self.original_image, self.rotation)
+        # Apply rotation to image (shared frame from the rotation cache, rect resized in place)
+        self.image = rotation_cache.get_rotated(self.original_image, self.rotation)
         old_center = self.rect.center
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.center = old_center
         
         # Remove if off screen
@@ -486,9 +365,10 @@ class Debris(pygame.sprite.Sprite):
         self.rect.x = x
         self.rect.y = y
         
-        # Set movement (very slow drift)
-        self.speed_y = random.uniform(0.1, 0.4)  # Much slower downward drift
-        self.speed_x = random.uniform(-0.15, 0.15)  # Much slower horizontal drift
+        # Set movement (very slow drift, integrated by the game's kinematics pass)
+        speed_y = random.uniform(0.1, 0.4)  # Much slower downward drift
+        speed_x = random.uniform(-0.15, 0.15)  # Much slower horizontal drift
+        self.body = Body(self.rect, speed_x, speed_y)
         
         # Debris is fragile
         self.health = 1
@@ -496,30 +376,20 @@ class Debris(pygame.sprite.Sprite):
         
     def load_debris_sprite(self):
         """Load individual debris sprite from sheet"""
-        debris_sheet = pygame.image.load("assets/images/Debris-Sheet.png").convert_alpha()
-        
-        # The sheet contains 6 debris pieces in a single row
-        sheet_width = debris_sheet.get_width()
-        sheet_height = debris_sheet.get_height()
-        debris_width = sheet_width // 6  # 6 debris pieces in the sheet
+        # The sheet contains 6 debris pieces in a single row (sliced once by the registry)
+        debris_frames = assets.get_frames("assets/images/Debris-Sheet.png", 6)
         
         # Choose a random debris piece
         debris_index = random.randint(0, 5)
         
-        # Cut out the specific debris piece
-        x = debris_index * debris_width
-        debris_rect = pygame.Rect(x, 0, debris_width, sheet_height)
-        self.original_image = debris_sheet.subsurface(debris_rect).copy()
+        # Use the shared debris frame
+        self.original_image = debris_frames[debris_index]
         self.image = self.original_image
         
         # print(f"Loaded debris piece (index {debris_index})")
         
     def update(self):
-        """Update debris position and rotation"""
-        # Very slow drift movement
-        self.rect.y += self.speed_y
-        self.rect.x += self.speed_x
-        
+        """Update debris rotation (the kinematics pass moves it)"""
         # Slow rotation
         self.rotation += self.rotation_speed
         if self.rotation >= 360:
@@ -527,10 +397,10 @@ class Debris(pygame.sprite.Sprite):
         elif self.rotation < 0:
             self.rotation += 360
             
-        # Apply rotation
-        self.image = pygame.transform.rotate(self.original_image, self.rotation)
+        # Apply rotation (shared frame from the rotation cache, rect resized in place)
+        self.image = rotation_cache.get_rotated(self.original_image, self.rotation)
         old_center = self.rect.center
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.center = old_center
         
         # Remove if off screen
@@ -0,0 +1,131 @@
+"""
+Enemy Archetypes for Retro Space Shooter
+Immutable per-type stats and pre-rotated sprites shared by every enemy of that type
+"""
+import json
+import pygame
+from asset_registry import assets
+from enemy_movement import get_motion
+from constants import *
+
+# Built-in archetype table (same fields as an archetype data file)
+ENEMY_ARCHETYPE_DATA = {
+    # Fast, agile fighter - aggressive AI, medium detection range
+    "fighter1": {
+        'sprite': "assets/images/fighter1.png",
+        'base_speed': 2, 'movement_pattern': "aggressive", 'health': 1, 'score_value': 10,
+        'shot_cooldown': 45, 'can_drop_bombs': False, 'bomb_drop_chance': 0,
+        'detection_radius': 200, 'attack_radius': 150
+    },
+    # Medium speed with weaving - tactical AI, good detection range
+    "fighter2": {
+        'sprite': "assets/images/fighter2.png",
+        'base_speed': 1.5, 'movement_pattern': "tactical", 'health': 1, 'score_value': 15,
+        'shot_cooldown': 60, 'can_drop_bombs': False, 'bomb_drop_chance': 0,
+        'detection_radius': 220, 'attack_radius': 160
+    },
+    # Slow but tough - defensive AI with bombs, shorter detection but wide attack
+    "crabship": {
+        'sprite': "assets/images/CrabShip.png",
+        'base_speed': 0.8, 'movement_pattern': "defensive", 'health': 2, 'score_value': 25,
+        'shot_cooldown': 90, 'can_drop_bombs': True, 'bomb_drop_chance': 0.02,  # 2% chance per frame when in range
+        'detection_radius': 180, 'attack_radius': 140
+    },
+    # Heavy, slow, tough - artillery AI with fast shooting, longest detection and attack range
+    "gunship": {
+        'sprite': "assets/images/Gunship.png",
+        'base_speed': 0.7, 'movement_pattern': "artillery", 'health': 3, 'score_value': 30,
+        'shot_cooldown': 40, 'can_drop_bombs': False, 'bomb_drop_chance': 0,
+        'detection_radius': 280, 'attack_radius': 220
+    },
+    # Fast and unpredictable - chaotic AI with bombs, very good detection
+    "pirate": {
+        'sprite': "assets/images/Pirate_Fighter.png",
+        'base_speed': 1.2, 'movement_pattern': "chaotic", 'health': 2, 'score_value': 20,
+        'shot_cooldown': 75, 'can_drop_bombs': True, 'bomb_drop_chance': 0.015,  # 1.5% chance per frame
+        'detection_radius': 250, 'attack_radius': 180
+    }
+}
+
+DEFAULT_ARCHETYPE = "fighter1"  # Used for unknown enemy types
+
+# Rotation from the sprite's default (facing down) orientation per flight direction
+DIRECTION_ANGLES = {"down": 0, "up": 180, "left": 90, "right": -90}
+
+class EnemyArchetype:
+    """Immutable stats and direction sprites for one enemy type"""
+    __slots__ = ('enemy_type', 'sprite', 'base_speed', 'movement_pattern', 'health', 'score_value',
+                 'shot_cooldown', 'can_drop_bombs', 'bomb_drop_chance', 'detection_radius',
+                 'attack_radius', 'original_image', 'images', 'motions')
+
+    def __init__(self, enemy_type, original_image, **stats):
+        object.__setattr__(self, 'enemy_type', enemy_type)
+        object.__setattr__(self, 'original_image', original_image)
+        for name, value in stats.items():
+            object.__setattr__(self, name, value)
+
+        # Pre-rotate every flight direction once
+        images = {direction: pygame.transform.rotate(original_image, angle) if angle else original_image
+                  for direction, angle in DIRECTION_ANGLES.items()}
+        object.__setattr__(self, 'images', images)
+        
+        # Movement step and weave vectors per flight direction
+        motions = {direction: get_motion(self.base_speed, self.movement_pattern, direction)
+                   for direction in DIRECTION_ANGLES}
+        object.__setattr__(self, 'motions', motions)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("EnemyArchetype is immutable")
+
+    def get_image(self, direction):
+        """Get the sprite facing a flight direction (unknown directions face down)"""
+        return self.images.get(direction, self.original_image)
+    
+    def get_motion(self, direction):
+        """Get the movement vectors for a flight direction (unknown directions fly down)"""
+        return self.motions.get(direction, self.motions["down"])
+
+
+class EnemyArchetypeRegistry:
+    def __init__(self, data=ENEMY_ARCHETYPE_DATA):
+        """Initialize the registry from an archetype table (archetypes are built on first use)"""
+        self.data = data
+        self.archetypes = {}  # enemy type -> EnemyArchetype
+
+    def load(self, path):
+        """Replace the archetype table with one read from a JSON data file"""
+        with open(path) as f:
+            self.data = json.load(f)
+        self.archetypes.clear()
+        print(f"👾 Loaded {len(self.data)} enemy archetypes from {path}")
+
+    def build(self, enemy_type):
+        """Build an archetype from its table entry (needs the display mode set to convert its sprite)"""
+        stats = self.data[enemy_type]
+        original_image = assets.get_image(stats['sprite'])
+        archetype = EnemyArchetype(enemy_type, original_image, **stats)
+        self.archetypes[enemy_type] = archetype
+        return archetype
+
+    def get(self, enemy_type):
+        """Get the shared archetype for an enemy type"""
+        archetype = self.archetypes.get(enemy_type)
+        if archetype is not None:
+            return archetype
+        if enemy_type not in self.data:
+            return self.get(DEFAULT_ARCHETYPE)
+        return self.build(enemy_type)
+
+    def preload(self):
+        """Build every archetype once at startup"""
+        for enemy_type in self.data:
+            if enemy_type not in self.archetypes:
+                self.build(enemy_type)
+
+    def get_types(self):
+        """Get the known enemy types"""
+        return list(self.data)
+
+
+# Process-wide archetype registry shared by every enemy
+enemy_archetypes = EnemyArchetypeRegistry()
@@ -0,0 +1,73 @@
+"""
+Enemy Movement for Retro Space Shooter
+Steers every patrolling enemy along its movement pattern from precomputed direction vectors
+"""
+import math
+from constants import *
+
+MOVEMENT_PATTERNS = ("aggressive", "tactical", "defensive", "artillery", "chaotic")
+TACTICAL = MOVEMENT_PATTERNS.index("tactical")
+CHAOTIC = MOVEMENT_PATTERNS.index("chaotic")
+
+# Fraction of base speed each pattern flies at
+PATTERN_SPEED_SCALE = {"aggressive": 1.0, "tactical": 1.0, "defensive": 0.8, "artillery": 0.6, "chaotic": 1.0}
+
+# Unit flight direction and the sideways axis weaving patterns sway along
+DIRECTION_VECTORS = {"down": (0, 1), "up": (0, -1), "left": (-1, 0), "right": (1, 0)}
+WEAVE_AXES = {"down": (1, 0), "up": (1, 0), "left": (0, 1), "right": (0, 1)}
+
+def get_motion(base_speed, movement_pattern, direction):
+    """Precompute (step x, step y, weave x, weave y, pattern id) for a pattern flying in a direction"""
+    if direction not in DIRECTION_VECTORS:
+        direction = "down"  # Default to down
+    speed = base_speed * PATTERN_SPEED_SCALE.get(movement_pattern, 0.0)
+    direction_x, direction_y = DIRECTION_VECTORS[direction]
+    weave_x, weave_y = WEAVE_AXES[direction]
+    pattern = MOVEMENT_PATTERNS.index(movement_pattern) if movement_pattern in MOVEMENT_PATTERNS else -1
+    return (direction_x * speed, direction_y * speed, weave_x, weave_y, pattern)
+
+def steer_enemy(enemy, move_timer):
+    """Set one enemy's velocity for this frame of its pattern (the kinematics pass moves it)"""
+    step_x, step_y, weave_x, weave_y, pattern = enemy.motion
+    body = enemy.body
+    if pattern == TACTICAL:
+        # Slight weaving sideways
+        sway = math.sin(move_timer * 0.05)
+        body.vx = step_x + weave_x * sway
+        body.vy = step_y + weave_y * sway
+    elif pattern == CHAOTIC:
+        # Jink one pixel sideways, switching side every 45 frames
+        jink = 1 if move_timer % 90 < 45 else -1
+        body.vx = step_x + weave_x * jink
+        body.vy = step_y + weave_y * jink
+    else:
+        body.vx = step_x
+        body.vy = step_y
+
+
+class EnemyMovement:
+    def __init__(self):
+        """Initialize the steering pass"""
+        # Statistics
+        self.frames = 0
+        self.moves = 0
+
+    def update(self, enemies):
+        """Steer every patrolling enemy for this frame (Enemy.update_ai then skips their patrol steering)"""
+        self.frames += 1
+        moves = 0
+        for enemy in enemies:
+            # Resting far enemies keep last frame's velocity
+            if enemy.ai_state == "patrol" and not enemy.resting:
+                # Runs before Enemy.update bumps move_timer, so this frame's timer is one ahead
+                steer_enemy(enemy, enemy.move_timer + 1)
+                enemy.steered = True
+                moves += 1
+        self.moves += moves
+
+    def get_stats(self):
+        """Get movement statistics"""
+        return {
+            'frames': self.frames,
+            'moves': self.moves
+        }
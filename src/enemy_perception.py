@@ -0,0 +1,121 @@
+"""
+Enemy Perception for Retro Space Shooter
+Decides every enemy's patrol/position/attack state in one pass per frame from squared distances to the player.
+Enemies off-screen or well outside their detection range act at a reduced, staggered rate (AI level of detail):
+in between they skip perception, steering and behaviour, and keep drifting on their last velocity.
+"""
+import itertools
+import pygame
+from constants import *
+
+# NumPy is optional - without it the pass falls back to a plain loop
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AI_STATES = ("patrol", "position", "attack")
+
+class EnemyPerception:
+    def __init__(self):
+        """Initialize the perception pass"""
+        # Below this many enemies the plain loop beats building arrays
+        self.batch_threshold = PERCEPTION_BATCH_MIN_ENEMIES
+
+        # Level of detail - far enemies act every far_interval frames and keep their last state and velocity in between
+        self.far_interval = AI_LOD_FAR_INTERVAL
+        self.far_margin = AI_LOD_MARGIN
+        self.viewport = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # Statistics
+        self.frames = 0
+        self.batched_frames = 0
+        self.enemies_perceived = 0
+        self.thinks = 0    # Enemies classified
+        self.skipped = 0   # Far-enemy frames spent resting (no perception, steering or behaviour)
+
+    def update(self, enemies, player_rect):
+        """Assign ai_state to every enemy for this frame, or mark it resting (consumed by Enemy.update_ai)"""
+        count = len(enemies)
+        if count == 0:
+            return
+        self.frames += 1
+        self.enemies_perceived += count
+
+        # Far enemies only act on their staggered slot - EnemyMovement and Enemy.update_ai skip resting ones
+        frame = self.frames
+        far_interval = self.far_interval
+        thinkers = []
+        for enemy in enemies:
+            if enemy.far and (frame + enemy.think_slot) % far_interval:
+                enemy.resting = True
+            else:
+                thinkers.append(enemy)
+        self.thinks += len(thinkers)
+        self.skipped += count - len(thinkers)
+        if not thinkers:
+            return
+
+        if np is not None and len(thinkers) >= self.batch_threshold:
+            self.batched_frames += 1
+            states, distances_sq = self.batch_states(thinkers, player_rect)
+            for enemy, state, distance_sq in zip(thinkers, states, distances_sq):
+                enemy.ai_state = AI_STATES[state]
+                enemy.perceived = True
+                enemy.far = self.is_far(enemy, distance_sq)
+            return
+
+        player_x, player_y = player_rect.center
+        for enemy in thinkers:
+            dx = player_x - enemy.rect.centerx
+            dy = player_y - enemy.rect.centery
+            distance_sq = dx*dx + dy*dy
+            enemy.ai_state = get_ai_state(distance_sq, enemy.detection_radius, enemy.attack_radius)
+            enemy.perceived = True
+            enemy.far = self.is_far(enemy, distance_sq)
+
+    def is_far(self, enemy, distance_sq):
+        """Check if an enemy is off-screen or far enough outside detection range to think less often"""
+        # The margin covers how far enemy and player can close in between far thinks
+        far_radius = enemy.detection_radius + self.far_margin
+        return distance_sq > far_radius * far_radius or not self.viewport.colliderect(enemy.rect)
+
+    def batch_states(self, enemies, player_rect):
+        """Get an index into AI_STATES and the squared distance per enemy, in list order, from one NumPy pass"""
+        # x, y, w, h, detection radius, attack radius per enemy
+        packed = np.fromiter(
+            itertools.chain.from_iterable(
+                (*enemy.rect, enemy.detection_radius, enemy.attack_radius) for enemy in enemies
+            ),
+            dtype=np.int64, count=len(enemies) * 6
+        ).reshape(-1, 6)
+
+        # Same integer centers as Rect.centerx/centery
+        dx = player_rect.centerx - (packed[:, 0] + packed[:, 2] // 2)
+        dy = player_rect.centery - (packed[:, 1] + packed[:, 3] // 2)
+        distance_sq = dx*dx + dy*dy
+
+        can_see = distance_sq <= packed[:, 4] * packed[:, 4]
+        can_attack = distance_sq <= packed[:, 5] * packed[:, 5]
+        # patrol (0) out of sight, attack (2) in range, position (1) in between
+        return np.where(can_see, np.where(can_attack, 2, 1), 0).tolist(), distance_sq.tolist()
+
+    def get_stats(self):
+        """Get perception statistics"""
+        return {
+            'frames': self.frames,
+            'batched_frames': self.batched_frames,
+            'enemies_perceived': self.enemies_perceived,
+            'thinks': self.thinks,
+            'skipped': self.skipped,
+            'numpy': np is not None
+        }
+
+
+def get_ai_state(distance_sq, detection_radius, attack_radius):
+    """Pick the AI state for one enemy from its squared distance to the player"""
+    if distance_sq > detection_radius * detection_radius:
+        return "patrol"
+    if distance_sq <= attack_radius * attack_radius:
+        return "attack"
+    return "position"
@@ -4,22 +4,54 @@ Enemy projectile and bomb system for Retro Space Shooter
 import pygame
 import random
 import math
+from collections import namedtuple
+from asset_registry import assets
+from rotation_cache import rotation_cache
+from object_pool import ObjectPool
+from kinematics import Body
 from constants import *
 
+ENEMY_LASER_SPEED = 4
+
+# An enemy's shot request - the game spawns it into its laser engine
+LaserShot = namedtuple('LaserShot', ['x', 'y', 'target_x', 'target_y'])
+
+def fire_laser(engine, shot):
+    """Spawn an enemy laser aimed from the shot's origin at its target (same sprite and speed as EnemyProjectile)"""
+    dx = shot.target_x - shot.x
+    dy = shot.target_y - shot.y
+    
+    # Shared sprite rotated to the quantized heading
+    image = rotation_cache.get_rotated(assets.get_image("assets/images/Projectile03.png"),
+                                       math.degrees(math.atan2(dy, dx)) - 90)
+    
+    distance = math.hypot(dx, dy)
+    if distance > 0:
+        vx = dx / distance * ENEMY_LASER_SPEED
+        vy = dy / distance * ENEMY_LASER_SPEED
+    else:
+        vx = 0
+        vy = ENEMY_LASER_SPEED
+    return engine.spawn("laser", image, shot.x, shot.y, vx, vy)
+
+
 class EnemyProjectile(pygame.sprite.Sprite):
     def __init__(self, x, y, target_x, target_y, projectile_type="laser"):
         """Initialize an enemy projectile"""
         super().__init__()
+        self.reset(x, y, target_x, target_y, projectile_type)
         
+    def reset(self, x, y, target_x, target_y, projectile_type="laser"):
+        """(Re)initialize projectile state - also used when recycled from the pool"""
         self.projectile_type = projectile_type
         
         # Load projectile sprite (use Projectile03 for all enemy projectiles)
         if projectile_type == "laser":
-            self.image = pygame.image.load("assets/images/Projectile03.png").convert_alpha()
+            self.image = assets.get_image("assets/images/Projectile03.png")
             # Rotate to face the target direction
             angle = math.atan2(target_y - y, target_x - x)
             self.image = pygame.transform.rotate(self.image, math.degrees(angle) - 90)
-            self.speed = 4
+            self.speed = ENEMY_LASER_SPEED
         
         # Set position
         self.rect = self.image.get_rect()
@@ -44,13 +76,21 @@ class EnemyProjectile(pygame.sprite.Sprite):
         if (self.rect.right < 0 or self.rect.left > SCREEN_WIDTH or
             self.rect.bottom < 0 or self.rect.top > SCREEN_HEIGHT):
             self.kill()
+    
+    def kill(self):
+        """Remove from all groups and return to the pool"""
+        super().kill()
+        laser_pool.release(self)
 
 
 class Bomb(pygame.sprite.Sprite):
     def __init__(self, x, y):
         """Initialize a bomb"""
         super().__init__()
+        self.reset(x, y)
         
+    def reset(self, x, y):
+        """(Re)initialize bomb state - also used when recycled from the pool"""
         # Load bomb sprite from sheet
         self.load_bomb_sprite()
         
@@ -59,9 +99,8 @@ class Bomb(pygame.sprite.Sprite):
         self.rect.centerx = x
         self.rect.centery = y
         
-        # Bombs are stationary but can have slight drift
-        self.velocity_x = random.uniform(-0.5, 0.5)
-        self.velocity_y = random.uniform(-0.5, 0.5)
+        # Bombs are stationary but can have slight drift (integrated by the game's kinematics pass)
+        self.body = Body(self.rect, random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5))
         
         # Bomb properties
         self.lifetime = 300  # 5 seconds at 60 FPS
@@ -74,30 +113,20 @@ class Bomb(pygame.sprite.Sprite):
         
     def load_bomb_sprite(self):
         """Load individual bomb sprite from sheet"""
-        bomb_sheet = pygame.image.load("assets/images/Bombe-Sheet.png").convert_alpha()
-        
-        # The sheet contains 5 bomb sprites in a single row
-        sheet_width = bomb_sheet.get_width()
-        sheet_height = bomb_sheet.get_height()
-        bomb_width = sheet_width // 5  # 5 bombs in the sheet
+        # The sheet contains 5 bomb sprites in a single row (sliced once by the registry)
+        bomb_frames = assets.get_frames("assets/images/Bombe-Sheet.png", 5)
         
         # Choose a random bomb sprite
         bomb_index = random.randint(0, 4)
         
-        # Cut out the specific bomb
-        x = bomb_index * bomb_width
-        bomb_rect = pygame.Rect(x, 0, bomb_width, sheet_height)
-        self.original_image = bomb_sheet.subsurface(bomb_rect).copy()
+        # Use the shared bomb frame
+        self.original_image = bomb_frames[bomb_index]
         self.image = self.original_image
         
-        print(f"Loaded bomb sprite (index {bomb_index})")
+        # print(f"Loaded bomb sprite (index {bomb_index})")
         
     def update(self):
-        """Update bomb position and lifetime"""
-        # Slight drift movement
-        self.rect.x += self.velocity_x
-        self.rect.y += self.velocity_y
-        
+        """Update bomb rotation and lifetime (the kinematics pass moves it)"""
         # Rotate for visual effect
         self.rotation += self.rotation_speed
         if self.rotation >= 360:
@@ -105,10 +134,10 @@ class Bomb(pygame.sprite.Sprite):
         elif self.rotation < 0:
             self.rotation += 360
             
-        # Apply rotation
-        self.image = pygame.transform.rotate(self.original_image, self.rotation)
+        # Apply rotation (shared frame from the rotation cache, rect resized in place)
+        self.image = rotation_cache.get_rotated(self.original_image, self.rotation)
         old_center = self.rect.center
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.center = old_center
         
         # Countdown lifetime
@@ -122,3 +151,13 @@ class Bomb(pygame.sprite.Sprite):
         # TODO: Create explosion animation and damage
         self.kill()
         return self.explosion_radius, self.damage
+    
+    def kill(self):
+        """Remove from all groups and return to the pool"""
+        super().kill()
+        bomb_pool.release(self)
+
+
+# Shared pools of enemy lasers and bombs
+laser_pool = ObjectPool(EnemyProjectile, "enemy_lasers")
+bomb_pool = ObjectPool(Bomb, "bombs")
@@ -87,7 +87,7 @@ def debug_enemy_spawning():
                 # Monitor enemy positions every 3 seconds
                 if frame_count % 180 == 0:
                     current_enemies = len(game.enemies)
-                    time_remaining = wave_info.get('time_remaining', 0)
+                    time_remaining = game.wave_manager.get_time_remaining()
                     
                     print(f"\n📊 Wave 2 Status - {time_remaining:.1f}s left:")
                     print(f"   Enemies on screen: {current_enemies}")
@@ -0,0 +1,135 @@
+"""
+Entity Store for Retro Space Shooter
+Typed registry of entity groups - every sprite lives in exactly one group picked by its class, and the
+store itself stands in for the old all_sprites group so existing Group users keep working
+"""
+import pygame
+
+class EntityGroup(pygame.sprite.AbstractGroup):
+    """Sprite group for one entity type, iterated from a cached dense list"""
+
+    def __init__(self, entity_type, *sprites):
+        super().__init__()
+        self.entity_type = entity_type
+        self.dense = []  # Members in insertion order, rebuilt lazily after adds/removes (None when stale)
+        self.add(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        self.spritedict[sprite] = None
+        self.dense = None
+
+    def remove_internal(self, sprite):
+        # Dict removal is O(1) and keeps the remaining order
+        del self.spritedict[sprite]
+        self.dense = None
+
+    def get_dense(self):
+        """Get the members as a list (shared - safe to iterate while sprites are killed, not to modify)"""
+        dense = self.dense
+        if dense is None:
+            dense = self.dense = list(self.spritedict)
+        return dense
+
+    def sprites(self):
+        return list(self.get_dense())
+
+    def __iter__(self):
+        return iter(self.get_dense())
+
+    def __len__(self):
+        return len(self.spritedict)
+
+    def __bool__(self):
+        return bool(self.spritedict)
+
+    def update(self, *args, **kwargs):
+        for sprite in self.get_dense():
+            sprite.update(*args, **kwargs)
+
+
+class EntityStore:
+    def __init__(self):
+        """Initialize an empty store"""
+        self.groups = {}    # entity type -> EntityGroup, in registration (update and draw) order
+        self.type_of = {}   # sprite class -> entity type
+
+    def register(self, entity_type, *classes):
+        """Create the group for an entity type and route the given sprite classes to it"""
+        if entity_type in self.groups:
+            raise ValueError(f"Entity type '{entity_type}' is already registered")
+        group = EntityGroup(entity_type)
+        self.groups[entity_type] = group
+        for sprite_class in classes:
+            self.type_of[sprite_class] = entity_type
+        return group
+
+    def get(self, entity_type):
+        """Get the group for an entity type"""
+        return self.groups[entity_type]
+
+    def get_group(self, sprite):
+        """Get the group a sprite belongs in (unregistered classes share an 'other' group)"""
+        entity_type = self.type_of.get(type(sprite))
+        if entity_type is None:
+            # Subclasses inherit their base class's type - remember the answer
+            entity_type = next((self.type_of[base] for base in type(sprite).__mro__ if base in self.type_of), "other")
+            self.type_of[type(sprite)] = entity_type
+            if entity_type not in self.groups:
+                self.register(entity_type)
+        return self.groups[entity_type]
+
+    # Group-compatible interface (the store replaces the old all_sprites group)
+    def add(self, *sprites):
+        """Add sprites to their typed groups (a no-op for sprites already there)"""
+        for sprite in sprites:
+            if isinstance(sprite, pygame.sprite.Sprite):
+                self.get_group(sprite).add(sprite)
+            else:
+                self.add(*sprite)  # A list or group of sprites
+
+    def remove(self, *sprites):
+        """Remove sprites from their typed groups"""
+        for sprite in sprites:
+            if isinstance(sprite, pygame.sprite.Sprite):
+                self.get_group(sprite).remove(sprite)
+            else:
+                self.remove(*sprite)
+
+    def has(self, *sprites):
+        """Check if every sprite is in the store"""
+        return bool(sprites) and all(self.get_group(sprite).has(sprite) for sprite in sprites)
+
+    def __contains__(self, sprite):
+        return self.has(sprite)
+
+    def sprites(self):
+        """Get every sprite, type by type in registration order"""
+        return [sprite for group in self.groups.values() for sprite in group.get_dense()]
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def __len__(self):
+        return sum(len(group) for group in self.groups.values())
+
+    def __bool__(self):
+        return any(self.groups.values())
+
+    def update(self, *args, **kwargs):
+        """Update every sprite"""
+        for group in list(self.groups.values()):
+            group.update(*args, **kwargs)
+
+    def draw(self, surface):
+        """Draw every sprite at its rect"""
+        for group in self.groups.values():
+            surface.blits([(sprite.image, sprite.rect) for sprite in group.get_dense()], False)
+
+    def empty(self):
+        """Remove every sprite from every group"""
+        for group in self.groups.values():
+            group.empty()
+
+    def get_counts(self):
+        """Get live sprites per entity type"""
+        return {entity_type: len(group) for entity_type, group in self.groups.items()}
@@ -1,23 +1,114 @@
 """
 Explosion animation system for Retro Space Shooter
-Cuts and animates frames from Explosion02-Sheet
+Cuts and animates frames from the Explosion0x sheets through a shared frame bank
 """
 import pygame
+from asset_registry import assets
+from object_pool import ObjectPool
 from constants import *
 
+# Explosion sheets (single row of square frames): key -> (path, frame count, default scale)
+EXPLOSION_SHEETS = {
+    'explosion01': ("assets/images/Explosion01-Sheet.png", 5, 2.0),     # 32px frames
+    'explosion02': ("assets/images/Explosion02-Sheet.png", 10, 1.5),    # 64px frames
+    'explosion03': ("assets/images/Explosion03-Sheet.png", 15, 0.25),   # 400px frames
+    'explosion04': ("assets/images/Explosion04-Sheet.png", 11, 0.2),    # 480px frames
+    'explosion04b': ("assets/images/Explosion04b-Sheet.png", 11, 0.4),  # 240px frames
+}
+
+# Explosion types used by the game: type -> (sheet key, scale)
+EXPLOSION_TYPES = {
+    'player': ('explosion02', 2.0),  # Player explosions are larger
+    'enemy': ('explosion02', 1.5),
+    'asteroid': ('explosion02', 1.5),
+    'debris': ('explosion02', 1.5),
+    'bomb': ('explosion02', 1.5),
+    'energy_blast': ('explosion02', 1.5),
+}
+DEFAULT_EXPLOSION = ('explosion02', 1.5)
+
+class ExplosionFrameBank:
+    def __init__(self):
+        """Initialize the explosion frame bank"""
+        self.banks = {}  # (sheet key, explosion type, scale) -> shared list of scaled frames
+        self.fallback_frames = None
+
+    def resolve(self, explosion_type):
+        """Get the (sheet key, scale) an explosion type animates with"""
+        if explosion_type in EXPLOSION_TYPES:
+            return EXPLOSION_TYPES[explosion_type]
+        if explosion_type in EXPLOSION_SHEETS:
+            # Sheet keys can be used directly as explosion types
+            return explosion_type, EXPLOSION_SHEETS[explosion_type][2]
+        return DEFAULT_EXPLOSION
+
+    def get_frames(self, explosion_type):
+        """Get the shared frame table for an explosion type, building it on first use"""
+        sheet_key, scale = self.resolve(explosion_type)
+        key = (sheet_key, explosion_type, scale)
+        frames = self.banks.get(key)
+        if frames is None:
+            frames = self.build_frames(sheet_key, scale)
+            self.banks[key] = frames
+        return frames
+
+    def build_frames(self, sheet_key, scale):
+        """Cut and scale every frame of an explosion sheet"""
+        path, frame_count, _ = EXPLOSION_SHEETS[sheet_key]
+        try:
+            sheet_frames = assets.get_frames(path, frame_count)
+        except pygame.error as e:
+            print(f"Error loading explosion sheet: {e}")
+            # Create a simple colored circle as fallback
+            return self.get_fallback_frames()
+
+        # Reuse frames that were already scaled the same way for another type
+        for (bank_sheet, _, bank_scale), frames in self.banks.items():
+            if bank_sheet == sheet_key and bank_scale == scale:
+                return frames
+
+        frame_width, frame_height = sheet_frames[0].get_size()
+        scaled_size = (int(frame_width * scale), int(frame_height * scale))
+        return [pygame.transform.scale(frame, scaled_size) for frame in sheet_frames]
+
+    def get_fallback_frames(self):
+        """Create a simple fallback explosion if sheet loading fails"""
+        if self.fallback_frames is None:
+            self.fallback_frames = []
+            for i in range(10):
+                size = 10 + i * 5  # Growing circle
+                surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                color = (255, 255 - i * 20, 0, 255 - i * 25)  # Fading yellow to red
+                pygame.draw.circle(surface, color, (size, size), size)
+                self.fallback_frames.append(surface)
+            # print("Created fallback explosion animation")
+        return self.fallback_frames
+
+    def preload(self):
+        """Build frame tables for every explosion type and sheet variant"""
+        for explosion_type in list(EXPLOSION_TYPES) + list(EXPLOSION_SHEETS):
+            self.get_frames(explosion_type)
+        print(f"💥 Explosion frame bank ready: {len(self.banks)} explosion kinds")
+
+
+# Process-wide frame bank shared by all explosions
+explosion_bank = ExplosionFrameBank()
+
 class Explosion(pygame.sprite.Sprite):
     def __init__(self, x, y, explosion_type="player"):
         """Initialize an explosion animation"""
         super().__init__()
+        self.reset(x, y, explosion_type)
         
+    def reset(self, x, y, explosion_type="player"):
+        """(Re)initialize explosion state - also used when recycled from the pool"""
         self.explosion_type = explosion_type
-        self.animation_frames = []
         self.current_frame = 0
         self.animation_speed = 4  # Frames to wait between animation frames (slower for better visibility)
         self.frame_counter = 0
         
-        # Load explosion frames from sheet
-        self.load_explosion_frames()
+        # Shared frame table for this explosion type (explosion only tracks its index)
+        self.animation_frames = explosion_bank.get_frames(explosion_type)
         
         # Set initial frame
         if self.animation_frames:
@@ -28,54 +119,6 @@ class Explosion(pygame.sprite.Sprite):
         
         # print(f"Created {explosion_type} explosion at ({x}, {y}) with {len(self.animation_frames)} frames")
         
-    def load_explosion_frames(self):
-        """Load and cut explosion animation frames from Explosion02-Sheet"""
-        try:
-            explosion_sheet = pygame.image.load("assets/images/Explosion02-Sheet.png").convert_alpha()
-            
-            # The sheet contains 10 explosion frames in a single row
-            sheet_width = explosion_sheet.get_width()
-            sheet_height = explosion_sheet.get_height()
-            frame_width = sheet_width // 10  # 10 frames in the sheet
-            
-            # print(f"Explosion sheet: {sheet_width}x{sheet_height}, frame size: {frame_width}x{sheet_height}")
-            
-            # Extract each frame from the sheet
-            for i in range(10):
-                x = i * frame_width
-                frame_rect = pygame.Rect(x, 0, frame_width, sheet_height)
-                
-                # Extract the frame and convert to proper format
-                frame = explosion_sheet.subsurface(frame_rect).copy()
-                
-                # Scale up the explosion for better visibility (2x size)
-                if self.explosion_type == "player":
-                    # Player explosions are larger
-                    scaled_frame = pygame.transform.scale(frame, (frame_width * 2, sheet_height * 2))
-                else:
-                    # Enemy explosions are normal size
-                    scaled_frame = pygame.transform.scale(frame, (frame_width * 1.5, int(sheet_height * 1.5)))
-                
-                self.animation_frames.append(scaled_frame)
-            
-            # print(f"Loaded {len(self.animation_frames)} explosion frames")
-            
-        except pygame.error as e:
-            print(f"Error loading explosion sheet: {e}")
-            # Create a simple colored circle as fallback
-            self.create_fallback_explosion()
-    
-    def create_fallback_explosion(self):
-        """Create a simple fallback explosion if sheet loading fails"""
-        for i in range(10):
-            size = 10 + i * 5  # Growing circle
-            surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            color = (255, 255 - i * 20, 0, 255 - i * 25)  # Fading yellow to red
-            pygame.draw.circle(surface, color, (size, size), size)
-            self.animation_frames.append(surface)
-        
-        # print("Created fallback explosion animation")
-        
     def update(self):
         """Update explosion animation"""
         self.frame_counter += 1
@@ -94,7 +137,16 @@ class Explosion(pygame.sprite.Sprite):
             # Update image to current frame
             self.image = self.animation_frames[self.current_frame]
             
-            # Keep the explosion centered on the original position
+            # Keep the explosion centered on the original position (rect resized in place)
             old_center = self.rect.center
-            self.rect = self.image.get_rect()
+            self.rect.size = self.image.get_size()
             self.rect.center = old_center
+    
+    def kill(self):
+        """Remove from all groups and return to the pool"""
+        super().kill()
+        explosion_pool.release(self)
+
+
+# Shared pool of explosions
+explosion_pool = ObjectPool(Explosion, "explosions")
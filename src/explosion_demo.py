@@ -102,7 +102,6 @@ def demo_explosion_system():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                 elif event.key == pygame.K_e and game.player.is_alive():
                     # Secondary weapon
                     shot_data = game.player.shoot("secondary")
@@ -110,7 +109,6 @@ def demo_explosion_system():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
         
         # Auto-fire projectiles to create explosions for demo
         auto_fire_timer += 1
@@ -121,7 +119,6 @@ def demo_explosion_system():
                 x, y, proj_type, direction = shot_data
                 projectile = Projectile(x, y, proj_type, direction)
                 game.projectiles.add(projectile)
-                game.all_sprites.add(projectile)
                 print(f"Auto-fired projectile at frame {frame}")
         
         game.update()
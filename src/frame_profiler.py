@@ -0,0 +1,133 @@
+"""
+Frame Profiler for Retro Space Shooter
+Times each stage of the frame with lap marks and renders an overlay with averages, worst frames and a frame-time graph
+"""
+import time
+import pygame
+from collections import deque
+from text_cache import text_cache
+from constants import *
+
+# Stages in frame order (laps recorded under other names are listed after these)
+PROFILER_STAGES = [
+    'events', 'dialogue', 'player', 'sprites', 'enemy_ai', 'kinematics', 'explosions', 'background', 'immunity',
+    'collisions', 'waves', 'powerups', 'commands', 'backdrop', 'blits', 'hud', 'overlays', 'dialogue_box',
+    'scroll_zones', 'flip'
+]
+
+FRAME_BUDGET_MS = 1000 / FPS
+
+class FrameProfiler:
+    def __init__(self, history=PROFILER_HISTORY):
+        """Initialize the profiler (disabled until toggled on)"""
+        self.enabled = False
+        self.history = history
+        self.stage_history = {}                    # stage -> deque of ms per frame
+        self.frame_history = deque(maxlen=history)  # total ms per frame
+        self.frame_times = {}                      # stage -> ms so far this frame
+        self.counts = {}                           # group name -> live sprites
+        self.frame_index = 0
+        self.frame_start = 0
+        self.last_mark = 0
+
+    def toggle(self):
+        """Turn profiling on or off (history is cleared either way)"""
+        self.enabled = not self.enabled
+        self.stage_history.clear()
+        self.frame_history.clear()
+        self.frame_times.clear()
+
+        # Toggled mid-frame (F3 is handled after begin_frame) - time the rest of this frame from now
+        self.frame_start = self.last_mark = time.perf_counter()
+        return self.enabled
+
+    def begin_frame(self):
+        """Start timing a frame"""
+        if not self.enabled:
+            return
+        self.frame_times = {}
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def lap(self, stage):
+        """Charge the time since the previous mark to stage"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frame_times[stage] = self.frame_times.get(stage, 0.0) + (now - self.last_mark) * 1000
+        self.last_mark = now
+
+    def end_frame(self, counts=None):
+        """Finish the frame and roll its stage times into the history"""
+        if not self.enabled:
+            return
+        total = (time.perf_counter() - self.frame_start) * 1000
+        self.frame_history.append(total)
+        for stage, elapsed in self.frame_times.items():
+            stage_times = self.stage_history.get(stage)
+            if stage_times is None:
+                stage_times = self.stage_history[stage] = deque(maxlen=self.history)
+            stage_times.append(elapsed)
+        if counts is not None:
+            self.counts = counts
+        self.frame_index += 1
+
+    def get_stats(self):
+        """Get rolling average and worst milliseconds per stage, plus the whole frame"""
+        stats = {}
+        order = PROFILER_STAGES + [stage for stage in self.stage_history if stage not in PROFILER_STAGES]
+        for stage in order:
+            stage_times = self.stage_history.get(stage)
+            if stage_times:
+                stats[stage] = (sum(stage_times) / len(stage_times), max(stage_times))
+        if self.frame_history:
+            stats['frame'] = (sum(self.frame_history) / len(self.frame_history), max(self.frame_history))
+        return stats
+
+    def render(self, frame_index=None):
+        """Render the overlay panel (frame_index is only the HUD's change signal)"""
+        stats = self.get_stats()
+        line_height = 14
+        graph_height = 40
+        width = 260
+        count_items = [f"{name}:{count}" for name, count in self.counts.items()]
+        count_lines = [" ".join(count_items[i:i + 4]) for i in range(0, len(count_items), 4)]
+        height = 28 + line_height * (len(stats) + len(count_lines)) + graph_height + 10
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        pygame.draw.rect(panel, CYAN, (0, 0, width, height), 1)
+
+        panel.blit(text_cache.render("PROFILER (F3)", 16, CYAN), (8, 6))
+        panel.blit(text_cache.render("avg ms", 16, CYAN), (120, 6))
+        panel.blit(text_cache.render("worst", 16, CYAN), (190, 6))
+        y = 22
+        for stage, (average, worst) in stats.items():
+            color = RED if worst > FRAME_BUDGET_MS else (YELLOW if stage == 'frame' else WHITE)
+            panel.blit(text_cache.render(f"{stage:<11}", 16, color), (8, y))
+            panel.blit(text_cache.render(f"{average:6.2f}", 16, color), (120, y))
+            panel.blit(text_cache.render(f"{worst:6.2f}", 16, color), (190, y))
+            y += line_height
+
+        # Live entity counts (four groups per line)
+        for counts_text in count_lines:
+            panel.blit(text_cache.render(counts_text, 16, GREEN), (8, y))
+            y += line_height
+        y += 4
+
+        # Frame-time graph, one pixel column per frame, scaled so the budget line sits at half height
+        graph_rect = pygame.Rect(8, y, width - 16, graph_height)
+        pygame.draw.rect(panel, (40, 40, 40), graph_rect)
+        scale = graph_height / (FRAME_BUDGET_MS * 2)
+        budget_y = graph_rect.bottom - int(FRAME_BUDGET_MS * scale)
+        frames = list(self.frame_history)[-graph_rect.width:]
+        for i, total in enumerate(frames):
+            bar = min(graph_height, max(1, int(total * scale)))
+            color = RED if total > FRAME_BUDGET_MS else GREEN
+            x = graph_rect.left + i
+            pygame.draw.line(panel, color, (x, graph_rect.bottom - 1), (x, graph_rect.bottom - bar))
+        pygame.draw.line(panel, YELLOW, (graph_rect.left, budget_y), (graph_rect.right - 1, budget_y))
+
+        return panel
+
+
+# Process-wide profiler used by the game loop
+profiler = FrameProfiler()
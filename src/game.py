@@ -3,16 +3,30 @@ Main Game class for Retro Space Shooter
 """
 import pygame
 from player import Player
-from projectile import Projectile
+from projectile import fire_projectile
+from projectile_engine import ProjectileEngine
 from enemy import Enemy, Asteroid, Debris
-from enemy_projectile import EnemyProjectile, Bomb
+from enemy_archetype import enemy_archetypes
+from enemy_projectile import LaserShot, Bomb, fire_laser
 from enemy_spawner import EnemySpawner
 from collision_system import CollisionSystem
-from explosion import Explosion
+from enemy_perception import EnemyPerception
+from enemy_movement import EnemyMovement
+from kinematics import Kinematics
+from explosion import Explosion, explosion_bank
+from powerup import PowerUp
+from entity_store import EntityStore
+from command_buffer import commands
 from wave_manager import WaveManager
 from wave_ui import WaveUI
+from hud import Hud
 from dialogue_system import DialogueSystem
 from space_background import SpaceBackground
+from asset_registry import assets
+from rotation_cache import rotation_cache
+from text_cache import text_cache
+from frame_profiler import profiler
+from system_scheduler import SystemScheduler
 from constants import *
 
 CYAN = (0, 255, 255)        # R-G-B
@@ -20,30 +34,49 @@ YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
 
 class Game:
-    def __init__(self, clock):
-        """Initialize the game"""
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Retro Space Shooter - Amazon Build Challenge")
+    def __init__(self, clock, headless=False):
+        """Initialize the game (headless draws into an offscreen surface and never flips)"""
+        self.headless = headless
+        if headless:
+            # Images still need a display mode to convert against (use the SDL dummy driver)
+            pygame.display.set_mode((1, 1))
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Retro Space Shooter - Amazon Build Challenge")
         self.clock = clock
         self.running = True
         
+        # Fixed-timestep loop: simulation runs in SIM_RATE steps, rendering blends the last two steps
+        self.sim_step = 1.0 / SIM_RATE
+        self.accumulator = 0.0      # Unsimulated time carried to the next frame (seconds)
+        self.interpolation = 1.0    # Blend factor between previous and current step (1.0 draws the current step)
+        self.previous_centers = {}  # sprite -> rect center before the latest step
+        
+        # Load and slice all sprite assets once (spawning then reuses shared surfaces)
+        assets.preload()
+        explosion_bank.preload()
+        enemy_archetypes.preload()
+        
         # Create space background
         self.background = SpaceBackground()
         
-        # Create sprite groups
-        self.all_sprites = pygame.sprite.Group()
-        self.projectiles = pygame.sprite.Group()
-        self.enemy_projectiles = pygame.sprite.Group()
-        self.bombs = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.asteroids = pygame.sprite.Group()
-        self.debris = pygame.sprite.Group()
-        self.explosions = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()  # Power-ups group
+        # Create typed entity groups (each sprite lives in exactly one, registration order is draw order)
+        self.entities = EntityStore()
+        self.asteroids = self.entities.register('asteroids', Asteroid)
+        self.debris = self.entities.register('debris', Debris)
+        self.powerups = self.entities.register('powerups', PowerUp)  # Power-ups group
+        self.enemies = self.entities.register('enemies', Enemy)
+        self.bombs = self.entities.register('bombs', Bomb)
+        self.explosions = self.entities.register('explosions', Explosion)
+        self.players = self.entities.register('player', Player)  # Drawn separately, on top
+        self.all_sprites = self.entities  # Group-compatible view over every typed group
+        self.projectiles = ProjectileEngine("projectiles")          # Player shots (structure of arrays, not sprites)
+        self.enemy_projectiles = ProjectileEngine("enemy_lasers")   # Enemy lasers
         
         # Create player
         self.player = Player()
-        self.all_sprites.add(self.player)
+        self.players.add(self.player)
         
         # Create enemy spawner
         self.enemy_spawner = EnemySpawner()
@@ -56,8 +89,15 @@ class Game:
         self.wave_manager = WaveManager()
         self.wave_ui = WaveUI()
         
+        # Create retained HUD
+        self.create_hud()
+        
         # Create dialogue system
         self.dialogue_system = DialogueSystem()
+        self.game_over_overlay = None  # Composed game over screen (cached per death)
+        self.game_over_overlay_key = None
+        self.game_over_dialogue_box = None  # Composed failure dialogue box (cached per line)
+        self.game_over_dialogue_key = None
         self.game_started = False  # Track if opening dialogue has been shown
         self.frame_count = 0  # Track frames for debug messages
         
@@ -68,6 +108,15 @@ class Game:
         # Create collision system
         self.collision_system = CollisionSystem()
         
+        # Per-frame enemy perception (squared distances to the player for every enemy at once)
+        self.enemy_perception = EnemyPerception()
+        
+        # Patrol steering pass (precomputed direction vectors)
+        self.enemy_movement = EnemyMovement()
+        
+        # Sub-pixel movement for enemies, bombs, asteroids, debris and power-ups
+        self.kinematics = Kinematics()
+        
         # Collision statistics
         self.collision_stats = {
             'player_collisions': 0,
@@ -85,6 +134,9 @@ class Game:
         self.game_over = False
         self.player_death_timer = 0  # Timer for player death animation
         
+        # Declare the frame's update and draw stages
+        self.create_systems()
+        
         # Start story mode
         if self.story_mode:
             # Start with opening dialogue instead of wave intro
@@ -109,6 +161,7 @@ class Game:
         
     def handle_events(self):
         """Handle game events"""
+        profiler.begin_frame()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -128,386 +181,493 @@ class Game:
                         # Handle wave progression
                         wave_info = self.wave_manager.get_wave_info()
                         if wave_info:
-                            if wave_info.get('wave_intro_active', False):
+                            if wave_info.wave_intro_active:
                                 # Start the wave from intro
-                                self.wave_manager.start_wave(wave_info['wave_number'])
-                            elif wave_info['wave_complete']:
+                                self.wave_manager.start_wave(wave_info.wave_number)
+                            elif wave_info.wave_complete:
                                 # Check for post-wave dialogue
-                                self.check_post_wave_dialogue(wave_info['wave_number'])
+                                self.check_post_wave_dialogue(wave_info.wave_number)
                                 # Advance to next wave
                                 if not self.wave_manager.next_wave():
                                     # All waves completed - boss battle time!
                                     self.dialogue_system.start_dialogue('after_wave_10')
-                            elif wave_info['wave_failed']:
+                            elif wave_info.wave_failed:
                                 # Show failure dialogue
                                 self.dialogue_system.start_dialogue('wave_failed')
-                            elif wave_info['story_complete']:
+                            elif wave_info.story_complete:
                                 # Start boss battle (TODO: implement boss)
                                 print("🏆 Boss battle would start here!")
                     elif event.key == pygame.K_r and self.story_mode:
                         # Retry wave in story mode
-                        wave_info = self.wave_manager.get_wave_info()
-                        if wave_info and wave_info['wave_failed']:
+                        if self.wave_manager.wave_failed:
                             self.wave_manager.restart_wave()
+                    elif event.key == pygame.K_c:
+                        # Debug: cycle collision mode (brute force / spatial hash / batched)
+                        mode = self.collision_system.cycle_collision_mode()
+                        print(f"💥 Collision mode: {mode}")
+                    elif event.key == pygame.K_F3:
+                        # Debug: toggle the frame profiler overlay
+                        enabled = profiler.toggle()
+                        print(f"⏱️ Frame profiler {'on' if enabled else 'off'}")
                     elif event.key == pygame.K_q and self.player.is_alive():
                         # Primary weapon (only if player is alive)
                         shot_data = self.player.shoot("primary")
                         if shot_data:
                             x, y, proj_type, direction = shot_data
-                            projectile = Projectile(x, y, proj_type, direction)
-                            self.projectiles.add(projectile)
-                            self.all_sprites.add(projectile)
+                            fire_projectile(self.projectiles, x, y, proj_type, direction)
                     elif event.key == pygame.K_e and self.player.is_alive():
                         # Secondary weapon (only if player is alive)
                         shot_data = self.player.shoot("secondary")
                         if shot_data:
                             x, y, proj_type, direction = shot_data
-                            projectile = Projectile(x, y, proj_type, direction)
-                            self.projectiles.add(projectile)
-                            self.all_sprites.add(projectile)
+                            fire_projectile(self.projectiles, x, y, proj_type, direction)
+        profiler.lap('events')
+    
+    def create_systems(self):
+        """Declare the update and draw stages in frame order (each runs exactly once per tick)"""
+        self.update_systems = SystemScheduler("update")
+        self.update_systems.add_stage('dialogue', self.update_dialogue)
+        self.update_systems.add_stage('player', self.update_player)
+        self.update_systems.add_stage('sprites', self.update_sprites)
+        self.update_systems.add_stage('enemy_ai', self.update_enemy_ai)
+        self.update_systems.add_stage('kinematics', self.update_kinematics)
+        self.update_systems.add_stage('explosions', self.update_explosions)
+        self.update_systems.add_stage('background', self.update_background)
+        self.update_systems.add_stage('immunity', self.update_immunity)
+        self.update_systems.add_stage('collisions', self.update_collisions)
+        self.update_systems.add_stage('waves', self.update_waves)
+        self.update_systems.add_stage('powerups', self.update_powerups)
+        self.update_systems.add_stage('commands', self.apply_commands)
+        
+        self.draw_systems = SystemScheduler("draw")
+        self.draw_systems.add_stage('backdrop', self.draw_backdrop)
+        self.draw_systems.add_stage('blits', self.draw_sprites)
+        self.draw_systems.add_stage('hud', self.draw_hud)
+        self.draw_systems.add_stage('overlays', self.draw_overlays)
+        self.draw_systems.add_stage('dialogue_box', self.draw_dialogue)
+        self.draw_systems.add_stage('scroll_zones', self.draw_scroll_zones)
+        self.draw_systems.add_stage('flip', self.flip)
+    
+    def tick(self, elapsed):
+        """Advance one rendered frame: run as many fixed sim steps as elapsed seconds cover, then draw"""
+        self.handle_events()
+        
+        self.accumulator += elapsed
+        steps = 0
+        while self.accumulator >= self.sim_step:
+            if steps == MAX_CATCH_UP_STEPS:
+                # Too far behind - drop the backlog instead of spiralling (the game slows down only here)
+                self.accumulator %= self.sim_step
+                break
+            self.save_previous_state()
+            self.update()
+            self.accumulator -= self.sim_step
+            steps += 1
+        
+        # Draw partway between the last two steps by the time left over
+        self.interpolation = self.accumulator / self.sim_step
+        self.draw()
+        self.interpolation = 1.0
+        return steps
+    
+    def save_previous_state(self):
+        """Remember sprite positions before a sim step so drawing can blend toward the new ones"""
+        self.previous_centers = {sprite: sprite.rect.center for sprite in self.entities}
     
     def update(self):
         """Update game state"""
         # Increment frame counter
         self.frame_count += 1
-        
-        # Update dialogue system
+        self.update_systems.run()
+    
+    def is_simulating(self):
+        """Game objects update only if player is alive or in endless mode"""
+        return self.player.is_alive() or not self.story_mode
+    
+    def is_wave_transition(self):
+        """Check for wave intro, completion or failure screens (story mode)"""
+        return self.story_mode and self.wave_manager.is_transition()
+    
+    def is_movement_disabled(self):
+        """Player movement is disabled during dialogue and wave transitions (story mode)"""
+        return self.story_mode and (self.dialogue_system.is_active() or self.is_wave_transition())
+    
+    def update_dialogue(self):
+        """Update dialogue and start wave 1 once the opening dialogue is done"""
         self.dialogue_system.update()
         
         # Check if opening dialogue is complete and start first wave
         if (self.story_mode and self.game_started and 
             not self.dialogue_system.is_active()):
-            wave_info = self.wave_manager.get_wave_info()
             # Start wave 1 intro if no wave is currently active or in intro
-            if (wave_info and not wave_info.get('wave_intro_active', False) and 
-                not wave_info.get('wave_active', False) and 
-                not wave_info.get('wave_complete', False) and
-                not wave_info.get('wave_failed', False)):
+            if self.wave_manager.is_idle():
                 # Opening dialogue finished, start wave 1 intro
                 # print("💬 Opening dialogue complete - Starting Wave 1 intro!")
                 self.wave_manager.start_wave_intro(1)
-        
-        # Update game objects only if player is alive or in endless mode
-        if self.player.is_alive() or not self.story_mode:
-            # Determine if player movement should be disabled
-            movement_disabled = False
-            if self.story_mode:
-                # Disable movement during dialogue
-                if self.dialogue_system.is_active():
-                    movement_disabled = True
-                
-                # Disable movement during wave transitions
-                wave_info = self.wave_manager.get_wave_info()
-                if wave_info:
-                    if (wave_info.get('wave_intro_active', False) or 
-                        wave_info.get('wave_complete', False) or 
-                        wave_info.get('wave_failed', False)):
-                        movement_disabled = True
-            
-            # Update all sprites with movement control
-            for sprite in self.all_sprites:
-                if sprite == self.player:
-                    # Update player with movement control
-                    sprite.update(movement_disabled)
-                else:
-                    # Update other sprites normally
-                    sprite.update()
+    
+    def update_player(self):
+        """Update player with movement control"""
+        if self.is_simulating():
+            self.player.update(self.is_movement_disabled())
+    
+    def update_sprites(self):
+        """Update projectiles, bombs, hazards and power-ups (enemies, explosions and player have their own stages)"""
+        if not self.is_simulating():
+            return
+        self.projectiles.update()
+        self.enemy_projectiles.update()
+        self.bombs.update()
+        self.asteroids.update()
+        self.debris.update()
+        self.powerups.update()
+    
+    def update_enemy_ai(self):
+        """Update enemies with AI (pass player position)"""
+        if self.is_simulating():
+            # Decide every enemy's AI state in one pass before they act
+            self.enemy_perception.update(self.enemies, self.player.rect)
             
-            # Update enemies with AI (pass player position)
+            # Steer every patrolling enemy in one pass
+            self.enemy_movement.update(self.enemies)
             for enemy in self.enemies:
                 actions = enemy.update(self.player.rect)
                 if actions:
-                    for action in actions:
-                        if isinstance(action, EnemyProjectile):
-                            self.enemy_projectiles.add(action)
-                            self.all_sprites.add(action)
-                        elif isinstance(action, Bomb):
-                            self.bombs.add(action)
-                            self.all_sprites.add(action)
-            
-            # Update enemy spawner
-            if self.story_mode:
-                # Story mode: Wave-based spawning (only if player alive)
-                self.wave_manager.update(self.enemies, self.all_sprites, self.player.is_alive())
-            else:
-                # Endless mode: Traditional spawning
-                self.enemy_spawner.update(self.enemies, self.asteroids, self.debris, self.all_sprites)
-            
-            # Update power-up spawner (only if player alive)
-            if self.player.is_alive():
-                self.powerup_spawner.update(self.powerups, self.all_sprites)
+                    self.spawn_enemy_actions(actions)
         else:
             # Player is dead in story mode - only update explosions and UI
             # Remove any remaining enemy projectiles and bombs when player dies
             if self.player_death_timer == 180:  # First frame of death
                 # print("🛑 Player died - stopping all enemy activity")
-                for projectile in self.enemy_projectiles:
-                    projectile.kill()
+                self.enemy_projectiles.empty()
                 for bomb in self.bombs:
                     bomb.kill()
-        
-        # Always update explosions
+    
+    def spawn_enemy_actions(self, actions):
+        """Spawn the lasers and bombs an enemy asked for this frame"""
+        for action in actions:
+            if isinstance(action, LaserShot):
+                fire_laser(self.enemy_projectiles, action)
+            elif isinstance(action, Bomb):
+                # Joins the bombs group at the end of the frame, not while enemies are being iterated
+                commands.spawn(self.bombs, action)
+    
+    def update_kinematics(self):
+        """Move every drifting sprite and enemy by its float velocity in one pass"""
+        if self.is_simulating():
+            self.kinematics.integrate(self.enemies, self.bombs, self.asteroids, self.debris, self.powerups)
+    
+    def update_explosions(self):
+        """Always update explosions"""
         self.explosions.update()
-        
-        # Get current key states and update background
-        keys = pygame.key.get_pressed()
-        
-        # Update background based on player position and key presses
-        if self.player.is_alive():
-            wave_info = self.wave_manager.get_wave_info() if self.story_mode else None
-            
-            # Check if player movement should be disabled
-            movement_disabled = False
-            if self.story_mode:
-                # Disable movement during dialogue
-                if self.dialogue_system.is_active():
-                    movement_disabled = True
-                
-                # Disable movement during wave transitions
-                elif wave_info:
-                    if (wave_info.get('wave_intro_active', False) or 
-                        wave_info.get('wave_complete', False) or 
-                        wave_info.get('wave_failed', False)):
-                        movement_disabled = True
-            
-            # Update background with movement control
-            if not movement_disabled:
-                self.background.update(self.player.rect, keys)
-            # If movement is disabled, don't update background (player can't move)
-        
-        # Update player immunity based on wave state
+    
+    def update_background(self):
+        """Update background based on player position and key presses"""
+        # If movement is disabled, don't update background (player can't move)
+        if self.player.is_alive() and not self.is_movement_disabled():
+            keys = pygame.key.get_pressed()
+            self.background.update(self.player.rect, keys)
+    
+    def update_immunity(self):
+        """Update player immunity based on wave state"""
         if self.story_mode and self.player.is_alive():
-            wave_info = self.wave_manager.get_wave_info()
-            if wave_info:
-                # Set immunity during wave transitions AND dialogue
-                should_be_immune = (self.dialogue_system.is_active() or
-                                  wave_info.get('wave_intro_active', False) or 
-                                  wave_info.get('wave_complete', False) or 
-                                  wave_info.get('wave_failed', False))
-                
-                # Only change immunity state if it's different
-                if should_be_immune != self.player.health_system.is_immune():
-                    self.player.health_system.set_immunity(should_be_immune)
-        
-        # Process all collisions (only if player is alive AND can take damage)
-        if self.player.is_alive():
-            wave_info = self.wave_manager.get_wave_info() if self.story_mode else None
-            
-            # Determine if player can take damage
-            can_take_damage = True
-            if self.story_mode and wave_info:
-                # Player is immune to damage during:
-                # - Wave introduction screens
-                # - Wave completion screens  
-                # - Wave failure screens
-                if (wave_info.get('wave_intro_active', False) or 
-                    wave_info.get('wave_complete', False) or 
-                    wave_info.get('wave_failed', False)):
-                    can_take_damage = False
-                    # print("🛡️ Player immune to damage during wave transition")
+            # Set immunity during wave transitions AND dialogue
+            should_be_immune = self.dialogue_system.is_active() or self.is_wave_transition()
             
-            if can_take_damage:
-                # Process all collisions normally
-                collision_results = self.collision_system.process_all_collisions(
-                    self.player, self.enemies, self.asteroids, self.debris, 
-                    self.projectiles, self.enemy_projectiles, self.bombs, self.powerups
-                )
-            else:
-                # Process only safe collisions (power-ups, no damage)
-                collision_results = self.collision_system.process_safe_collisions(
-                    self.player, self.powerups
-                )
-            
-            # Update collision statistics
-            for key, value in collision_results.items():
-                if key == 'explosions':
-                    # Add explosions to game
-                    for explosion in value:
-                        self.explosions.add(explosion)
-                        self.all_sprites.add(explosion)
-                        
-                        # Check if player died
-                        if explosion.explosion_type == "player":
-                            self.game_over = True
-                            self.player_death_timer = 180  # 3 seconds at 60 FPS
-                            
-                            # Trigger failure dialogue in story mode
-                            if self.story_mode:
-                                self.dialogue_system.start_dialogue('wave_failed')
-                                # print("💬 Player died - showing failure dialogue")
-                elif key in self.collision_stats:
-                    # Update collision statistics
-                    self.collision_stats[key] += value
-                    
-                    # Notify wave manager of enemy destruction
-                    if key == 'enemies_destroyed' and self.story_mode:
-                        for _ in range(value):
-                            self.wave_manager.enemy_destroyed()
-        else:
+            # Only change immunity state if it's different
+            if should_be_immune != self.player.health_system.is_immune():
+                self.player.health_system.set_immunity(should_be_immune)
+    
+    def update_collisions(self):
+        """Process all collisions (only if player is alive AND can take damage)"""
+        if not self.player.is_alive():
             # Player is dead, update death timer
             if self.player_death_timer > 0:
                 self.player_death_timer -= 1
+            return
+        
+        # Player is immune to damage during:
+        # - Wave introduction screens
+        # - Wave completion screens  
+        # - Wave failure screens
+        if not self.is_wave_transition():
+            # Process all collisions normally
+            collision_results = self.collision_system.process_all_collisions(
+                self.player, self.enemies, self.asteroids, self.debris, 
+                self.projectiles, self.enemy_projectiles, self.bombs, self.powerups
+            )
+        else:
+            # Process only safe collisions (power-ups, no damage)
+            collision_results = self.collision_system.process_safe_collisions(
+                self.player, self.powerups
+            )
         
-        # Update enemy spawner AFTER collision processing to get accurate player status
+        # Update collision statistics
+        for key, value in collision_results.items():
+            if key == 'explosions':
+                # Add explosions to game
+                for explosion in value:
+                    self.explosions.add(explosion)
+                    
+                    # Check if player died
+                    if explosion.explosion_type == "player":
+                        self.game_over = True
+                        self.player_death_timer = 180  # 3 seconds at 60 FPS
+                        
+                        # Trigger failure dialogue in story mode
+                        if self.story_mode:
+                            self.dialogue_system.start_dialogue('wave_failed')
+                            # print("💬 Player died - showing failure dialogue")
+            elif key in self.collision_stats:
+                # Update collision statistics
+                self.collision_stats[key] += value
+                
+                # Notify wave manager of enemy destruction
+                if key == 'enemies_destroyed' and self.story_mode:
+                    for _ in range(value):
+                        self.wave_manager.enemy_destroyed()
+    
+    def update_waves(self):
+        """Update enemy spawner AFTER collision processing to get accurate player status"""
         if self.story_mode:
             # Story mode: Wave-based spawning (pass player alive status)
             self.wave_manager.update(self.enemies, self.all_sprites, self.player.is_alive())
-        else:
+        elif self.is_simulating():
             # Endless mode: Traditional spawning
             self.enemy_spawner.update(self.enemies, self.asteroids, self.debris, self.all_sprites)
-        
-        # Update power-up spawner
-        self.powerup_spawner.update(self.powerups, self.all_sprites)
+    
+    def update_powerups(self):
+        """Update power-up spawner (only if player alive)"""
+        if self.player.is_alive():
+            self.powerup_spawner.update(self.powerups, self.all_sprites)
+    
+    def apply_commands(self):
+        """Apply the frame's deferred spawns and kills in one batch (the last update stage)"""
+        commands.flush()
     
     def draw(self):
         """Draw everything to the screen"""
-        # Draw background
+        self.draw_systems.run()
+        profiler.end_frame(self.get_entity_counts() if profiler.enabled else None)
+    
+    def draw_backdrop(self):
+        """Draw background"""
         self.background.draw(self.screen)
+    
+    def draw_sprites(self):
+        """Draw every entity type except the player (we'll draw player separately), then both projectile engines"""
+        screen = self.screen
+        groups = [group for group in self.entities.groups.values() if group is not self.players]
+        if self.interpolation >= 1.0:
+            for group in groups:
+                screen.blits([(sprite.image, sprite.rect) for sprite in group], False)
+            self.projectiles.draw(screen)
+            self.enemy_projectiles.draw(screen)
+            
+            # Draw player only if alive (explosion will show if dead)
+            self.player.draw(screen)
+            return
         
-        # Draw all sprites except player (we'll draw player separately)
-        for sprite in self.all_sprites:
-            if sprite != self.player:
-                self.screen.blit(sprite.image, sprite.rect)
+        get_draw_position = self.get_draw_position
+        for group in groups:
+            screen.blits([(sprite.image, get_draw_position(sprite)) for sprite in group], False)
+        self.projectiles.draw(screen, self.interpolation)
+        self.enemy_projectiles.draw(screen, self.interpolation)
         
         # Draw player only if alive (explosion will show if dead)
-        self.player.draw(self.screen)
+        if self.player.is_alive():
+            screen.blit(self.player.image, get_draw_position(self.player))
+    
+    def get_draw_position(self, sprite):
+        """Get the sprite's top-left blended between its previous and current step"""
+        rect = sprite.rect
+        previous = self.previous_centers.get(sprite)
+        if previous is None:
+            # Spawned during the latest step
+            return rect
+        
+        dx = rect.centerx - previous[0]
+        dy = rect.centery - previous[1]
+        if (not (dx or dy) or abs(dx) > MAX_INTERPOLATION_DISTANCE
+                or abs(dy) > MAX_INTERPOLATION_DISTANCE):
+            return rect
+        
+        # Step back from the current position by the part of the step not yet reached
+        behind = 1.0 - self.interpolation
+        return (rect.x - round(dx * behind), rect.y - round(dy * behind))
+    
+    def draw_hud(self):
+        """Draw HUD (debug stats and wave panel, re-rendered only when values change)"""
+        self.update_hud()
+        self.hud.draw(self.screen)
+    
+    def draw_overlays(self):
+        """Draw health bars, game over screen and wave UI"""
+        # Draw player health bar
+        self.player.draw_health(self.screen)
         
-        # Draw UI
-        fps = self.clock.get_fps()
-        fps_text = pygame.font.Font(None, 36).render(f"FPS: {int(fps)}", True, WHITE)
-        self.screen.blit(fps_text, (10, 10))
+        # Draw enemy health bars
+        for enemy in self.enemies:
+            enemy.draw_health(self.screen)
+        
+        # Draw game over screen if player is dead
+        if self.game_over:
+            self.draw_game_over_screen()
+        
+        # Draw wave UI in story mode
+        if self.story_mode:
+            self.draw_wave_ui()
+    
+    def draw_dialogue(self):
+        """Draw dialogue system (always on top)"""
+        self.dialogue_system.draw(self.screen)
+    
+    def draw_scroll_zones(self):
+        """Draw scroll zone indicators (more subtle)"""
+        pygame.draw.line(self.screen, (100, 100, 0), (0, self.background.upper_scroll_zone), (SCREEN_WIDTH, self.background.upper_scroll_zone), 1)
+        pygame.draw.line(self.screen, (100, 100, 0), (0, self.background.lower_scroll_zone), (SCREEN_WIDTH, self.background.lower_scroll_zone), 1)
+    
+    def flip(self):
+        """Present the frame (the only display flip per frame; headless never flips)"""
+        if not self.headless:
+            pygame.display.flip()
+    
+    def get_entity_counts(self):
+        """Get live sprite counts per group for the profiler overlay"""
+        return {
+            'all': len(self.entities),
+            'enemies': len(self.enemies),
+            'shots': len(self.projectiles),
+            'lasers': len(self.enemy_projectiles),
+            'bombs': len(self.bombs),
+            'rocks': len(self.asteroids) + len(self.debris),
+            'fx': len(self.explosions)
+        }
+    
+    def create_hud(self):
+        """Create the retained HUD widgets"""
+        self.hud = Hud()
+        self.hud.add_text('fps', (10, 10), 36, WHITE, HUD_FPS_REFRESH_HZ)
+        self.hud.add_text('scroll', (10, 50), 24, WHITE)
+        self.hud.add('instructions', lambda value: text_cache.render(value[0], 20, value[1]), (10, 80))
+        self.hud.add_text('projectiles', (10, 100), 20, WHITE)
+        self.hud.add_text('enemies', (10, 120), 20, WHITE)
+        self.hud.add_text('enemy_shots', (10, 140), 20, YELLOW)
+        self.hud.add_text('collisions', (10, 160), 20, GREEN)
+        self.hud.add_text('caches', (10, 180), 20, WHITE, HUD_STATS_REFRESH_HZ)
+        self.hud.add_text('powerups', (10, 200), 20, YELLOW)
+        self.hud.add_text('energy', (10, 220), 24, CYAN, HUD_WAVE_TIMER_REFRESH_HZ)
+        self.hud.add_text('bombs_shot', (10, 240), 20, ORANGE)
+        self.hud.add_text('cooldown', (10, 260), 20, RED)
+        self.wave_ui.add_widgets(self.hud)
+        self.hud.add('profiler', profiler.render, (SCREEN_WIDTH - 270, 180), HUD_PROFILER_REFRESH_HZ)
+    
+    def update_hud(self):
+        """Bind this frame's values to the HUD widgets"""
+        hud = self.hud
+        hud.set('fps', f"FPS: {int(self.clock.get_fps())}")
         
         # Show scroll info
         scroll_progress = self.background.get_scroll_progress()
-        scroll_text = pygame.font.Font(None, 24).render(f"Scroll: {scroll_progress:.1%}", True, WHITE)
-        self.screen.blit(scroll_text, (10, 50))
+        hud.set('scroll', f"Scroll: {scroll_progress:.1%}")
         
         # Show instructions
         player_y = self.player.rect.centery
         if player_y < self.background.upper_scroll_zone:
-            instruction_text = pygame.font.Font(None, 20).render("Hold W to scroll up!", True, YELLOW)
-            self.screen.blit(instruction_text, (10, 80))
+            hud.set('instructions', ("Hold W to scroll up!", YELLOW))
         elif player_y > self.background.lower_scroll_zone:
-            instruction_text = pygame.font.Font(None, 20).render("Hold S to scroll down!", True, YELLOW)
-            self.screen.blit(instruction_text, (10, 80))
+            hud.set('instructions', ("Hold S to scroll down!", YELLOW))
         else:
-            instruction_text = pygame.font.Font(None, 20).render("Q: Primary Fire | E: Secondary Fire", True, WHITE)
-            self.screen.blit(instruction_text, (10, 80))
+            hud.set('instructions', ("Q: Primary Fire | E: Secondary Fire", WHITE))
         
         # Show projectile count
-        projectile_count = len(self.projectiles)
-        proj_text = pygame.font.Font(None, 20).render(f"Projectiles: {projectile_count}", True, WHITE)
-        self.screen.blit(proj_text, (10, 100))
+        hud.set('projectiles', f"Projectiles: {len(self.projectiles)}")
         
         # Show enemy counts and AI status
-        enemy_count = len(self.enemies)
-        asteroid_count = len(self.asteroids)
-        debris_count = len(self.debris)
-        enemy_projectile_count = len(self.enemy_projectiles)
-        bomb_count = len(self.bombs)
-        
-        enemy_text = pygame.font.Font(None, 20).render(f"Enemies: {enemy_count} | Asteroids: {asteroid_count} | Debris: {debris_count}", True, WHITE)
-        self.screen.blit(enemy_text, (10, 120))
-        
-        ai_text = pygame.font.Font(None, 20).render(f"Enemy Shots: {enemy_projectile_count} | Bombs: {bomb_count}", True, YELLOW)
-        self.screen.blit(ai_text, (10, 140))
+        hud.set('enemies', f"Enemies: {len(self.enemies)} | Asteroids: {len(self.asteroids)} | Debris: {len(self.debris)}")
+        hud.set('enemy_shots', f"Enemy Shots: {len(self.enemy_projectiles)} | Bombs: {len(self.bombs)}")
         
         # Show collision statistics
-        collision_text = pygame.font.Font(None, 20).render(
-            f"Collisions: {self.collision_stats['player_collisions']} | Hits: {self.collision_stats['projectile_hits']} | Destroyed: {self.collision_stats['enemies_destroyed']}",
-            True, GREEN
-        )
-        self.screen.blit(collision_text, (10, 160))
+        hud.set('collisions', f"Collisions: {self.collision_stats['player_collisions']} | Hits: {self.collision_stats['projectile_hits']} | Destroyed: {self.collision_stats['enemies_destroyed']} | Mode (C): {self.collision_system.get_collision_mode()}")
+        
+        # Show asset, rotation and text cache statistics (misses mean spawning touched the filesystem)
+        asset_stats = assets.get_stats()
+        rotation_stats = rotation_cache.get_stats()
+        text_stats = text_cache.get_stats()
+        hud.set('caches', f"Assets: {asset_stats['hits']} hits | {asset_stats['misses']} misses | Rotations: {rotation_stats['hit_rate']:.0%} hit ({rotation_stats['size']} cached) | Text: {text_stats['hit_rate']:.0%} hit")
         
         # Show power-up statistics
         if self.collision_stats['powerups_collected'] > 0:
-            powerup_text = pygame.font.Font(None, 20).render(
-                f"🎁 Power-ups: {self.collision_stats['powerups_collected']}", 
-                True, YELLOW
-            )
-            self.screen.blit(powerup_text, (10, 200))
+            hud.set('powerups', f"🎁 Power-ups: {self.collision_stats['powerups_collected']}")
+        else:
+            hud.hide('powerups')
         
         # Show energy effect status
         if self.player.has_energy_effect():
-            energy_time = self.player.get_energy_time_remaining()
-            energy_text = pygame.font.Font(None, 24).render(
-                f"⚡ ENERGY BOOST: {energy_time:.1f}s", 
-                True, CYAN
-            )
-            self.screen.blit(energy_text, (10, 220))
+            hud.set('energy', f"⚡ ENERGY BOOST: {self.player.get_energy_time_remaining():.1f}s")
+        else:
+            hud.hide('energy')
         
         # Show bombs shot statistics
         if self.collision_stats['bombs_shot'] > 0:
-            bombs_shot_text = pygame.font.Font(None, 20).render(
-                f"🎯 Bombs Shot: {self.collision_stats['bombs_shot']}", 
-                True, ORANGE
-            )
-            self.screen.blit(bombs_shot_text, (10, 240))
+            hud.set('bombs_shot', f"🎯 Bombs Shot: {self.collision_stats['bombs_shot']}")
+        else:
+            hud.hide('bombs_shot')
         
         # Show shooting cooldown
         if self.player.shooting_cooldown > 0:
-            cooldown_text = pygame.font.Font(None, 20).render(f"Cooldown: {self.player.shooting_cooldown}", True, RED)
-            self.screen.blit(cooldown_text, (10, 260))
-        
-        # Draw player health bar
-        self.player.draw_health(self.screen)
-        
-        # Draw enemy health bars
-        for enemy in self.enemies:
-            enemy.draw_health(self.screen)
-        
-        # Draw game over screen if player is dead
-        if self.game_over:
-            self.draw_game_over_screen()
-        
-        # Draw wave UI in story mode
-        if self.story_mode:
-            self.draw_wave_ui()
-        
-        # Draw dialogue system (always on top)
-        self.dialogue_system.draw(self.screen)
+            hud.set('cooldown', f"Cooldown: {self.player.shooting_cooldown}")
+        else:
+            hud.hide('cooldown')
         
-        # Draw scroll zone indicators (more subtle)
-        pygame.draw.line(self.screen, (100, 100, 0), (0, self.background.upper_scroll_zone), (SCREEN_WIDTH, self.background.upper_scroll_zone), 1)
-        pygame.draw.line(self.screen, (100, 100, 0), (0, self.background.lower_scroll_zone), (SCREEN_WIDTH, self.background.lower_scroll_zone), 1)
+        # Wave panel and progress bars only show during active story mode gameplay
+        if self.story_mode and self.player.is_alive() and not self.wave_manager.wave_intro_active:
+            self.wave_ui.update_widgets(hud, self.wave_manager)
+        else:
+            hud.hide('wave_panel', 'wave_progress')
         
-        pygame.display.flip()
+        # Profiler overlay (F3) - re-rendered at most HUD_PROFILER_REFRESH_HZ times a second
+        hud.set('profiler', profiler.frame_index if profiler.enabled else None)
     
     def draw_game_over_screen(self):
         """Draw game over screen with failure dialogue"""
+        # Overlay, title and statistics are composed once per death
+        key = (self.collision_stats['enemies_destroyed'], self.collision_stats['projectile_hits'])
+        if key != self.game_over_overlay_key:
+            self.game_over_overlay = self.build_game_over_overlay()
+            self.game_over_overlay_key = key
+        self.screen.blit(self.game_over_overlay, (0, 0))
+        
+        # Restart instruction (only part that changes once the death timer runs out)
+        if self.player_death_timer <= 0:
+            restart_text = text_cache.render("Press R to Restart or ESC to Quit", 24, YELLOW)
+            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20))
+            self.screen.blit(restart_text, restart_rect)
+        
+        # Draw failure dialogue at bottom if active (in story mode)
+        if self.story_mode and self.dialogue_system.is_active():
+            self.draw_game_over_dialogue()
+    
+    def build_game_over_overlay(self):
+        """Compose the game over overlay with title and statistics"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 128))
         
         # Game Over text
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 36)
-        font_small = pygame.font.Font(None, 24)
-        
-        game_over_text = font_large.render("GAME OVER", True, RED)
+        game_over_text = text_cache.render("GAME OVER", 72, RED)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
-        self.screen.blit(game_over_text, game_over_rect)
+        overlay.blit(game_over_text, game_over_rect)
         
         # Statistics
-        stats_text = font_medium.render(f"Enemies Destroyed: {self.collision_stats['enemies_destroyed']}", True, WHITE)
+        stats_text = text_cache.render(f"Enemies Destroyed: {self.collision_stats['enemies_destroyed']}", 36, WHITE)
         stats_rect = stats_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
-        self.screen.blit(stats_text, stats_rect)
+        overlay.blit(stats_text, stats_rect)
         
-        hits_text = font_medium.render(f"Total Hits: {self.collision_stats['projectile_hits']}", True, WHITE)
+        hits_text = text_cache.render(f"Total Hits: {self.collision_stats['projectile_hits']}", 36, WHITE)
         hits_rect = hits_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 20))
-        self.screen.blit(hits_text, hits_rect)
-        
-        # Restart instruction
-        if self.player_death_timer <= 0:
-            restart_text = font_small.render("Press R to Restart or ESC to Quit", True, YELLOW)
-            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20))
-            self.screen.blit(restart_text, restart_rect)
+        overlay.blit(hits_text, hits_rect)
         
-        # Draw failure dialogue at bottom if active (in story mode)
-        if self.story_mode and self.dialogue_system.is_active():
-            self.draw_game_over_dialogue()
+        return overlay
     
     def draw_game_over_dialogue(self):
         """Draw the failure dialogue at the bottom of the game over screen"""
@@ -521,13 +681,25 @@ class Game:
         # Dialogue box dimensions (smaller than normal dialogue)
         box_height = 100
         box_margin = 20
-        text_margin = 12
         
         # Calculate dialogue box position at bottom
         box_y = SCREEN_HEIGHT - box_height - box_margin
         box_rect = pygame.Rect(box_margin, box_y, 
                               SCREEN_WIDTH - (box_margin * 2), box_height)
         
+        # Reuse the composed box while the same line is showing
+        box_key = (current_speaker, current_text)
+        if box_key != self.game_over_dialogue_key:
+            self.game_over_dialogue_box = self.build_game_over_dialogue_box(box_rect, current_speaker, current_text)
+            self.game_over_dialogue_key = box_key
+        
+        # Draw dialogue box to screen
+        self.screen.blit(self.game_over_dialogue_box, box_rect)
+    
+    def build_game_over_dialogue_box(self, box_rect, current_speaker, current_text):
+        """Compose the failure dialogue box surface for one line"""
+        text_margin = 12
+        
         # Create dialogue box surface with transparency
         dialogue_surface = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
         dialogue_surface.fill((0, 0, 0, 220))  # Slightly more opaque for game over
@@ -536,73 +708,51 @@ class Game:
         pygame.draw.rect(dialogue_surface, (255, 100, 100), 
                         (0, 0, box_rect.width, box_rect.height), 3)
         
-        # Fonts for game over dialogue
-        font_medium = pygame.font.Font(None, 24)
-        font_small = pygame.font.Font(None, 20)
-        
         # Speaker name (Duke in red for failure)
         speaker_color = (255, 150, 150)  # Light red for Duke's failure message
-        speaker_surface = font_medium.render(f"{current_speaker.upper()}:", True, speaker_color)
+        speaker_surface = text_cache.render(f"{current_speaker.upper()}:", 24, speaker_color)
         dialogue_surface.blit(speaker_surface, (text_margin, text_margin))
         
         # Dialogue text (word wrap)
         text_y = text_margin + 25
         max_width = box_rect.width - (text_margin * 2)
         
-        # Simple word wrapping for failure message
-        words = current_text.split(' ')
-        lines = []
-        current_line_text = ""
-        
-        for word in words:
-            test_line = current_line_text + word + " "
-            test_surface = font_small.render(test_line, True, WHITE)
-            
-            if test_surface.get_width() <= max_width:
-                current_line_text = test_line
-            else:
-                if current_line_text:
-                    lines.append(current_line_text.strip())
-                    current_line_text = word + " "
-                else:
-                    lines.append(word)
-                    current_line_text = ""
-        
-        if current_line_text:
-            lines.append(current_line_text.strip())
+        # Simple word wrapping for failure message (layout is cached per line and width)
+        lines = text_cache.wrap(current_text, max_width, 20)
         
         # Draw text lines
         for i, line in enumerate(lines):
             if text_y + (i * 18) < box_rect.height - 25:  # Don't overflow box
-                text_surface = font_small.render(line, True, WHITE)
+                text_surface = text_cache.render(line, 20, WHITE)
                 dialogue_surface.blit(text_surface, (text_margin, text_y + (i * 18)))
         
         # Draw continue instruction
         instruction = "Press SPACE to continue"
-        instruction_surface = font_small.render(instruction, True, YELLOW)
+        instruction_surface = text_cache.render(instruction, 20, YELLOW)
         instruction_rect = instruction_surface.get_rect()
         instruction_rect.bottomright = (box_rect.width - text_margin, box_rect.height - text_margin)
         dialogue_surface.blit(instruction_surface, instruction_rect)
         
-        # Draw dialogue box to screen
-        self.screen.blit(dialogue_surface, box_rect)
+        return dialogue_surface
     
     def restart_game(self):
         """Restart the game"""
-        # Clear all sprite groups
-        self.all_sprites.empty()
+        # Drop deferred spawns/kills that refer to the old game (pending pooled spawns go back to their pools)
+        commands.clear()
+        
+        # Kill pooled sprites so they return to their pools
+        for group in (self.bombs, self.explosions):
+            for sprite in group.sprites():
+                sprite.kill()
+        
+        # Clear every entity group and both projectile engines
+        self.entities.empty()
         self.projectiles.empty()
         self.enemy_projectiles.empty()
-        self.bombs.empty()
-        self.enemies.empty()
-        self.asteroids.empty()
-        self.debris.empty()
-        self.explosions.empty()
-        self.powerups.empty()
         
         # Reset player
         self.player = Player()
-        self.all_sprites.add(self.player)
+        self.players.add(self.player)
         
         # Reset game state
         self.game_over = False
@@ -639,14 +789,11 @@ class Game:
             return
             
         # Draw wave introduction screen
-        if wave_info.get('wave_intro_active', False):
+        if wave_info.wave_intro_active:
             self.wave_ui.draw_wave_intro(self.screen, wave_info)
             return
         
-        # Draw main wave UI during active gameplay
-        if wave_info['wave_active']:
-            self.wave_ui.draw_wave_info(self.screen, self.wave_manager)
-            self.wave_ui.draw_progress_bars(self.screen, self.wave_manager)
+        # Main wave UI during active gameplay is part of the HUD (see update_hud)
         
         # Draw wave status screens
         self.wave_ui.draw_wave_status(self.screen, self.wave_manager)
@@ -658,7 +805,5 @@ class Game:
         print("Press ESC to quit")
         
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            # Sim time advances by real elapsed time, independent of render cost
+            self.tick(self.clock.tick(RENDER_FPS) / 1000)
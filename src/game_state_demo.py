@@ -79,7 +79,6 @@ def demo_game_state_management():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                 elif event.key == pygame.K_e and game.player.is_alive():
                     # Secondary weapon
                     shot_data = game.player.shoot("secondary")
@@ -88,7 +87,6 @@ def demo_game_state_management():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
         
         game.update()
         game.draw()
@@ -112,7 +110,7 @@ def demo_game_state_management():
                     print(f"  State: WAVE INTRO - Player locked, press SPACE to begin")
                 elif wave_info['wave_active']:
                     print(f"  State: WAVE ACTIVE - Player can move and fight")
-                    print(f"  Time: {wave_info['time_remaining']:.1f}s remaining")
+                    print(f"  Time: {game.wave_manager.get_time_remaining():.1f}s remaining")
                 elif wave_info['wave_complete']:
                     print(f"  State: WAVE COMPLETE - Press SPACE to continue")
                 else:
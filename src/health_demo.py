@@ -84,7 +84,6 @@ def demo_health_system():
                         from projectile import Projectile
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                 elif event.key == pygame.K_e and game.player.is_alive():
                     # Secondary weapon
                     shot_data = game.player.shoot("secondary")
@@ -93,7 +92,6 @@ def demo_health_system():
                         from projectile import Projectile
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
         
         game.update()
         game.draw()
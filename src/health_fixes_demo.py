@@ -77,7 +77,6 @@ def demo_health_fixes():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                 elif event.key == pygame.K_e and game.player.is_alive():
                     # Secondary weapon
                     shot_data = game.player.shoot("secondary")
@@ -86,7 +85,6 @@ def demo_health_fixes():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
         
         game.update()
         game.draw()
@@ -94,7 +92,7 @@ def demo_health_fixes():
         # Track timer behavior and player death
         wave_info = game.wave_manager.get_wave_info()
         if wave_info and wave_info['wave_active']:
-            current_timer = wave_info['time_remaining']
+            current_timer = game.wave_manager.get_time_remaining()
             player_alive = game.player.is_alive()
             current_health = game.player.health_system.current_health
             
@@ -132,7 +130,7 @@ def demo_health_fixes():
                     print(f"  State: WAVE INTRO")
                 elif wave_info['wave_active']:
                     print(f"  State: WAVE ACTIVE")
-                    print(f"  Timer: {wave_info['time_remaining']:.1f}s remaining")
+                    print(f"  Timer: {game.wave_manager.get_time_remaining():.1f}s remaining")
                     if death_frame is not None:
                         print(f"  🛑 Timer should be FROZEN (death at frame {death_frame})")
                 elif wave_info['wave_complete']:
@@ -3,6 +3,7 @@ Health system for Retro Space Shooter
 Handles player and enemy health with visual health bars
 """
 import pygame
+from text_cache import text_cache
 from constants import *
 
 class HealthBar:
@@ -67,9 +68,8 @@ class HealthBar:
         
         # Draw text if enabled
         if self.show_text:
-            font = pygame.font.Font(None, 20)
             text = f"{self.current_health}/{self.max_health}"
-            text_surface = font.render(text, True, WHITE)
+            text_surface = text_cache.render(text, 20, WHITE)
             text_x = self.x + self.width + 5
             text_y = self.y - 2
             screen.blit(text_surface, (text_x, text_y))
@@ -150,8 +150,7 @@ class PlayerHealth:
     def draw(self, screen):
         """Draw player health bar"""
         # Draw "HEALTH" label
-        font = pygame.font.Font(None, 24)
-        label = font.render("HEALTH", True, WHITE)
+        label = text_cache.render("HEALTH", 24, WHITE)
         screen.blit(label, (10, SCREEN_HEIGHT - 55))
         
         # Draw health bar
@@ -159,7 +158,7 @@ class PlayerHealth:
         
         # Draw invulnerability indicator
         if self.is_invulnerable():
-            inv_text = pygame.font.Font(None, 16).render("INVULNERABLE", True, YELLOW)
+            inv_text = text_cache.render("INVULNERABLE", 16, YELLOW)
             screen.blit(inv_text, (10, SCREEN_HEIGHT - 75))
 
 
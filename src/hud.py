@@ -0,0 +1,81 @@
+"""
+Retained HUD for Retro Space Shooter
+Widgets keep their rendered surface and only re-render when their bound value changes
+"""
+import pygame
+from text_cache import text_cache
+from constants import *
+
+class HudWidget:
+    def __init__(self, render_func, pos, max_rate=None):
+        """Initialize a widget drawn by render_func(value) at pos"""
+        self.render_func = render_func
+        self.pos = pos
+        # Minimum milliseconds between re-renders (None re-renders on every change)
+        self.refresh_interval = 1000 / max_rate if max_rate else 0
+
+        self.value = None         # Value the current surface was rendered from
+        self.surface = None       # Cached rendered surface (None while hidden)
+        self.last_refresh = None  # Tick of the last re-render
+
+        # Statistics
+        self.renders = 0
+
+    def set(self, value, now):
+        """Bind a new value, re-rendering if it changed and the refresh rate allows"""
+        if value is None:
+            # Hidden - drop the surface so the widget shows fresh when it returns
+            self.value = None
+            self.surface = None
+            return
+
+        if value == self.value:
+            return
+
+        # Throttled widgets keep showing the stale surface until their interval passes
+        if (self.surface is not None and self.refresh_interval
+                and now - self.last_refresh < self.refresh_interval):
+            return
+
+        self.surface = self.render_func(value)
+        self.value = value
+        self.last_refresh = now
+        self.renders += 1
+
+
+class Hud:
+    def __init__(self):
+        """Initialize an empty HUD"""
+        self.widgets = {}  # name -> HudWidget, in draw order
+
+    def add(self, name, render_func, pos, max_rate=None):
+        """Add a widget that renders its value with render_func"""
+        widget = HudWidget(render_func, pos, max_rate)
+        self.widgets[name] = widget
+        return widget
+
+    def add_text(self, name, pos, size, color, max_rate=None):
+        """Add a single line of text (the bound value is the string)"""
+        return self.add(name, lambda text: text_cache.render(text, size, color), pos, max_rate)
+
+    def set(self, name, value):
+        """Bind a widget's value for this frame (None hides the widget)"""
+        self.widgets[name].set(value, pygame.time.get_ticks())
+
+    def hide(self, *names):
+        """Hide widgets until their next value is bound"""
+        for name in names:
+            self.widgets[name].set(None, 0)
+
+    def draw(self, screen):
+        """Composite every visible widget in one blits call"""
+        screen.blits([(widget.surface, widget.pos) for widget in self.widgets.values()
+                      if widget.surface is not None], False)
+
+    def get_stats(self):
+        """Get HUD statistics"""
+        return {
+            'widgets': len(self.widgets),
+            'visible': sum(1 for widget in self.widgets.values() if widget.surface is not None),
+            'renders': sum(widget.renders for widget in self.widgets.values())
+        }
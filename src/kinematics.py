@@ -0,0 +1,62 @@
+"""
+Kinematics for Retro Space Shooter
+Float positions and velocities for drifting sprites, integrated in one pass per frame and synced onto their rects
+"""
+import math
+
+class Body:
+    """Sub-pixel center position and per-frame velocity of one sprite"""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'offset_x', 'offset_y', 'synced')
+
+    def __init__(self, rect, vx=0.0, vy=0.0):
+        self.reset(rect, vx, vy)
+
+    def reset(self, rect, vx=0.0, vy=0.0):
+        """Start from the rect's center with a new velocity (pooled sprites reuse their body)"""
+        self.x, self.y = rect.center
+        self.vx = vx
+        self.vy = vy
+        self.offset_x = 0.0  # Drawn offset from the integrated position (e.g. bobbing), not integrated
+        self.offset_y = 0.0
+        self.synced = rect.center  # Rect center last written by integrate
+
+    def stop(self):
+        """Zero the velocity"""
+        self.vx = self.vy = 0.0
+
+
+class Kinematics:
+    def __init__(self):
+        """Initialize the integrator"""
+        # Statistics
+        self.frames = 0
+        self.bodies = 0  # Bodies integrated last frame
+
+    def integrate(self, *groups):
+        """Advance every body in the groups by one frame and write rect centers back"""
+        floor = math.floor
+        count = 0
+        for group in groups:
+            for sprite in group:
+                body = sprite.body
+                rect = sprite.rect
+
+                # Adopt the rect if something else moved it (collision pushes, knockback)
+                if rect.center != body.synced:
+                    body.x = rect.centerx - body.offset_x
+                    body.y = rect.centery - body.offset_y
+
+                x = body.x = body.x + body.vx
+                y = body.y = body.y + body.vy
+                rect.center = body.synced = (floor(x + body.offset_x), floor(y + body.offset_y))
+            count += len(group)
+
+        self.frames += 1
+        self.bodies = count
+
+    def get_stats(self):
+        """Get integrator statistics"""
+        return {
+            'frames': self.frames,
+            'bodies': self.bodies
+        }
@@ -6,6 +6,7 @@ Main game entry point
 import pygame
 import sys
 from game import Game
+from constants import RENDER_FPS
 import asyncio
 
 pygame.init()
@@ -20,10 +21,11 @@ async def main():
     global running, game, clock
     
     while running:
-        # Handle events, update and draw game
-        game.handle_events()
-        game.update()
-        game.draw()
+        # Control frame rate (returns milliseconds since the last frame)
+        elapsed = clock.tick(RENDER_FPS) / 1000
+
+        # Handle events, run fixed sim steps for the elapsed time and draw interpolated
+        game.tick(elapsed)
 
         # game.run()
 
@@ -31,12 +33,7 @@ async def main():
         if not game.running:
             running = False
         
-        # Update display
-        pygame.display.flip()
-        pygame.display.update()
-
-        # Control frame rate
-        clock.tick(60)
+        # Game.draw presents the frame (one flip per frame)
 
         await asyncio.sleep(0)
 
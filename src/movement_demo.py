@@ -57,7 +57,6 @@ def demo_persistent_facing():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                         print(f"🔫 Fired {direction} while facing {game.player.last_facing_direction}")
         
         game.update()
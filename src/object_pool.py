@@ -0,0 +1,61 @@
+"""
+Object Pool system for Retro Space Shooter
+Recycles short-lived sprites (projectiles, lasers, bombs, explosions) instead of reallocating them
+"""
+
+class ObjectPool:
+    def __init__(self, object_class, name):
+        """Initialize an empty pool for a sprite class with a reset() method"""
+        self.object_class = object_class
+        self.name = name
+        self.free = []  # Released objects ready for reuse
+
+        # Statistics
+        self.created = 0     # Objects allocated by the pool
+        self.reused = 0      # Acquisitions served from the free list
+        self.live = 0        # Objects currently handed out
+        self.high_water = 0  # Most objects handed out at once
+
+    def acquire(self, *args):
+        """Get an object initialized with args, recycling a released one if possible"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.object_class(*args)
+            self.created += 1
+
+        obj.in_pool = False
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        return obj
+
+    def release(self, obj):
+        """Return an object to the pool (safe to call more than once)"""
+        if getattr(obj, 'in_pool', True):
+            return  # Already released, or never handed out by this pool
+        obj.in_pool = True
+        self.free.append(obj)
+        self.live -= 1
+
+    def prewarm(self, count, *args):
+        """Allocate objects up front so the free list can serve count live objects"""
+        missing = count - (len(self.free) + self.live)
+        for _ in range(missing):
+            obj = self.object_class(*args)
+            obj.in_pool = True
+            self.free.append(obj)
+            self.created += 1
+
+    def get_stats(self):
+        """Get pool statistics"""
+        return {
+            'name': self.name,
+            'created': self.created,
+            'reused': self.reused,
+            'live': self.live,
+            'free': len(self.free),
+            'high_water': self.high_water
+        }
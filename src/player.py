@@ -4,6 +4,7 @@ Player class for Retro Space Shooter
 import pygame
 import os
 from health_system import PlayerHealth
+from asset_registry import assets
 from constants import *
 
 class Player(pygame.sprite.Sprite):
@@ -51,33 +52,28 @@ class Player(pygame.sprite.Sprite):
         
     def load_sprites(self):
         """Load and cut the player sprite sheet"""
-        # Load the sprite sheet
+        # Get the 5 sprite sheet frames (loaded and sliced once by the registry)
         sprite_sheet_path = "assets/images/Player01-Sheet.png"
-        sprite_sheet = pygame.image.load(sprite_sheet_path).convert_alpha()
-        
-        # Get dimensions - the sheet appears to have 5 frames horizontally
-        sheet_width = sprite_sheet.get_width()
-        sheet_height = sprite_sheet.get_height()
-        frame_width = sheet_width // 5  # 5 frames
-        frame_height = sheet_height
+        frames = assets.get_frames(sprite_sheet_path, 5)
+        frame_width, frame_height = frames[0].get_size()
         
         # Cut out individual sprites
         self.sprites = {}
         
         # Frame 0: Left lean 2
-        self.sprites['left2'] = sprite_sheet.subsurface((0, 0, frame_width, frame_height))
+        self.sprites['left2'] = frames[0]
         
         # Frame 1: Left lean 1
-        self.sprites['left1'] = sprite_sheet.subsurface((frame_width, 0, frame_width, frame_height))
+        self.sprites['left1'] = frames[1]
         
         # Frame 2: Center (neutral)
-        self.sprites['center'] = sprite_sheet.subsurface((frame_width * 2, 0, frame_width, frame_height))
+        self.sprites['center'] = frames[2]
         
         # Frame 3: Right lean 1
-        self.sprites['right1'] = sprite_sheet.subsurface((frame_width * 3, 0, frame_width, frame_height))
+        self.sprites['right1'] = frames[3]
         
         # Frame 4: Right lean 2
-        self.sprites['right2'] = sprite_sheet.subsurface((frame_width * 4, 0, frame_width, frame_height))
+        self.sprites['right2'] = frames[4]
         
         # Create up/down facing sprites by rotating the center sprite
         self.sprites['up'] = self.sprites['center']  # Center sprite already faces up
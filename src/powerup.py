@@ -6,6 +6,9 @@ Energy Container: Enhances projectile destruction with area effects
 import pygame
 import random
 import math
+from asset_registry import assets
+from kinematics import Body
+from command_buffer import commands
 from constants import *
 
 class PowerUp(pygame.sprite.Sprite):
@@ -65,17 +68,16 @@ class PowerUp(pygame.sprite.Sprite):
             self.drift_x = speed * math.cos(angle)
             self.drift_y = speed * math.sin(angle)
         
-        # Store original position for floating calculation
-        self.base_x = float(self.rect.centerx)
-        self.base_y = float(self.rect.centery)
+        # Drift is integrated by the game's kinematics pass, bobbing is drawn as an offset from it
+        self.body = Body(self.rect, self.drift_x, self.drift_y)
         
     def load_sprite(self):
         """Load the appropriate sprite for this power-up type"""
         try:
             if self.powerup_type == "health":
-                self.image = pygame.image.load("assets/images/HPContainer.png").convert_alpha()
+                self.image = assets.get_image("assets/images/HPContainer.png")
             elif self.powerup_type == "energy":
-                self.image = pygame.image.load("assets/images/EnergyContainer.png").convert_alpha()
+                self.image = assets.get_image("assets/images/EnergyContainer.png")
             else:
                 # Fallback - create a colored square
                 self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
@@ -92,19 +94,10 @@ class PowerUp(pygame.sprite.Sprite):
             pygame.draw.rect(self.image, color, (0, 0, 24, 24))
     
     def update(self):
-        """Update power-up floating movement and lifetime"""
-        # Natural drift movement
-        self.base_x += self.drift_x
-        self.base_y += self.drift_y
-        
+        """Update power-up floating animation and lifetime (the kinematics pass applies drift)"""
         # Floating animation (gentle up/down bobbing)
         self.float_offset += self.float_speed
-        import math
-        float_offset_y = self.float_amplitude * math.sin(self.float_offset)
-        
-        # Apply both drift and floating
-        self.rect.centerx = int(self.base_x)
-        self.rect.centery = int(self.base_y + float_offset_y)
+        self.body.offset_y = self.float_amplitude * math.sin(self.float_offset)
         
         # Update lifetime
         self.lifetime -= 1
@@ -169,13 +162,16 @@ class EnergyEffect:
             return 'horizontal'
     
     def apply_area_effect(self, hit_enemy, all_enemies, explosions_list):
-        """Apply area-of-effect destruction based on the hit enemy's position"""
+        """Apply area-of-effect destruction based on the hit enemy's position (kills are deferred to the frame's command buffer)"""
         if not self.active:
             return []
         
         effect_type = self.get_random_effect()
         destroyed_enemies = []
         
+        # Enemies already destroyed this frame stay in the group until the command buffer flushes
+        all_enemies = [enemy for enemy in all_enemies if not commands.is_despawning(enemy)]
+        
         hit_x, hit_y = hit_enemy.rect.centerx, hit_enemy.rect.centery
         
         # print(f"⚡ Energy effect triggered: {effect_type.upper()} at ({hit_x}, {hit_y})")
@@ -210,10 +206,10 @@ class EnergyEffect:
         
         # Create explosions for all destroyed enemies
         for enemy in destroyed_enemies:
-            from explosion import Explosion
-            explosion = Explosion(enemy.rect.centerx, enemy.rect.centery, "energy_blast")
+            from explosion import explosion_pool
+            explosion = explosion_pool.acquire(enemy.rect.centerx, enemy.rect.centery, "energy_blast")
             explosions_list.append(explosion)
-            enemy.kill()
+            commands.despawn(enemy)
         
         # print(f"⚡ Energy effect destroyed {len(destroyed_enemies)} enemies with {effect_type}")
         return destroyed_enemies
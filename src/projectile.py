@@ -2,24 +2,30 @@
 Projectile system for Retro Space Shooter
 """
 import pygame
+from asset_registry import assets
+from rotation_cache import rotation_cache
+from object_pool import ObjectPool
 from constants import *
 
 class Projectile(pygame.sprite.Sprite):
     def __init__(self, x, y, projectile_type="primary", direction="up"):
         """Initialize a projectile"""
         super().__init__()
+        self.reset(x, y, projectile_type, direction)
         
+    def reset(self, x, y, projectile_type="primary", direction="up"):
+        """(Re)initialize projectile state - also used when recycled from the pool"""
         self.projectile_type = projectile_type
         self.direction = direction
         
         # Load appropriate projectile image
         if projectile_type == "primary":
             # Q key - Blue laser (Projectile01)
-            self.original_image = pygame.image.load("assets/images/Projectile01.png").convert_alpha()
+            self.original_image = assets.get_image("assets/images/Projectile01.png")
             self.speed = PROJECTILE_PRIMARY_SPEED
         elif projectile_type == "secondary":
             # E key - Different projectile (Projectile03)
-            self.original_image = pygame.image.load("assets/images/Projectile03.png").convert_alpha()
+            self.original_image = assets.get_image("assets/images/Projectile03.png")
             self.speed = PROJECTILE_SECONDARY_SPEED
         
         # Rotate projectile based on direction
@@ -50,6 +56,33 @@ class Projectile(pygame.sprite.Sprite):
         elif self.direction == "down" and self.rect.top > SCREEN_HEIGHT:
             self.kill()  # Went off bottom of screen
     
+    def kill(self):
+        """Remove from all groups and return to the pool"""
+        super().kill()
+        projectile_pool.release(self)
+    
     def draw(self, screen):
         """Draw the projectile"""
         screen.blit(self.image, self.rect)
+
+
+# Shared pool of player projectiles
+projectile_pool = ObjectPool(Projectile, "projectiles")
+
+# Sprite and speed per projectile type
+PROJECTILE_TYPES = {
+    "primary": ("assets/images/Projectile01.png", PROJECTILE_PRIMARY_SPEED),    # Q key - Blue laser
+    "secondary": ("assets/images/Projectile03.png", PROJECTILE_SECONDARY_SPEED)  # E key - Projectile03
+}
+
+def fire_projectile(engine, x, y, projectile_type="primary", direction="up"):
+    """Spawn a player shot into a projectile engine (same sprite, speed and anchor as Projectile)"""
+    path, speed = PROJECTILE_TYPES[projectile_type]
+    image = assets.get_image(path)
+    w, h = image.get_size()
+    if direction == "down":
+        # Shared 180° sprite, spawned from the bottom of the player
+        image = rotation_cache.get_rotated(image, 180)
+        return engine.spawn(projectile_type, image, x, y + h // 2, 0, speed)
+    # Spawned from the top of the player
+    return engine.spawn(projectile_type, image, x, y - h + h // 2, 0, -speed)
@@ -0,0 +1,303 @@
+"""
+Projectile Engine for Retro Space Shooter
+Keeps every live projectile of one side in structure-of-arrays columns: movement, culling and the
+collision broadphase run over whole columns and drawing is a single blits call.
+Small engines keep plain-list columns; bullet-dense ones switch to NumPy arrays (see PROJECTILE_BATCH_MIN_SHOTS).
+"""
+import math
+import pygame
+from constants import *
+
+# NumPy is optional - without it the columns stay plain lists and the passes are loops
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class ProjectileHandle:
+    """One live projectile in an engine - what collision handlers see instead of a sprite"""
+    __slots__ = ('engine', 'slot', 'projectile_type')
+
+    def __init__(self, engine, slot, projectile_type):
+        self.engine = engine
+        self.slot = slot  # Column index while alive, -1 once removed
+        self.projectile_type = projectile_type
+
+    @property
+    def rect(self):
+        """Current bounding rect (built on demand from the columns)"""
+        return self.engine.get_rect(self.slot)
+
+    def alive(self):
+        """Check if the projectile is still in its engine"""
+        return self.slot >= 0
+
+    def kill(self):
+        """Remove the projectile (safe to call more than once)"""
+        if self.slot >= 0:
+            self.engine.remove(self.slot)
+
+
+class ProjectileEngine:
+    # Float centers, per-frame velocities, sprite sizes, type ids and the move count at spawn
+    COLUMNS = ('x', 'y', 'vx', 'vy', 'w', 'h', 'type_id', 'born')
+    INT_COLUMNS = ('w', 'h', 'type_id', 'born')
+
+    def __init__(self, name, capacity=PROJECTILE_ENGINE_CAPACITY):
+        """Initialize an empty engine (capacity is the initial array size once batched)"""
+        self.name = name
+        self.capacity = capacity
+        self.count = 0      # Live projectiles occupy slots [0, count)
+        self.moves = 0      # Update passes so far (projectiles born at the current count haven't moved yet)
+        self.types = {}     # projectile type -> type id
+        self.handles = []   # slot -> ProjectileHandle
+        self.images = []    # slot -> shared surface for its type and heading
+        self.rects = []     # slot -> pygame.Rect kept in step while the columns are lists
+
+        # Array passes only pay off for dense fire - below this the columns are lists
+        self.batch_threshold = PROJECTILE_BATCH_MIN_SHOTS
+        self.batched = False
+        for column in self.COLUMNS:
+            setattr(self, column, [])
+
+        # Statistics
+        self.spawned = 0
+        self.culled = 0
+        self.removed = 0
+        self.high_water = 0
+        self.batched_frames = 0
+
+    # Group-style access for code written against sprite groups
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.handles[:self.count])
+
+    def __bool__(self):
+        return self.count > 0
+
+    def sprites(self):
+        """Get the live projectile handles"""
+        return self.handles[:self.count]
+
+    def spawn(self, projectile_type, image, x, y, vx, vy):
+        """Add a projectile centered at (x, y) moving (vx, vy) pixels per frame"""
+        slot = self.count
+        type_id = self.types.setdefault(projectile_type, len(self.types))
+        values = (x, y, vx, vy, image.get_width(), image.get_height(), type_id, self.moves)
+        if self.batched:
+            if slot == self.capacity:
+                self.grow()
+            for column, value in zip(self.COLUMNS, values):
+                getattr(self, column)[slot] = value
+        else:
+            for column, value in zip(self.COLUMNS, values):
+                getattr(self, column).append(value)
+            self.rects.append(self.build_rect(slot))
+
+        handle = ProjectileHandle(self, slot, projectile_type)
+        self.handles.append(handle)
+        self.images.append(image)
+        self.count += 1
+        self.spawned += 1
+        if self.count > self.high_water:
+            self.high_water = self.count
+        return handle
+
+    def add(self, *sprites):
+        """Adopt Projectile/EnemyProjectile sprites built by demos and tests (the sprites go back to their pools)"""
+        for sprite in sprites:
+            x, y = sprite.rect.center
+            self.spawn(sprite.projectile_type, sprite.image, x, y,
+                       getattr(sprite, 'velocity_x', 0), sprite.velocity_y)
+            sprite.kill()
+
+    def remove(self, slot):
+        """Swap-remove one projectile (the last one moves into its slot)"""
+        last = self.count - 1
+        self.handles[slot].slot = -1
+        if slot != last:
+            for column in self.COLUMNS:
+                array = getattr(self, column)
+                array[slot] = array[last]
+            moved = self.handles[slot] = self.handles[last]
+            moved.slot = slot
+            self.images[slot] = self.images[last]
+            if not self.batched:
+                self.rects[slot] = self.rects[last]
+        self.handles.pop()
+        self.images.pop()
+        if not self.batched:
+            for column in self.COLUMNS:
+                getattr(self, column).pop()
+            self.rects.pop()
+        self.count = last
+        self.removed += 1
+
+    def empty(self):
+        """Remove every projectile"""
+        for handle in self.handles:
+            handle.slot = -1
+        self.handles = []
+        self.images = []
+        self.rects = []
+        self.count = 0
+        self.batched = False
+        for column in self.COLUMNS:
+            setattr(self, column, [])
+
+    def set_batched(self, batched):
+        """Move the columns between plain lists and NumPy arrays"""
+        if batched == self.batched:
+            return
+        n = self.count
+        if batched:
+            self.capacity = max(self.capacity, 2 * n)
+            for column in self.COLUMNS:
+                array = np.zeros(self.capacity, dtype=np.int64 if column in self.INT_COLUMNS else np.float64)
+                array[:n] = getattr(self, column)
+                setattr(self, column, array)
+            self.rects = []  # Built on demand from the arrays instead
+        else:
+            for column in self.COLUMNS:
+                setattr(self, column, getattr(self, column)[:n].tolist())
+            self.rects = [self.build_rect(slot) for slot in range(n)]
+        self.batched = batched
+
+    def grow(self):
+        """Double the capacity of every array column"""
+        self.capacity *= 2
+        for column in self.COLUMNS:
+            array = getattr(self, column)
+            grown = np.zeros(self.capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, column, grown)
+
+    def get_rect(self, slot):
+        """Bounding rect of one projectile"""
+        if self.batched:
+            return self.build_rect(slot)
+        return self.rects[slot]
+
+    def build_rect(self, slot):
+        """Build the bounding rect of one projectile from its columns (same rounding as the drawn position)"""
+        w = int(self.w[slot])
+        h = int(self.h[slot])
+        return pygame.Rect(math.floor(self.x[slot]) - w // 2, math.floor(self.y[slot]) - h // 2, w, h)
+
+    def get_rects(self):
+        """Array columns of left, top, width and height for every live projectile (batched only)"""
+        n = self.count
+        w = self.w[:n]
+        h = self.h[:n]
+        return np.floor(self.x[:n]).astype(np.int64) - w // 2, np.floor(self.y[:n]).astype(np.int64) - h // 2, w, h
+
+    def pack_rects(self):
+        """Live rects as an (N, 4) array of x, y, w, h (same layout as CollisionSystem.pack_rects)"""
+        return np.stack(self.get_rects(), axis=1).astype(np.int32)
+
+    def update(self):
+        """Move every projectile one frame and cull the ones that left the screen"""
+        self.moves += 1
+        # Switch column storage with some hysteresis so a hovering count doesn't flip every frame
+        if np is not None:
+            if self.count >= self.batch_threshold:
+                self.set_batched(True)
+            elif self.count < self.batch_threshold // 2:
+                self.set_batched(False)
+
+        if self.count == 0:
+            return
+        if not self.batched:
+            self.update_lists()
+            return
+
+        self.batched_frames += 1
+        n = self.count
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+
+        # Culled once fully off any edge of the screen
+        left, top, w, h = self.get_rects()
+        off_screen = (left + w < 0) | (left > SCREEN_WIDTH) | (top + h < 0) | (top > SCREEN_HEIGHT)
+        if off_screen.any():
+            self.compact(~off_screen)
+
+    def update_lists(self):
+        """Plain-loop update over list columns"""
+        floor = math.floor
+        x, y, vx, vy, w, h = self.x, self.y, self.vx, self.vy, self.w, self.h
+        rects = self.rects
+        for slot in range(self.count - 1, -1, -1):
+            # Backwards, so swap-removes only pull in projectiles that already moved
+            new_x = x[slot] = x[slot] + vx[slot]
+            new_y = y[slot] = y[slot] + vy[slot]
+            left = floor(new_x) - w[slot] // 2
+            top = floor(new_y) - h[slot] // 2
+            if left + w[slot] < 0 or left > SCREEN_WIDTH or top + h[slot] < 0 or top > SCREEN_HEIGHT:
+                self.remove(slot)
+                self.removed -= 1
+                self.culled += 1
+            else:
+                rects[slot].topleft = (left, top)
+
+    def compact(self, keep):
+        """Drop every projectile where keep is False, keeping the rest in order"""
+        n = self.count
+        kept = int(keep.sum())
+        for column in self.COLUMNS:
+            array = getattr(self, column)
+            array[:kept] = array[:n][keep]
+
+        handles = []
+        images = []
+        for handle, image, alive in zip(self.handles, self.images, keep.tolist()):
+            if alive:
+                handle.slot = len(handles)
+                handles.append(handle)
+                images.append(image)
+            else:
+                handle.slot = -1
+        self.handles = handles
+        self.images = images
+        self.culled += n - kept
+        self.count = kept
+
+    def draw(self, screen, interpolation=1.0):
+        """Draw every projectile in one blits call (interpolation < 1 draws partway back along its velocity)"""
+        n = self.count
+        if n == 0:
+            return
+
+        # Projectiles that haven't moved since they spawned have no previous position - draw them where they are,
+        # not back behind their muzzle
+        behind = 1.0 - interpolation
+        moves = self.moves
+        if self.batched:
+            behind = np.where(self.born[:n] == moves, 0.0, behind)
+            left = np.floor(self.x[:n] - self.vx[:n] * behind).astype(np.int64) - self.w[:n] // 2
+            top = np.floor(self.y[:n] - self.vy[:n] * behind).astype(np.int64) - self.h[:n] // 2
+            positions = zip(left.tolist(), top.tolist())
+        elif behind == 0:
+            positions = self.rects
+        else:
+            floor = math.floor
+            positions = [rect if born == moves else (floor(x - vx * behind) - w // 2, floor(y - vy * behind) - h // 2)
+                         for x, y, vx, vy, w, h, born, rect
+                         in zip(self.x, self.y, self.vx, self.vy, self.w, self.h, self.born, self.rects)]
+
+        screen.blits(list(zip(self.images, positions)), False)
+
+    def get_stats(self):
+        """Get engine statistics"""
+        return {
+            'name': self.name,
+            'live': self.count,
+            'batched': self.batched,
+            'batched_frames': self.batched_frames,
+            'spawned': self.spawned,
+            'culled': self.culled,
+            'removed': self.removed,
+            'high_water': self.high_water
+        }
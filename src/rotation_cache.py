@@ -0,0 +1,82 @@
+"""
+Rotation Cache for Retro Space Shooter
+Memoizes rotated sprite frames at quantized angles so spinning hazards share surfaces
+"""
+import pygame
+from collections import OrderedDict
+from constants import *
+
+class RotationCache:
+    def __init__(self, angle_step=ROTATION_ANGLE_STEP, max_size=ROTATION_CACHE_SIZE):
+        """Initialize the rotation cache"""
+        self.angle_step = angle_step  # Degrees between cached angles
+        self.max_size = max_size      # Maximum rotated surfaces kept (LRU eviction)
+        self.surfaces = OrderedDict()  # (source image, quantized angle) -> rotated surface
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def quantize(self, angle):
+        """Snap an angle to the nearest cached step in [0, 360)"""
+        return (int(round(angle / self.angle_step)) * self.angle_step) % 360
+
+    def get_rotated(self, image, angle):
+        """Get a shared rotated copy of image, rendering it on first use"""
+        key = (image, self.quantize(angle))
+        rotated = self.surfaces.get(key)
+        if rotated is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return rotated
+
+        self.misses += 1
+        rotated = image if key[1] == 0 else pygame.transform.rotate(image, key[1])
+        self.surfaces[key] = rotated
+
+        # Evict least recently used frames when over budget
+        while len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+
+        return rotated
+
+    def prerender(self, images):
+        """Render every quantized angle for the given images ahead of time"""
+        for image in images:
+            for angle in range(0, 360, self.angle_step):
+                self.get_rotated(image, angle)
+
+    def set_angle_step(self, angle_step):
+        """Change the quantization step (drops cached frames)"""
+        self.angle_step = angle_step
+        self.clear()
+
+    def reset_stats(self):
+        """Reset hit/miss counters"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self):
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total > 0 else 0.0,
+            'size': len(self.surfaces),
+            'max_size': self.max_size,
+            'angle_step': self.angle_step
+        }
+
+    def clear(self):
+        """Drop all cached rotations"""
+        self.surfaces.clear()
+        self.reset_stats()
+
+
+# Process-wide cache shared by asteroids, debris and bombs
+rotation_cache = RotationCache()
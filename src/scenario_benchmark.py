@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Scenario Benchmark - Seeded game scenarios timed frame by frame
+Reports p50/p95/p99 frame time split into update/collision/draw, writes JSON and compares against a baseline
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+
+# Must be set before pygame initializes video/audio
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+from constants import *
+
+WARMUP_FRAMES = 120           # Frames run before timing starts (fills pools and caches)
+PHASES = ['update', 'collision', 'draw', 'total']
+PERCENTILES = [50, 95, 99]
+DEFAULT_TOLERANCE = 0.15      # Fractional slowdown before a percentile counts as a regression
+
+# Scenario setup and per-frame hooks
+def setup_wave(game, wave_number):
+    """Skip dialogue and start a story wave"""
+    game.dialogue_system.close_dialogue()
+    game.game_started = True
+    game.wave_manager.start_wave(wave_number)
+
+def setup_max_density(game, wave_number):
+    """Start a wave that spawns every frame so it sits at its enemy cap"""
+    setup_wave(game, wave_number)
+    game.wave_manager.spawn_interval = 1
+    game.wave_manager.spawn_variance = 0
+
+def fire(game, frame, fire_every=10):
+    """Autopilot input: fire both weapons and keep the player alive"""
+    if frame % fire_every == 0:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_q))
+    if frame % fire_every == fire_every // 2:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_e))
+    game.player.heal(game.player.health_system.max_health)
+
+def keep_wave_running(game, wave_number):
+    """Restart the wave whenever it ends so the scenario keeps its load"""
+    if game.dialogue_system.is_active():
+        game.dialogue_system.close_dialogue()
+    if not game.wave_manager.wave_active:
+        game.wave_manager.start_wave(wave_number)
+
+def setup_wave_1(game):
+    """Wave 1 with the player firing"""
+    setup_wave(game, 1)
+
+def frame_wave_1(game, frame):
+    """Keep firing and keep wave 1 running"""
+    fire(game, frame)
+    keep_wave_running(game, 1)
+
+def setup_wave_10_max(game):
+    """Wave 10 spawning every frame up to its cap"""
+    setup_max_density(game, 10)
+
+def frame_wave_10_max(game, frame):
+    """Keep firing and keep wave 10 running"""
+    fire(game, frame)
+    keep_wave_running(game, 10)
+
+def setup_endless(game):
+    """Endless mode driven by the basic spawner"""
+    game.dialogue_system.close_dialogue()
+    game.game_started = True
+    game.story_mode = False
+
+def frame_endless(game, frame):
+    """Keep firing"""
+    fire(game, frame)
+
+def setup_energy_storm(game):
+    """Wave 10 at cap with an energy effect active"""
+    setup_max_density(game, 10)
+    game.player.collect_powerup("energy")
+
+def frame_energy_storm(game, frame):
+    """Fire rapidly with an endless screen-clearing energy effect"""
+    fire(game, frame, fire_every=4)
+    keep_wave_running(game, 10)
+
+    # Every energy hit clears the screen
+    if not game.player.has_energy_effect():
+        game.player.collect_powerup("energy")
+    game.player.energy_effect.effect_patterns = {'horizontal': 0, 'vertical': 0, 'diagonal': 0, 'screen_clear': 100}
+
+def setup_boss(game):
+    """Wave 10 with the boss battle running"""
+    from boss_battle import BossBattle
+
+    setup_wave(game, 10)
+    game.boss_battle = BossBattle()
+    game.boss_battle.start_boss_battle()
+
+def frame_boss(game, frame):
+    """Keep firing and keep wave 10 running"""
+    fire(game, frame)
+    keep_wave_running(game, 10)
+
+def update_boss(game):
+    """Boss attacks and their collision checks (not part of Game.update yet)"""
+    game.boss_battle.update()
+    game.boss_battle.check_laser_collision(game.player.rect)
+    game.boss_battle.check_missile_collision(game.player.rect)
+
+def draw_boss(game):
+    """Draw boss attacks and health bar"""
+    game.boss_battle.draw(game.screen)
+
+def setup_bullet_storm(game):
+    """Wave 10 at cap with a wall of enemy lasers"""
+    setup_max_density(game, 10)
+
+def frame_bullet_storm(game, frame, lasers_per_frame=8):
+    """Fire rapidly and rain lasers from the top edge at the player (~1000 live lasers)"""
+    from enemy_projectile import LaserShot
+
+    fire(game, frame, fire_every=2)
+    keep_wave_running(game, 10)
+    target_x, target_y = game.player.rect.center
+    game.spawn_enemy_actions([LaserShot(random.randint(0, SCREEN_WIDTH), 0, target_x, target_y)
+                              for _ in range(lasers_per_frame)])
+
+SCENARIOS = {
+    'wave_1': {
+        'description': "Wave 1 training fighters",
+        'setup': setup_wave_1, 'frame': frame_wave_1, 'frames': 1800, 'seed': 1
+    },
+    'wave_10_max': {
+        'description': "Wave 10 held at its enemy cap",
+        'setup': setup_wave_10_max, 'frame': frame_wave_10_max, 'frames': 1800, 'seed': 10
+    },
+    'endless': {
+        'description': "Endless mode with the basic spawner",
+        'setup': setup_endless, 'frame': frame_endless, 'frames': 1800, 'seed': 3
+    },
+    'energy_storm': {
+        'description': "Wave 10 at cap, every energy hit is a screen clear",
+        'setup': setup_energy_storm, 'frame': frame_energy_storm, 'frames': 1800, 'seed': 4
+    },
+    'boss': {
+        'description': "Wave 10 plus boss lasers and missiles",
+        'setup': setup_boss, 'frame': frame_boss, 'update': update_boss, 'draw': draw_boss,
+        'frames': 1800, 'seed': 5
+    },
+    'bullet_storm': {
+        'description': "Wave 10 at cap under ~1000 live enemy lasers",
+        'setup': setup_bullet_storm, 'frame': frame_bullet_storm, 'frames': 1800, 'seed': 6
+    }
+}
+
+# Measurement
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+def summarize(samples):
+    """Reduce per-frame millisecond samples to percentiles and mean"""
+    ordered = sorted(samples)
+    summary = {f"p{pct}": round(percentile(ordered, pct), 4) for pct in PERCENTILES}
+    summary['mean'] = round(sum(ordered) / len(ordered), 4) if ordered else 0.0
+    return summary
+
+def run_scenario(name, scenario, frames=None, draw=True):
+    """Run one scenario headless and return its per-phase frame time summary"""
+    from game import Game
+
+    random.seed(scenario['seed'])
+    game = Game(pygame.time.Clock(), headless=True)
+    scenario['setup'](game)
+
+    # Time collision processing separately from the rest of the update
+    collision_time = [0.0]
+    process_all_collisions = game.collision_system.process_all_collisions
+    def timed_collisions(*args, **kwargs):
+        start = time.perf_counter()
+        result = process_all_collisions(*args, **kwargs)
+        collision_time[0] += time.perf_counter() - start
+        return result
+    game.collision_system.process_all_collisions = timed_collisions
+
+    frame_hook = scenario.get('frame')
+    update_hook = scenario.get('update')
+    draw_hook = scenario.get('draw')
+    total_frames = frames if frames is not None else scenario['frames']
+    samples = {phase: [] for phase in PHASES}
+    perf_counter = time.perf_counter
+
+    for frame in range(WARMUP_FRAMES + total_frames):
+        if frame_hook:
+            frame_hook(game, frame)
+
+        collision_time[0] = 0.0
+        start = perf_counter()
+        game.handle_events()
+        game.update()
+        if update_hook:
+            update_hook(game)
+        update_end = perf_counter()
+
+        if draw:
+            game.draw()
+            if draw_hook:
+                draw_hook(game)
+        draw_end = perf_counter()
+
+        if frame < WARMUP_FRAMES:
+            continue
+
+        collision_ms = collision_time[0] * 1000
+        samples['update'].append((update_end - start) * 1000 - collision_ms)
+        samples['collision'].append(collision_ms)
+        samples['draw'].append((draw_end - update_end) * 1000)
+        samples['total'].append((draw_end - start) * 1000)
+
+    result = {phase: summarize(samples[phase]) for phase in PHASES}
+    result['frames'] = total_frames
+    result['description'] = scenario['description']
+    result['collision_mode'] = game.collision_system.get_collision_mode()
+    return result
+
+# Reporting
+def print_results(results):
+    """Print a percentile table per scenario"""
+    print(f"{'Scenario':<14} | {'Phase':<9} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8} | {'mean ms':>8}")
+    print("-" * 70)
+    for name, result in results.items():
+        for phase in PHASES:
+            stats = result[phase]
+            label = name if phase == PHASES[0] else ""
+            print(f"{label:<14} | {phase:<9} | {stats['p50']:>8.3f} | {stats['p95']:>8.3f} | {stats['p99']:>8.3f} | {stats['mean']:>8.3f}")
+        print("-" * 70)
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Print slowdowns against a baseline and return the number of regressions"""
+    regressions = 0
+    print("")
+    print(f"📊 BASELINE COMPARISON (tolerance {tolerance:.0%})")
+
+    for name, result in results.items():
+        base = baseline.get('scenarios', {}).get(name)
+        if base is None:
+            print(f"{name:<14} | no baseline")
+            continue
+
+        for phase in PHASES:
+            changes = []
+            for pct in PERCENTILES:
+                key = f"p{pct}"
+                old = base[phase][key]
+                new = result[phase][key]
+                ratio = new / old if old > 0 else 1.0
+                flag = ""
+                if ratio > 1 + tolerance and new - old > 0.05:  # Ignore sub-50us noise
+                    flag = " ⚠️"
+                    regressions += 1
+                changes.append(f"{key} {old:.3f}→{new:.3f} ({ratio - 1:+.0%}){flag}")
+            print(f"{name if phase == PHASES[0] else '':<14} | {phase:<9} | " + " | ".join(changes))
+
+    if regressions:
+        print(f"❌ {regressions} percentile(s) slower than baseline")
+    else:
+        print("✅ No regressions against baseline")
+    return regressions
+
+def main():
+    """Run the selected scenarios, write JSON and compare against a baseline"""
+    parser = argparse.ArgumentParser(description="Scenario benchmark for Retro Space Shooter")
+    parser.add_argument("scenarios", nargs="*", help=f"scenarios to run (default all: {', '.join(SCENARIOS)})")
+    parser.add_argument("--frames", type=int, help="override timed frames per scenario")
+    parser.add_argument("--no-draw", action="store_true", help="skip drawing (simulation cost only)")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write results to")
+    parser.add_argument("--baseline", help="JSON results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed fractional slowdown")
+    args = parser.parse_args()
+
+    names = args.scenarios or list(SCENARIOS)
+    for name in names:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario '{name}' (choose from {', '.join(SCENARIOS)})")
+
+    pygame.init()
+    print("⏱️ SCENARIO BENCHMARK")
+    print(f"Scenarios: {', '.join(names)} | draw {'off' if args.no_draw else 'on'} | {WARMUP_FRAMES} warmup frames")
+    print("")
+
+    results = {}
+    for name in names:
+        print(f"▶️ {name}: {SCENARIOS[name]['description']}")
+        results[name] = run_scenario(name, SCENARIOS[name], args.frames, not args.no_draw)
+
+    print("")
+    print_results(results)
+
+    report = {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'draw': not args.no_draw,
+        'scenarios': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Results written to {args.output}")
+
+    regressions = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+
+    pygame.quit()
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,12 +25,10 @@ def demo_shooting():
     print("Creating primary projectile (Q key)...")
     primary_proj = Projectile(400, 300, "primary")
     game.projectiles.add(primary_proj)
-    game.all_sprites.add(primary_proj)
     
     print("Creating secondary projectile (E key)...")
     secondary_proj = Projectile(450, 300, "secondary")
     game.projectiles.add(secondary_proj)
-    game.all_sprites.add(secondary_proj)
     
     # Update and draw several frames to show projectiles moving
     for frame in range(60):  # 1 second at 60 FPS
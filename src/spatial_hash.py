@@ -0,0 +1,72 @@
+"""
+Spatial Hash broadphase for Retro Space Shooter
+Buckets sprites into a uniform grid so collision checks only test nearby sprites
+"""
+from constants import *
+
+class SpatialHash:
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        """Initialize an empty spatial hash"""
+        self.cell_size = cell_size
+        self.cells = {}  # (cell x, cell y) -> list of sprites in insertion order
+        self.order = {}  # sprite -> insertion index (keeps query results in group order)
+
+    def get_cell_range(self, rect):
+        """Get the inclusive range of cells a rect overlaps"""
+        cell_size = self.cell_size
+        x0 = rect.left // cell_size
+        y0 = rect.top // cell_size
+        x1 = max(x0, (rect.right - 1) // cell_size)
+        y1 = max(y0, (rect.bottom - 1) // cell_size)
+        return x0, y0, x1, y1
+
+    def insert(self, sprite):
+        """Add a sprite to every cell its rect overlaps"""
+        self.order[sprite] = len(self.order)
+        x0, y0, x1, y1 = self.get_cell_range(sprite.rect)
+        cells = self.cells
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket is None:
+                    cells[(cell_x, cell_y)] = [sprite]
+                else:
+                    bucket.append(sprite)
+
+    def rebuild(self, sprites):
+        """Clear the grid and insert all sprites (called once per frame)"""
+        self.cells.clear()
+        self.order.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def query(self, rect):
+        """Get sprites in the cells a rect overlaps, in insertion order"""
+        cell_size = self.cell_size
+        left, top, width, height = rect
+        x0 = left // cell_size
+        y0 = top // cell_size
+        x1 = (left + width - 1) // cell_size
+        y1 = (top + height - 1) // cell_size
+        cells = self.cells
+
+        # Common case - small sprites like projectiles sit in a single cell
+        if x1 <= x0 and y1 <= y0:
+            return cells.get((x0, y0), ())
+
+        # Gather from every overlapped cell without duplicates
+        found = {}
+        for cell_x in range(x0, max(x0, x1) + 1):
+            for cell_y in range(y0, max(y0, y1) + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    for sprite in bucket:
+                        found[sprite] = True
+
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=self.order.__getitem__)
+
+    def __len__(self):
+        """Number of sprites in the grid"""
+        return len(self.order)
@@ -84,7 +84,7 @@ def test_spawn_fixes():
                 # Monitor every 3 seconds
                 if frame_count % 180 == 0:
                     current_enemies = len(game.enemies)
-                    time_remaining = wave_info.get('time_remaining', 0)
+                    time_remaining = game.wave_manager.get_time_remaining()
                     
                     # Calculate dynamic max enemies for wave 2
                     base_max = 12
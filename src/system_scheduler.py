@@ -0,0 +1,66 @@
+"""
+System Scheduler for Retro Space Shooter
+Runs the frame's systems as declared, ordered stages so each one runs exactly once per tick
+"""
+import functools
+from frame_profiler import profiler
+
+class SystemScheduler:
+    def __init__(self, name):
+        """Initialize an empty scheduler"""
+        self.name = name
+        self.stages = []      # (stage name, counted system function) in run order
+        self.calls = {}       # stage name -> total calls
+        self.tick_calls = {}  # stage name -> calls during the current tick
+        self.ticks = 0        # Completed ticks
+
+    def add_stage(self, stage, system):
+        """Declare a stage (stage names must be unique) - returns the counted system for out-of-band calls"""
+        if stage in self.calls:
+            raise ValueError(f"{self.name} scheduler already has a '{stage}' stage")
+        calls = self.calls
+        tick_calls = self.tick_calls
+        calls[stage] = 0
+        tick_calls[stage] = 0
+
+        @functools.wraps(system)
+        def counted_system(*args, **kwargs):
+            calls[stage] += 1
+            tick_calls[stage] += 1
+            return system(*args, **kwargs)
+
+        self.stages.append((stage, counted_system))
+        return counted_system
+
+    def run(self):
+        """Run every stage once, in declared order"""
+        tick_calls = self.tick_calls
+        for stage in tick_calls:
+            tick_calls[stage] = 0
+        for stage, system in self.stages:
+            system()
+            profiler.lap(stage)
+        self.ticks += 1
+
+        # Every stage must have run exactly once this tick - a stage also called through
+        # its counted system from inside another stage shows up here
+        doubled = self.get_doubled_stages()
+        if doubled:
+            raise RuntimeError(f"{self.name} scheduler stage ran more than once in tick {self.ticks}: {doubled}")
+
+    def get_doubled_stages(self):
+        """Get stages called more than once during the current tick"""
+        return {stage: count for stage, count in self.tick_calls.items() if count > 1}
+
+    def get_stage_names(self):
+        """Get stage names in run order"""
+        return [stage for stage, _ in self.stages]
+
+    def get_stats(self):
+        """Get scheduler statistics"""
+        return {
+            'name': self.name,
+            'ticks': self.ticks,
+            'stages': self.get_stage_names(),
+            'calls': dict(self.calls)
+        }
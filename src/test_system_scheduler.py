@@ -0,0 +1,60 @@
+"""
+Tests for the System Scheduler - every stage must run exactly once per tick
+"""
+import pytest
+from system_scheduler import SystemScheduler
+
+class FakeGame:
+    """Just enough of Game to own a couple of stage systems"""
+    def __init__(self):
+        self.waves_updated = 0
+        self.double_powerups = False  # Make the waves stage also run the powerups stage
+        self.systems = SystemScheduler("update")
+        self.systems.add_stage('waves', self.update_waves)
+        self.counted_update_powerups = self.systems.add_stage('powerups', self.update_powerups)
+
+    def update_waves(self):
+        self.waves_updated += 1
+        if self.double_powerups:
+            self.counted_update_powerups()
+
+    def update_powerups(self):
+        pass
+
+
+def test_stages_run_once_per_tick():
+    game = FakeGame()
+    for _ in range(3):
+        game.systems.run()
+    assert game.waves_updated == 3
+    assert game.systems.get_stats()['calls'] == {'waves': 3, 'powerups': 3}
+    assert game.systems.get_doubled_stages() == {}
+
+
+def test_add_stage_leaves_owner_untouched():
+    game = FakeGame()
+    assert game.update_powerups.__func__ is FakeGame.update_powerups
+
+
+def test_doubled_stage_raises_for_that_tick_only():
+    game = FakeGame()
+    game.systems.run()
+
+    # A stage run again from inside another stage runs twice this tick
+    game.double_powerups = True
+    with pytest.raises(RuntimeError, match="powerups"):
+        game.systems.run()
+    assert game.systems.get_doubled_stages() == {'powerups': 2}
+
+    # Counts start over each tick, so the next clean tick passes
+    game.double_powerups = False
+    game.systems.run()
+    assert game.systems.get_doubled_stages() == {}
+    assert game.systems.ticks == 3
+
+
+def test_duplicate_stage_name_is_rejected():
+    systems = SystemScheduler("draw")
+    systems.add_stage('hud', lambda: None)
+    with pytest.raises(ValueError):
+        systems.add_stage('hud', lambda: None)
@@ -0,0 +1,124 @@
+"""
+Text Cache for Retro Space Shooter
+Loads each font once and memoizes rendered text so unchanged HUD strings are not re-rasterized
+"""
+import pygame
+from collections import OrderedDict
+from constants import *
+
+class FontRegistry:
+    def __init__(self):
+        """Initialize the font registry"""
+        self.fonts = {}  # (face, size) -> pygame.font.Font
+
+        # Registry statistics
+        self.loads = 0
+
+    def get(self, size, face=None):
+        """Get a shared font, loading it on first use (face None is the default font)"""
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(face, size)
+            self.fonts[key] = font
+            self.loads += 1
+        return font
+
+    def clear(self):
+        """Drop all loaded fonts"""
+        self.fonts.clear()
+        self.loads = 0
+
+
+class TextCache:
+    def __init__(self, font_registry, max_size=TEXT_CACHE_SIZE):
+        """Initialize the rendered text cache"""
+        self.font_registry = font_registry
+        self.max_size = max_size         # Maximum rendered strings kept (LRU eviction)
+        self.surfaces = OrderedDict()    # (text, size, color, antialias, face) -> rendered surface
+        self.layouts = {}                # (text, max width, size, face) -> wrapped lines
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0  # Every miss is one glyph rasterization
+        self.evictions = 0
+
+    def render(self, text, size, color, antialias=True, face=None):
+        """Get a shared rendered surface for text, rasterizing it on first use"""
+        key = (text, size, tuple(color), antialias, face)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font_registry.get(size, face).render(text, antialias, color)
+        self.surfaces[key] = surface
+
+        # Evict least recently used strings when over budget
+        while len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+
+        return surface
+
+    def wrap(self, text, max_width, size, face=None):
+        """Get text word-wrapped to max_width pixels, measuring with Font.size (cached per layout)"""
+        key = (text, max_width, size, face)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            return lines
+
+        font = self.font_registry.get(size, face)
+        lines = []
+        current_line_text = ""
+
+        for word in text.split(' '):
+            test_line = current_line_text + word + " "
+
+            if font.size(test_line)[0] <= max_width:
+                current_line_text = test_line
+            else:
+                if current_line_text:
+                    lines.append(current_line_text.strip())
+                    current_line_text = word + " "
+                else:
+                    lines.append(word)
+                    current_line_text = ""
+
+        if current_line_text:
+            lines.append(current_line_text.strip())
+
+        self.layouts[key] = lines
+        return lines
+
+    def reset_stats(self):
+        """Reset hit/miss counters"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self):
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total > 0 else 0.0,
+            'size': len(self.surfaces),
+            'max_size': self.max_size,
+            'fonts': len(self.font_registry.fonts)
+        }
+
+    def clear(self):
+        """Drop all rendered strings and layouts"""
+        self.surfaces.clear()
+        self.layouts.clear()
+        self.reset_stats()
+
+
+# Process-wide font registry and text cache shared by all UI code
+fonts = FontRegistry()
+text_cache = TextCache(fonts)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Turbo Mode - Headless simulation of the game with no frame limiter
+Runs Game.update (and optionally Game.draw into an offscreen surface) under the SDL dummy driver
+and reports simulated frames per second, e.g. to soak-test wave 10 or endless mode
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+# Must be set before pygame initializes video/audio
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+from constants import *
+
+def create_game(args):
+    """Create a headless game positioned at the requested wave or in endless mode"""
+    from game import Game
+
+    game = Game(pygame.time.Clock(), headless=True)
+    game.dialogue_system.close_dialogue()
+    game.game_started = True
+
+    if args.endless:
+        game.story_mode = False
+    else:
+        game.wave_manager.start_wave(args.wave)
+    return game
+
+def autopilot(game, frame, args):
+    """Feed the game the input a player would give: fire both weapons and keep the wave going"""
+    if frame % args.fire_every == 0:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_q))
+    if frame % args.fire_every == args.fire_every // 2:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_e))
+
+    # Keep the player alive so the soak covers the whole run
+    if args.god:
+        game.player.heal(game.player.health_system.max_health)
+
+    # Dismiss dialogue and restart instead of waiting on the player
+    if game.dialogue_system.is_active():
+        game.dialogue_system.close_dialogue()
+    if game.game_over and game.player_death_timer <= 0:
+        game.restart_game()
+        game.dialogue_system.close_dialogue()
+        if not args.endless:
+            game.wave_manager.start_wave(args.wave)
+
+    # Soak the same wave: start it again once it completes or fails
+    if not args.endless:
+        wave_info = game.wave_manager.get_wave_info()
+        if wave_info and not wave_info['wave_active']:
+            game.wave_manager.start_wave(args.wave)
+
+def run(args):
+    """Run the simulation and return (frames, update seconds, draw seconds, wall seconds)"""
+    game = create_game(args)
+    update_time = 0.0
+    draw_time = 0.0
+    perf_counter = time.perf_counter
+
+    start = perf_counter()
+    for frame in range(args.frames):
+        autopilot(game, frame, args)
+
+        frame_start = perf_counter()
+        game.handle_events()
+        game.update()
+        update_end = perf_counter()
+        update_time += update_end - frame_start
+
+        if args.draw:
+            game.draw()
+            draw_time += perf_counter() - update_end
+
+        if not game.running:
+            break
+    wall_time = perf_counter() - start
+
+    return frame + 1, update_time, draw_time, wall_time
+
+def main():
+    """Parse options, run the simulation and report simulated FPS"""
+    parser = argparse.ArgumentParser(description="Headless turbo simulation of Retro Space Shooter")
+    parser.add_argument("--frames", type=int, default=6000, help="frames to simulate (60 = one second of game time)")
+    parser.add_argument("--wave", type=int, default=10, help="story wave to soak (restarted whenever it ends)")
+    parser.add_argument("--endless", action="store_true", help="run endless mode instead of a story wave")
+    parser.add_argument("--draw", action="store_true", help="also draw every frame into an offscreen surface")
+    parser.add_argument("--god", action="store_true", help="heal the player every frame")
+    parser.add_argument("--fire-every", type=int, default=10, help="frames between autopilot shots")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    pygame.init()
+
+    mode = "endless" if args.endless else f"wave {args.wave}"
+    print(f"🏎️ TURBO MODE: {mode} | {args.frames} frames | draw {'on' if args.draw else 'off'}")
+
+    frames, update_time, draw_time, wall_time = run(args)
+
+    sim_fps = frames / wall_time if wall_time > 0 else 0.0
+    print("")
+    print(f"Simulated frames: {frames} ({frames / FPS:.1f}s of game time) in {wall_time:.2f}s")
+    print(f"Simulated FPS: {sim_fps:.0f} ({sim_fps / FPS:.1f}x real time)")
+    print(f"Update: {update_time * 1000 / frames:.3f} ms/frame")
+    if args.draw:
+        print(f"Draw:   {draw_time * 1000 / frames:.3f} ms/frame")
+
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
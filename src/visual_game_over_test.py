@@ -68,7 +68,7 @@ def visual_game_over_test():
                     if wave_info.get('wave_intro_active', False):
                         print(f"🌊 Wave {wave_info['wave_number']} intro - Press SPACE to start")
                     elif wave_info.get('wave_active', False):
-                        time_left = wave_info.get('time_remaining', 0)
+                        time_left = game.wave_manager.get_time_remaining()
                         print(f"⚔️ Wave {wave_info['wave_number']} active - {time_left:.1f}s left")
                 else:
                     print(f"🎮 Ready for gameplay...")
@@ -59,7 +59,7 @@ def test_wave2_spawning():
             
             if wave_2_started and wave_info.get('wave_active', False):
                 current_enemies = len(game.enemies)
-                time_remaining = wave_info.get('time_remaining', 0)
+                time_remaining = game.wave_manager.get_time_remaining()
                 enemies_spawned = game.wave_manager.enemies_spawned
                 
                 # Record spawning data every second
@@ -6,9 +6,61 @@ import pygame
 import random
 from constants import *
 
+class Versioned:
+    """Wave state attribute that bumps its owner's version whenever its value changes"""
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.__dict__[self.name]
+    
+    def __set__(self, obj, value):
+        state = obj.__dict__
+        if self.name not in state or state[self.name] != value:
+            state[self.name] = value
+            state['version'] = state.get('version', 0) + 1
+
+
+class WaveSnapshot:
+    """Immutable view of the wave state, shared until the state changes"""
+    __slots__ = ('wave_number', 'description', 'enemies_spawned', 'enemies_destroyed',
+                 'wave_duration', 'wave_active', 'wave_complete',
+                 'wave_failed', 'wave_intro_active', 'story_complete', 'spawn_rate',
+                 'is_transition')
+    
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("WaveSnapshot is immutable")
+    
+    # Dict-style access for callers written against the old wave info dict
+    def __getitem__(self, key):
+        return getattr(self, key)
+    
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
 class WaveManager:
+    # State shown in wave snapshots - assigning any of these invalidates the snapshot
+    current_wave = Versioned()
+    wave_active = Versioned()
+    wave_complete = Versioned()
+    wave_failed = Versioned()
+    story_complete = Versioned()
+    wave_intro_active = Versioned()
+    enemies_spawned = Versioned()
+    enemies_destroyed = Versioned()
+    
     def __init__(self):
         """Initialize the wave management system"""
+        self.version = 0  # Bumped by every wave state change
+        self.snapshot = None
+        self.snapshot_version = -1
         self.current_wave = 1
         self.max_waves = 10
         self.wave_active = False
@@ -17,7 +69,7 @@ class WaveManager:
         self.story_complete = False
         self.wave_intro_active = False  # New state for wave introduction
         
-        # Wave timing
+        # Wave timing (the timer ticks every frame, so it stays out of snapshots - see get_time_remaining)
         self.wave_timer = 0
         self.wave_duration = 0  # Set per wave
         
@@ -100,6 +152,10 @@ class WaveManager:
             }
         }
         
+        # Spawn rate text per wave (formatted once for wave snapshots)
+        self.spawn_rates = {wave: f"Every {wave_data['spawn_interval']/60:.1f}s"
+                            for wave, wave_data in self.wave_compositions.items()}
+        
         # Spawning control
         self.spawn_timer = 0
         self.spawn_interval = 90  # Base spawn interval (1.5 seconds)
@@ -152,6 +208,9 @@ class WaveManager:
         self.spawn_interval = wave_data['spawn_interval']
         self.spawn_variance = wave_data['spawn_variance']
         
+        # Size the sprite pools for this wave so spawning doesn't allocate
+        self.prewarm_pools(wave_data)
+        
         print(f"🌊 Wave {wave_number} started: {wave_data['description']}")
         print(f"   Duration: {wave_data['duration']} seconds")
         print(f"   Enemy types: {', '.join(wave_data['enemies'])}")
@@ -159,6 +218,36 @@ class WaveManager:
         
         return True
     
+    def get_max_enemies(self):
+        """Get the on-screen enemy cap for the current wave"""
+        # Dynamic max enemies based on wave number for progressive difficulty
+        base_max = 12
+        wave_bonus = min(self.current_wave - 1, 8)  # Up to +8 enemies for later waves
+        return base_max + wave_bonus
+    
+    def prewarm_pools(self, wave_data):
+        """Pre-size sprite pools from the wave's composition and enemy cap"""
+        from enemy_projectile import bomb_pool
+        from explosion import explosion_pool
+        
+        max_enemies = self.get_max_enemies()
+        
+        # Player shots and enemy lasers live in the game's projectile engines, not pools
+        
+        # Only crabships and pirates drop bombs
+        if any(enemy_type in ('crabship', 'pirate') for enemy_type in wave_data['enemies']):
+            bomb_pool.prewarm(max_enemies * POOL_BOMBS_PER_ENEMY, 0, 0)
+        
+        # An energy screen clear can explode every enemy at once
+        explosion_pool.prewarm(max_enemies + POOL_EXTRA_EXPLOSIONS, 0, 0, "enemy")
+    
+    def get_pool_stats(self):
+        """Get statistics for all sprite pools"""
+        from enemy_projectile import bomb_pool
+        from explosion import explosion_pool
+        
+        return [pool.get_stats() for pool in (bomb_pool, explosion_pool)]
+    
     def update(self, enemies_group, all_sprites_group, player_alive=True):
         """Update wave state and enemy spawning"""
         if not self.wave_active:
@@ -188,10 +277,7 @@ class WaveManager:
     
     def update_enemy_spawning(self, enemies_group, all_sprites_group):
         """Handle continuous enemy spawning for the current wave"""
-        # Dynamic max enemies based on wave number for progressive difficulty
-        base_max = 12
-        wave_bonus = min(self.current_wave - 1, 8)  # Up to +8 enemies for later waves
-        current_max_enemies = base_max + wave_bonus
+        current_max_enemies = self.get_max_enemies()
         
         # Don't spawn if too many enemies on screen
         current_enemies = len(enemies_group)
@@ -259,6 +345,8 @@ class WaveManager:
         print(f"   Duration: {self.wave_compositions[self.current_wave]['duration']} seconds")
         print(f"   Enemies spawned: {self.enemies_spawned}")
         print(f"   Enemies destroyed: {self.enemies_destroyed}")
+        for stats in self.get_pool_stats():
+            print(f"   Pool {stats['name']}: high-water {stats['high_water']} | created {stats['created']} | reused {stats['reused']}")
     
     def fail_wave(self):
         """Fail the current wave (not used in continuous mode, but kept for compatibility)"""
@@ -285,24 +373,44 @@ class WaveManager:
         return self.start_wave_intro(self.current_wave)
     
     def get_wave_info(self):
-        """Get current wave information"""
-        if self.current_wave in self.wave_compositions:
-            wave_data = self.wave_compositions[self.current_wave]
-            return {
-                'wave_number': self.current_wave,
-                'description': wave_data['description'],
-                'enemies_spawned': self.enemies_spawned,
-                'enemies_destroyed': self.enemies_destroyed,
-                'time_remaining': max(0, self.wave_timer / 60.0),
-                'wave_duration': wave_data['duration'],
-                'wave_active': self.wave_active,
-                'wave_complete': self.wave_complete,
-                'wave_failed': self.wave_failed,
-                'wave_intro_active': self.wave_intro_active,
-                'story_complete': self.story_complete,
-                'spawn_rate': f"Every {wave_data['spawn_interval']/60:.1f}s"
-            }
-        return None
+        """Get current wave information (a shared snapshot, rebuilt only when wave state changes)"""
+        if self.snapshot_version != self.version:
+            self.snapshot = self.build_snapshot()
+            self.snapshot_version = self.version
+        return self.snapshot
+    
+    def build_snapshot(self):
+        """Build a snapshot of the current wave state"""
+        if self.current_wave not in self.wave_compositions:
+            return None
+        
+        wave_data = self.wave_compositions[self.current_wave]
+        return WaveSnapshot(
+            wave_number=self.current_wave,
+            description=wave_data['description'],
+            enemies_spawned=self.enemies_spawned,
+            enemies_destroyed=self.enemies_destroyed,
+            wave_duration=wave_data['duration'],
+            wave_active=self.wave_active,
+            wave_complete=self.wave_complete,
+            wave_failed=self.wave_failed,
+            wave_intro_active=self.wave_intro_active,
+            story_complete=self.story_complete,
+            spawn_rate=self.spawn_rates[self.current_wave],
+            is_transition=self.is_transition()
+        )
+    
+    def get_time_remaining(self):
+        """Get seconds left in the current wave (read live - the timer changes every frame)"""
+        return max(0, self.wave_timer / 60.0)
+    
+    def is_transition(self):
+        """Check for the wave intro, complete or failed screens"""
+        return self.wave_intro_active or self.wave_complete or self.wave_failed
+    
+    def is_idle(self):
+        """Check that no wave is in its intro, running, complete or failed"""
+        return not (self.wave_active or self.is_transition())
     
     def get_progress_percentage(self):
         """Get wave progress as percentage (time-based)"""
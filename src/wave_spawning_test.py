@@ -53,12 +53,12 @@ def test_wave_spawning():
             if not wave_2_started and wave_info.get('wave_active', False):
                 wave_2_started = True
                 print(f"\n🌊 WAVE 2 STARTED at frame {frame_count}")
-                print(f"   Duration: {wave_info.get('time_remaining', 0):.1f}s")
+                print(f"   Duration: {game.wave_manager.get_time_remaining():.1f}s")
                 print(f"   Spawn rate: Every 1.67s (±0.83s)")
             
             if wave_2_started and wave_info.get('wave_active', False):
                 current_enemies = len(game.enemies)
-                time_remaining = wave_info.get('time_remaining', 0)
+                time_remaining = game.wave_manager.get_time_remaining()
                 
                 # Track spawning events
                 if frame_count % 60 == 0:  # Every second
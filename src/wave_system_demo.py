@@ -79,7 +79,6 @@ def demo_wave_system():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
                 elif event.key == pygame.K_e and game.player.is_alive():
                     # Secondary weapon
                     shot_data = game.player.shoot("secondary")
@@ -88,7 +87,6 @@ def demo_wave_system():
                         x, y, proj_type, direction = shot_data
                         projectile = Projectile(x, y, proj_type, direction)
                         game.projectiles.add(projectile)
-                        game.all_sprites.add(projectile)
         
         game.update()
         game.draw()
@@ -103,7 +101,7 @@ def demo_wave_system():
                 print(f"\nFrame {frame_count}:")
                 print(f"  Wave: {wave_info['wave_number']}/10 - {wave_info['description']}")
                 print(f"  Progress: {wave_info['enemies_destroyed']}/{wave_info['enemies_required']} enemies")
-                print(f"  Time: {wave_info['time_remaining']:.1f}s remaining")
+                print(f"  Time: {game.wave_manager.get_time_remaining():.1f}s remaining")
                 print(f"  Status: {'Active' if wave_info['wave_active'] else 'Complete' if wave_info['wave_complete'] else 'Failed' if wave_info['wave_failed'] else 'Waiting'}")
                 print(f"  Screenshot: {screenshot_path}")
                 